@@ -0,0 +1,115 @@
+# ai_cache.py
+# Persistent cache of AI analyses, keyed by a hash of everything that goes into the prompt
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+def hash_text(text):
+    """Short stable hash of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class AnalysisCache:
+    """
+    On-disk cache of AI analyses.
+
+    Keys are content hashes of (model, profile hash, title, company,
+    description), so the same posting seen via Greenhouse and Adzuna, or
+    reposted, is scored once. Entries remember the model and profile hash
+    they were made with; when either changes, those entries are dropped on
+    load. TTL and a max_entries cap (least recently used first) bound the file.
+    """
+
+    def __init__(self, cache_file, model_name, profile_text, ttl_days=30, max_entries=20000):
+        self.cache_file = cache_file
+        self.model_name = model_name
+        self.profile_hash = hash_text(profile_text)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.load()
+
+    def key_for(self, job):
+        """Content-addressed key for a job's prompt inputs."""
+        parts = [
+            self.model_name,
+            self.profile_hash,
+            job.get('title', ''),
+            job.get('company', ''),
+            job.get('description', '') or '',
+        ]
+        return hash_text('\x1f'.join(parts))
+
+    def load(self):
+        """Load cache from disk, dropping expired and invalidated entries."""
+        if not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Error loading AI cache: {e}")
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        self.entries = {
+            key: entry for key, entry in data.items()
+            if entry.get('model') == self.model_name
+            and entry.get('profile') == self.profile_hash
+            and entry.get('created', 0) >= cutoff
+        }
+
+        dropped = len(data) - len(self.entries)
+        print(f"📂 Loaded {len(self.entries)} cached AI analyses" + (f" ({dropped} expired/invalidated)" if dropped else ""))
+
+    def get(self, job):
+        """Cached analysis for job, or None. Counts a hit or a miss."""
+        key = self.key_for(job)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry['created'] < time.time() - self.ttl_seconds:
+                self.misses += 1
+                return None
+            entry['used'] = time.time()
+            self.hits += 1
+            return dict(entry['analysis'])
+
+    def put(self, job, analysis):
+        """Store an analysis for job."""
+        now = time.time()
+        with self.lock:
+            self.entries[self.key_for(job)] = {
+                'model': self.model_name,
+                'profile': self.profile_hash,
+                'created': now,
+                'used': now,
+                'analysis': analysis,
+            }
+
+    def save(self):
+        """Evict least recently used entries over max_entries, then persist."""
+        with self.lock:
+            if len(self.entries) > self.max_entries:
+                by_use = sorted(self.entries, key=lambda key: self.entries[key]['used'])
+                for key in by_use[:len(self.entries) - self.max_entries]:
+                    del self.entries[key]
+
+            try:
+                tmp_file = self.cache_file + ".tmp"
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.entries, f, separators=(',', ':'))
+                os.replace(tmp_file, self.cache_file)
+            except Exception as e:
+                print(f"❌ Error saving AI cache: {e}")
+
+    def report(self):
+        """Print hit/miss counters."""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0
+        print(f"🗃️  AI cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate), {len(self.entries)} entries")
@@ -3,18 +3,87 @@
 
 import google.generativeai as genai
 import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import config
+from database import get_job_id
 
 # Configure Google AI
 if config.GOOGLE_AI_KEY:
     genai.configure(api_key=config.GOOGLE_AI_KEY)
 
-def analyze_job_match(job):
+# Shared by the single-job and batch prompts
+SCORING_RUBRIC = """EVALUATION CRITERIA:
+1. Role Type Match: Does the role align with target roles (Learning Designer, Instructional Designer, Product Designer for education, etc.)?
+2. Education Focus: Is this genuinely education/learning-focused work?
+3. Mission Alignment: Does it involve underserved populations, evidence-based approaches, or inclusive design?
+4. Experience Match: Does it leverage candidate's 8+ years in teaching, EdTech, research?
+5. Skills Fit: Learning science, product thinking, user research, systematic frameworks?
+6. Career Growth: Would this be a good next step given Harvard master's program?
+
+SCORING GUIDE:
+9-10: Perfect match - dream job, apply immediately
+7-8: Strong match - high priority, apply soon
+5-6: Decent match - worth considering
+3-4: Weak match - maybe if nothing better
+0-2: Poor match - wrong role type or not education-focused
+
+IMPORTANT FILTERS:
+- EXCLUDE pure software engineering, sales, marketing (unless learning-focused)
+- INCLUDE roles that combine education + product/design/research
+- PRIORITIZE roles with impact on underserved populations
+- VALUE evidence-based, research-driven approaches"""
+
+class BatchResponseError(ValueError):
+    """Raised when a batch response can't be mapped back onto its jobs."""
+
+def is_rate_limit_error(error):
+    """True if an exception from the Gemini client means we're being throttled."""
+    return type(error).__name__ in ('ResourceExhausted', 'TooManyRequests') or '429' in str(error)
+
+class AIMDLimiter:
+    """
+    Adaptive cap on in-flight AI requests (additive increase, multiplicative
+    decrease): every success raises the limit by 1/limit, so roughly +1 per
+    window of successful calls; every rate-limit error halves it.
+    """
+
+    def __init__(self, max_limit, initial_limit=1):
+        self.max_limit = max_limit
+        self.limit = float(min(initial_limit, max_limit))
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def on_success(self):
+        with self.condition:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.condition.notify_all()
+
+    def on_rate_limit(self):
+        with self.condition:
+            self.limit = max(1.0, self.limit / 2)
+
+def analyze_job_match(job, raise_on_rate_limit=False):
     """
     Use Google AI Studio (Gemini) to analyze if job matches candidate profile.
     
     Args:
         job: Job dictionary with title, company, description, etc.
+        raise_on_rate_limit: Re-raise 429/ResourceExhausted instead of
+                             falling back to keyword matching
     
     Returns:
         Dictionary with:
@@ -52,26 +121,7 @@ SOURCE CONTEXT:
 TASK:
 Analyze if this job is a good match for this candidate.
 
-EVALUATION CRITERIA:
-1. Role Type Match: Does the role align with target roles (Learning Designer, Instructional Designer, Product Designer for education, etc.)?
-2. Education Focus: Is this genuinely education/learning-focused work?
-3. Mission Alignment: Does it involve underserved populations, evidence-based approaches, or inclusive design?
-4. Experience Match: Does it leverage candidate's 8+ years in teaching, EdTech, research?
-5. Skills Fit: Learning science, product thinking, user research, systematic frameworks?
-6. Career Growth: Would this be a good next step given Harvard master's program?
-
-SCORING GUIDE:
-9-10: Perfect match - dream job, apply immediately
-7-8: Strong match - high priority, apply soon
-5-6: Decent match - worth considering
-3-4: Weak match - maybe if nothing better
-0-2: Poor match - wrong role type or not education-focused
-
-IMPORTANT FILTERS:
-- EXCLUDE pure software engineering, sales, marketing (unless learning-focused)
-- INCLUDE roles that combine education + product/design/research
-- PRIORITIZE roles with impact on underserved populations
-- VALUE evidence-based, research-driven approaches
+{SCORING_RUBRIC}
 
 Respond ONLY with valid JSON (no markdown, no code blocks, no preamble):
 {{
@@ -84,18 +134,13 @@ Respond ONLY with valid JSON (no markdown, no code blocks, no preamble):
 }}
 """
     
+    text = ''
     try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        model = genai.GenerativeModel(config.GEMINI_MODEL)
         response = model.generate_content(prompt)
         
         # Clean response text
-        text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if text.startswith('```'):
-            text = '\n'.join(text.split('\n')[1:-1])
-        if text.startswith('json'):
-            text = text[4:].strip()
+        text = clean_response_text(response.text)
         
         # Parse JSON
         result = json.loads(text)
@@ -113,52 +158,154 @@ Respond ONLY with valid JSON (no markdown, no code blocks, no preamble):
         return fallback_keyword_match(job)
     
     except Exception as e:
+        if raise_on_rate_limit and is_rate_limit_error(e):
+            raise
         print(f"  ⚠️  AI analysis error: {e}")
         return fallback_keyword_match(job)
 
-def fallback_keyword_match(job):
+def clean_response_text(text):
+    """Strip whitespace and markdown code fences from a model response."""
+    text = text.strip()
+    
+    # Remove markdown code blocks if present
+    if text.startswith('```'):
+        text = '\n'.join(text.split('\n')[1:-1])
+    if text.startswith('json'):
+        text = text[4:].strip()
+    
+    return text
+
+def analyze_jobs_batch(jobs):
     """
-    Fallback keyword-based matching when AI is unavailable.
-    Simple but fast.
+    Score several jobs with a single Gemini request.
+    
+    The profile and rubric are sent once, followed by every job tagged with
+    its job_id; the model answers with a JSON array keyed by job_id.
+    
+    Args:
+        jobs: List of job dictionaries
+    
+    Returns:
+        List of analysis dictionaries, in the same order as jobs
+    
+    Raises:
+        json.JSONDecodeError / BatchResponseError if the response is unusable
     """
-    title = job.get('title', '').lower()
-    description = job.get('description', '').lower()
-    combined = title + ' ' + description
+    job_ids = [get_job_id(job) for job in jobs]
     
-    # Check for role type matches
-    role_matches = 0
-    matched_role = "other"
-    
-    role_keywords = {
-        'learning_design': ['learning designer', 'learning design', 'learning experience'],
-        'instructional_design': ['instructional designer', 'instructional design', 'curriculum'],
-        'product_design': ['product designer', 'product design', 'ux design'],
-        'user_research': ['user researcher', 'ux researcher', 'user research'],
-        'program_mgmt': ['program manager', 'program management', 'partnership manager'],
-        'edtech': ['educational technologist', 'edtech', 'education technology'],
-        'consultant': ['consultant', 'consulting']
-    }
+    jobs_text = "\n".join(f"""
+--- JOB job_id={job_id} ---
+Title: {job.get('title', 'No title')}
+Company: {job.get('company', 'Unknown')}
+Location: {job.get('location', 'Unknown')}
+Source: {job.get('source', 'Unknown')} / {job.get('search_category', 'General')}
+Description: {job.get('description', 'No description')[:2000]}""" for job_id, job in zip(job_ids, jobs))
+    
+    prompt = f"""
+You are analyzing if each of several jobs matches a candidate's profile for job search.
+Evaluate every job independently.
+
+CANDIDATE PROFILE:
+{config.YOUR_PROFILE}
+
+{SCORING_RUBRIC}
+
+JOBS TO ANALYZE ({len(jobs)}):
+{jobs_text}
+
+Respond ONLY with a valid JSON array (no markdown, no code blocks, no preamble),
+one object per job, using the job_id given above:
+[
+    {{
+        "job_id": "<job_id>",
+        "is_match": true/false,
+        "score": 0-10,
+        "reasoning": "2-3 sentence explanation of why this is/isn't a match",
+        "role_category": "learning_design|instructional_design|product_design|user_research|program_mgmt|edtech|consultant|other",
+        "key_strengths": ["strength1", "strength2"],
+        "concerns": ["concern1", "concern2"]
+    }}
+]
+"""
     
-    for role_type, keywords in role_keywords.items():
-        if any(keyword in combined for keyword in keywords):
-            role_matches += 1
-            matched_role = role_type
+    model = genai.GenerativeModel(config.GEMINI_MODEL)
+    response = model.generate_content(prompt)
     
-    # Check for exclude keywords
-    for exclude in config.EXCLUDE_KEYWORDS:
-        if exclude.lower() in title:
-            return {
-                'is_match': False,
-                'score': 0,
-                'reasoning': f"Excluded role type: {exclude}",
-                'role_category': 'excluded',
-                'key_strengths': [],
-                'concerns': ['Not target role type']
-            }
+    results = json.loads(clean_response_text(response.text))
+    if not isinstance(results, list):
+        raise BatchResponseError("Batch response is not a JSON array")
     
-    # Check for education focus
-    edu_keywords = ['education', 'learning', 'teaching', 'student', 'school', 'university', 'edtech']
-    edu_match = any(keyword in combined for keyword in edu_keywords)
+    by_id = {str(result.get('job_id')): result for result in results if isinstance(result, dict)}
+    
+    required_fields = ['is_match', 'score', 'reasoning', 'role_category']
+    analyses = []
+    for job_id in job_ids:
+        result = by_id.get(job_id)
+        if result is None or not all(field in result for field in required_fields):
+            raise BatchResponseError(f"Missing or incomplete result for job {job_id}")
+        result.pop('job_id', None)
+        analyses.append(result)
+    
+    return analyses
+
+def score_batch(jobs, raise_on_rate_limit=False):
+    """
+    Score a batch of jobs, splitting it in half and retrying whenever the
+    model returns malformed JSON. Single jobs go through analyze_job_match.
+    
+    Returns:
+        List of analysis dictionaries, in the same order as jobs
+    """
+    if len(jobs) == 1:
+        return [analyze_job_match(jobs[0], raise_on_rate_limit)]
+    
+    try:
+        return analyze_jobs_batch(jobs)
+    
+    except (json.JSONDecodeError, BatchResponseError) as e:
+        print(f"  ⚠️  Batch of {len(jobs)} unusable ({e}), splitting")
+        middle = len(jobs) // 2
+        return (score_batch(jobs[:middle], raise_on_rate_limit) +
+                score_batch(jobs[middle:], raise_on_rate_limit))
+    
+    except Exception as e:
+        if raise_on_rate_limit and is_rate_limit_error(e):
+            raise
+        print(f"  ⚠️  AI batch analysis error: {e}")
+        return [fallback_keyword_match(job) for job in jobs]
+
+# Keyword tables shared by fallback_keyword_match and the compiled pre-filter
+ROLE_KEYWORDS = {
+    'learning_design': ['learning designer', 'learning design', 'learning experience'],
+    'instructional_design': ['instructional designer', 'instructional design', 'curriculum'],
+    'product_design': ['product designer', 'product design', 'ux design'],
+    'user_research': ['user researcher', 'ux researcher', 'user research'],
+    'program_mgmt': ['program manager', 'program management', 'partnership manager'],
+    'edtech': ['educational technologist', 'edtech', 'education technology'],
+    'consultant': ['consultant', 'consulting']
+}
+
+EDU_KEYWORDS = ['education', 'learning', 'teaching', 'student', 'school', 'university', 'edtech']
+
+# Each group is worth one bonus point
+BONUS_KEYWORDS = [
+    ['ai', 'artificial intelligence'],
+    ['underserved', 'equity', 'inclusive'],
+    ['research', 'evidence'],
+]
+
+def build_keyword_analysis(matched_roles, exclude, edu_match, bonus_points):
+    """
+    Turn keyword features into an analysis dictionary (same shape as the AI's).
+    
+    Args:
+        matched_roles: Role types whose keywords matched, in ROLE_KEYWORDS order
+        exclude: First EXCLUDE_KEYWORDS entry found in the title, or None
+        edu_match: Whether any education keyword matched
+        bonus_points: Number of BONUS_KEYWORDS groups that matched
+    """
+    role_matches = len(matched_roles)
+    matched_role = matched_roles[-1] if matched_roles else None
     
     # Calculate score
     score = 0
@@ -166,33 +313,360 @@ def fallback_keyword_match(job):
         score += 4
     if edu_match:
         score += 3
+    score += bonus_points
     
-    # Bonus points
-    if 'ai' in combined or 'artificial intelligence' in combined:
-        score += 1
-    if 'underserved' in combined or 'equity' in combined or 'inclusive' in combined:
-        score += 1
-    if 'research' in combined or 'evidence' in combined:
-        score += 1
+    return keyword_analysis_dict(matched_role, exclude, edu_match, min(score, 10))
+
+def keyword_analysis_dict(matched_role, exclude, edu_match, score):
+    """
+    Analysis dictionary for an already-computed keyword score.
+    matched_role is the last matching role type, or None.
+    """
+    if exclude is not None:
+        return {
+            'is_match': False,
+            'score': 0,
+            'reasoning': f"Excluded role type: {exclude}",
+            'role_category': 'excluded',
+            'key_strengths': [],
+            'concerns': ['Not target role type'],
+            'fallback': True
+        }
     
     is_match = score >= 5
+    role_match = matched_role is not None
     
     return {
         'is_match': is_match,
-        'score': min(score, 10),
-        'reasoning': f"Keyword match: role={role_matches>0}, education={edu_match}",
-        'role_category': matched_role,
-        'key_strengths': ['Role type match'] if role_matches > 0 else [],
-        'concerns': [] if is_match else ['Weak keyword match']
+        'score': score,
+        'reasoning': f"Keyword match: role={role_match}, education={edu_match}",
+        'role_category': matched_role or "other",
+        'key_strengths': ['Role type match'] if role_match else [],
+        'concerns': [] if is_match else ['Weak keyword match'],
+        'fallback': True
     }
 
-def filter_jobs(jobs, min_score=6):
+def fallback_keyword_match(job):
+    """
+    Fallback keyword-based matching when AI is unavailable.
+    Simple but fast.
+    """
+    title = job.get('title', '').lower()
+    description = job.get('description', '').lower()
+    combined = title + ' ' + description
+    
+    # Check for role type matches
+    matched_roles = [
+        role_type for role_type, keywords in ROLE_KEYWORDS.items()
+        if any(keyword in combined for keyword in keywords)
+    ]
+    
+    # Check for exclude keywords
+    exclude = next((exclude for exclude in config.EXCLUDE_KEYWORDS if exclude.lower() in title), None)
+    
+    # Check for education focus
+    edu_match = any(keyword in combined for keyword in EDU_KEYWORDS)
+    
+    # Bonus points
+    bonus_points = sum(1 for group in BONUS_KEYWORDS if any(keyword in combined for keyword in group))
+    
+    return build_keyword_analysis(matched_roles, exclude, edu_match, bonus_points)
+
+class KeywordMatcher:
+    """
+    Every keyword from the tables above compiled into one regex, so a job's
+    text is scanned once instead of once per keyword.
+    
+    The pattern is a lookahead alternation tried at every position (longest
+    keyword first), which also finds overlapping matches; keywords that are
+    prefixes of the one matched at a position are added from a lookup table.
+    """
+    
+    def __init__(self, exclude_keywords=None):
+        if exclude_keywords is None:
+            exclude_keywords = config.EXCLUDE_KEYWORDS
+        
+        # keyword -> list of (kind, value) it contributes to
+        self.features = {}
+        for role_type, keywords in ROLE_KEYWORDS.items():
+            for keyword in keywords:
+                self.features.setdefault(keyword, []).append(('role', role_type))
+        for keyword in EDU_KEYWORDS:
+            self.features.setdefault(keyword, []).append(('edu', True))
+        for i, group in enumerate(BONUS_KEYWORDS):
+            for keyword in group:
+                self.features.setdefault(keyword, []).append(('bonus', i))
+        for exclude in exclude_keywords:
+            self.features.setdefault(exclude.lower(), []).append(('exclude', exclude))
+        
+        self.exclude_order = {exclude: i for i, exclude in enumerate(exclude_keywords)}
+        self.role_order = {role_type: i for i, role_type in enumerate(ROLE_KEYWORDS)}
+        
+        ordered = sorted(self.features, key=len, reverse=True)
+        self.keywords = ordered
+        self.keyword_index = {keyword: i for i, keyword in enumerate(ordered)}
+        self.pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in ordered) + '))')
+        self.prefixes = {
+            keyword: [other for other in ordered if keyword.startswith(other)]
+            for keyword in ordered
+        }
+    
+    def scan(self, job):
+        """
+        Yield (keyword, in_title) for every keyword occurrence in the job's
+        lowercased title + description.
+        """
+        title = job.get('title', '').lower()
+        description = job.get('description', '').lower()
+        combined = title + ' ' + description
+        title_end = len(title)
+        
+        for found in self.pattern.finditer(combined):
+            start = found.start()
+            for keyword in self.prefixes[found.group(1)]:
+                yield keyword, start + len(keyword) <= title_end
+    
+    def match(self, job):
+        """Keyword analysis for one job; identical to fallback_keyword_match."""
+        roles = set()
+        excludes = []
+        edu_match = False
+        bonus_groups = set()
+        
+        for keyword, in_title in self.scan(job):
+            for kind, value in self.features[keyword]:
+                if kind == 'role':
+                    roles.add(value)
+                elif kind == 'edu':
+                    edu_match = True
+                elif kind == 'bonus':
+                    bonus_groups.add(value)
+                elif in_title:
+                    excludes.append(value)
+        
+        matched_roles = sorted(roles, key=self.role_order.get)
+        exclude = min(excludes, key=self.exclude_order.get) if excludes else None
+        
+        return build_keyword_analysis(matched_roles, exclude, edu_match, len(bonus_groups))
+
+def prefilter_jobs(jobs, reject_below=3, accept_at=None, matcher=None):
+    """
+    Cheap keyword pre-filter that runs before any model call.
+    
+    Every job gets a keyword analysis. Excluded titles and scores below
+    reject_below are decided without the AI; so are scores at or above
+    accept_at (if set). Everything else is sent on to the AI.
+    
+    Args:
+        jobs: List of job dictionaries
+        reject_below: Keyword score under which a job is auto-rejected
+        accept_at: Keyword score at which a job is auto-accepted (None = never)
+        matcher: Optional prebuilt KeywordMatcher
+    
+    Returns:
+        (to_score, decided): jobs still needing the AI, and a dict of
+        index -> keyword analysis for jobs decided here
+    """
+    matcher = matcher or KeywordMatcher()
+    
+    to_score = []
+    decided = {}
+    rejected = accepted = 0
+    
+    for i, job in enumerate(jobs):
+        analysis = matcher.match(job)
+        
+        if analysis['role_category'] == 'excluded' or analysis['score'] < reject_below:
+            decided[i] = analysis
+            rejected += 1
+        elif accept_at is not None and analysis['score'] >= accept_at:
+            decided[i] = analysis
+            accepted += 1
+        else:
+            to_score.append(job)
+    
+    print(f"  🔎 Pre-filter: {rejected} auto-rejected, {accepted} auto-accepted, "
+          f"{len(to_score)} sent to AI (saved {len(decided)} AI analyses)")
+    
+    return to_score, decided
+
+def score_concurrently(batches, max_in_flight, max_retries=5, backoff=2.0):
+    """
+    Score batches of jobs on a thread pool whose effective concurrency is
+    steered by an AIMDLimiter: it backs off when Gemini returns 429 and
+    ramps back up as calls succeed.
+    
+    Args:
+        batches: List of job lists (single-job lists for unbatched scoring)
+        max_in_flight: Upper bound on concurrent AI requests
+        max_retries: Rate-limit retries per batch before keyword fallback
+        backoff: Base delay in seconds (doubles on each retry)
+    
+    Returns:
+        List of analysis dictionaries, in the same order as the input jobs
+    """
+    limiter = AIMDLimiter(max_in_flight, initial_limit=max(1, max_in_flight // 2))
+    
+    def score(batch):
+        return score_with_retries(batch, limiter, max_retries, backoff)
+    
+    analyses = []
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        # map() yields results in submission order
+        for batch_analyses in executor.map(score, batches):
+            analyses.extend(batch_analyses)
+            print(f"  Progress: {len(analyses)}/{sum(len(batch) for batch in batches)}")
+    
+    return analyses
+
+def score_with_retries(batch, limiter, max_retries=5, backoff=2.0):
+    """
+    Score one batch through a shared AIMDLimiter, backing off and retrying
+    while Gemini rate-limits us.
+    
+    Args:
+        batch: List of jobs
+        limiter: AIMDLimiter shared by everything scoring concurrently
+        max_retries: Rate-limit retries before keyword fallback
+        backoff: Base delay in seconds (doubles on each retry)
+    
+    Returns:
+        List of analysis dictionaries, in the same order as batch
+    """
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            analyses = score_batch(batch, raise_on_rate_limit=True)
+            limiter.on_success()
+            return analyses
+        except Exception as e:
+            if not is_rate_limit_error(e):
+                raise
+            limiter.on_rate_limit()
+        finally:
+            limiter.release()
+        
+        delay = backoff * (2 ** attempt)
+        print(f"  ⏳ Rate limited, retrying in {delay:.0f}s (limit now {int(limiter.limit)})")
+        time.sleep(delay)
+    
+    print(f"  ⚠️  Still rate limited after {max_retries} retries, using keyword match")
+    return [fallback_keyword_match(job) for job in batch]
+
+def low_similarity_analysis(job, similarity):
+    """Analysis for a job the semantic ranker kept away from the AI."""
+    analysis = fallback_keyword_match(job)
+    analysis.update({
+        'is_match': False,
+        'reasoning': f"Low semantic similarity to profile ({similarity:.2f})",
+        'concerns': ['Low semantic similarity to profile'],
+    })
+    return analysis
+
+def score_jobs(jobs, batch_size=1, max_in_flight=1):
+    """
+    Run AI analysis on every job.
+    
+    Returns:
+        List of analysis dictionaries, in the same order as jobs
+    """
+    if max_in_flight > 1 and config.GOOGLE_AI_KEY:
+        size = max(1, batch_size)
+        batches = [jobs[start:start + size] for start in range(0, len(jobs), size)]
+        return score_concurrently(batches, max_in_flight)
+    
+    analyses = []
+    
+    if batch_size > 1 and config.GOOGLE_AI_KEY:
+        for start in range(0, len(jobs), batch_size):
+            analyses.extend(score_batch(jobs[start:start + batch_size]))
+            print(f"  Progress: {len(analyses)}/{len(jobs)}")
+    else:
+        for i, job in enumerate(jobs, 1):
+            if i % 10 == 0:
+                print(f"  Progress: {i}/{len(jobs)}")
+            
+            # Run AI analysis
+            analyses.append(analyze_job_match(job))
+    
+    return analyses
+
+def triage_jobs(jobs, cache=None, prefilter=False, ranker=None):
+    """
+    Decide whatever can be decided without calling the AI: pre-filter
+    verdicts first, then low semantic similarity, then cache hits.
+    
+    Args:
+        jobs: List of job dictionaries
+        cache: Optional AnalysisCache
+        prefilter: Run the compiled keyword pre-filter
+        ranker: Optional SemanticRanker
+    
+    Returns:
+        Dictionary of job index -> analysis, for the jobs that were decided
+    """
+    cached = {}
+    if prefilter:
+        _, cached = prefilter_jobs(
+            jobs,
+            reject_below=config.PREFILTER_REJECT_BELOW,
+            accept_at=config.PREFILTER_ACCEPT_AT
+        )
+    
+    if ranker is not None:
+        undecided = [i for i in range(len(jobs)) if i not in cached]
+        keep, similarities = ranker.select(
+            [jobs[i] for i in undecided],
+            config.YOUR_PROFILE,
+            top_k=config.SEMANTIC_TOP_K,
+            min_similarity=config.SEMANTIC_MIN_SIMILARITY
+        )
+        for i, kept, similarity in zip(undecided, keep, similarities):
+            if not kept:
+                cached[i] = low_similarity_analysis(jobs[i], similarity)
+        print(f"  🧭 Semantic ranking: {int(keep.sum())} of {len(undecided)} jobs sent on to AI")
+    
+    if cache is not None:
+        hits = 0
+        for i, job in enumerate(jobs):
+            if i in cached:
+                continue
+            analysis = cache.get(job)
+            if analysis is not None:
+                cached[i] = analysis
+                hits += 1
+        if hits:
+            print(f"  🗃️  {hits} analyses served from cache")
+    
+    return cached
+
+def apply_analysis(job, analysis, min_score):
+    """
+    Attach an analysis to its job.
+    
+    Returns:
+        True if the job matches at min_score or above
+    """
+    job['ai_analysis'] = analysis
+    job['match_score'] = analysis['score']
+    return analysis['is_match'] and analysis['score'] >= min_score
+
+def filter_jobs(jobs, min_score=6, batch_size=1, max_in_flight=1, cache=None, prefilter=False,
+                ranker=None):
     """
     Filter list of jobs using AI analysis.
     
     Args:
         jobs: List of job dictionaries
         min_score: Minimum score to keep (default 6)
+        batch_size: Jobs packed into each AI request (1 = one prompt per job)
+        max_in_flight: Max concurrent AI requests (1 = score serially)
+        cache: Optional AnalysisCache; hits skip the AI call entirely
+        prefilter: Decide obvious rejects (and, optionally, accepts) with the
+                   compiled keyword matcher before calling the AI; score bands
+                   come from config.PREFILTER_REJECT_BELOW / PREFILTER_ACCEPT_AT
+        ranker: Optional SemanticRanker; only jobs within config.SEMANTIC_TOP_K
+                and above config.SEMANTIC_MIN_SIMILARITY go on to the AI
     
     Returns:
         List of jobs that match, with analysis added to each job
@@ -201,19 +675,36 @@ def filter_jobs(jobs, min_score=6):
     
     matched_jobs = []
     
-    for i, job in enumerate(jobs, 1):
-        if i % 10 == 0:
-            print(f"  Progress: {i}/{len(jobs)}")
-        
-        # Run AI analysis
-        analysis = analyze_job_match(job)
-        
-        # Add analysis to job
-        job['ai_analysis'] = analysis
-        job['match_score'] = analysis['score']
+    # Known results by job index: pre-filter decisions first, then cache hits
+    cached = triage_jobs(jobs, cache, prefilter, ranker)
+    
+    # Identical postings within this call (e.g. reposts) are scored once
+    to_score = []
+    first_index = {}
+    for i, job in enumerate(jobs):
+        if i in cached:
+            continue
+        key = cache.key_for(job) if cache is not None else i
+        if key not in first_index:
+            first_index[key] = len(to_score)
+            to_score.append(job)
+    
+    scored = score_jobs(to_score, batch_size, max_in_flight)
+    
+    for job, analysis in zip(to_score, scored):
+        # Keyword fallbacks are cheap to redo and shouldn't mask a real AI score later
+        if cache is not None and not analysis.get('fallback'):
+            cache.put(job, analysis)
+    
+    for i, job in enumerate(jobs):
+        if i in cached:
+            analysis = cached[i]
+        else:
+            key = cache.key_for(job) if cache is not None else i
+            analysis = dict(scored[first_index[key]])
         
-        # Keep if matches threshold
-        if analysis['is_match'] and analysis['score'] >= min_score:
+        # Add analysis to job, keep if it matches the threshold
+        if apply_analysis(job, analysis, min_score):
             matched_jobs.append(job)
     
     print(f"✅ AI filtering complete: {len(matched_jobs)} matches")
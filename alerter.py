@@ -1,22 +1,172 @@
 # alerter.py
 # Send email alerts for new job matches
 
-from sendgrid import SendGridAPIClient
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
 from sendgrid.helpers.mail import Mail
 import config
 from datetime import datetime
 
-def send_immediate_alert(job):
+class AlertDispatcher:
+    """
+    Sends alert emails off the scoring path.
+    
+    One requests.Session (a keep-alive connection pool) posts to SendGrid's
+    v3 mail endpoint. Immediate alerts handed to enqueue() go out on a small
+    thread pool while scoring carries on, or, with batch=True, are held and
+    sent as a single multi-job email by flush(). Throttling (429), 5xx and
+    network errors are retried with exponential backoff.
+    """
+    
+    def __init__(self, api_key=None, host=None, max_workers=4, batch=False,
+                 max_retries=3, backoff=1.0, timeout=10):
+        self.api_key = config.SENDGRID_API_KEY if api_key is None else api_key
+        self.url = f"{(host or config.SENDGRID_HOST).rstrip('/')}/v3/mail/send"
+        self.enabled = bool(self.api_key and config.EMAIL_TO)
+        self.batch = batch
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Authorization'] = f"Bearer {self.api_key}"
+        
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pending = []  # Futures of alerts being sent
+        self.held = []     # Jobs waiting for the multi-job alert (batch mode)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def send(self, subject, html_content):
+        """
+        Send one email, retrying throttling and transient errors.
+        
+        Args:
+            subject: Email subject
+            html_content: Email body (HTML)
+        
+        Raises:
+            requests.RequestException: If SendGrid still refuses it after all retries
+        """
+        message = Mail(
+            from_email=config.EMAIL_FROM,
+            to_emails=config.EMAIL_TO,
+            subject=subject,
+            html_content=html_content
+        )
+        payload = message.get()
+        
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                response = self.session.post(self.url, json=payload, timeout=self.timeout)
+                if response.status_code != 429 and response.status_code < 500:
+                    response.raise_for_status()
+                    return
+                error = requests.HTTPError(f"{response.status_code} from SendGrid", response=response)
+                retry_after = response.headers.get('Retry-After')
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            
+            if attempt == self.max_retries:
+                raise error
+            
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else self.backoff * (2 ** attempt)
+            print(f"  ⏳ Email not sent ({error}), retrying in {delay:.0f}s")
+            time.sleep(delay)
+    
+    def enqueue(self, job):
+        """
+        Queue an immediate alert for a high-priority job. Returns at once.
+        
+        Args:
+            job: Job dictionary with AI analysis
+        """
+        if not self.enabled:
+            print("  ⚠️  Email not configured, skipping alert")
+            return
+        
+        if self.batch:
+            self.held.append(job)
+            return
+        
+        label = f"{job.get('title')} ({job.get('ai_analysis', {}).get('score', 0)}/10)"
+        self.pending.append(self.executor.submit(self._send_alert, render_immediate_alert, job, label))
+    
+    def _send_alert(self, render, content, label):
+        # Rendering happens here too, so a bad job fails its own future only
+        subject, html_content = render(content)
+        try:
+            self.send(subject, html_content)
+            print(f"  ✓ Immediate alert sent: {label}")
+            return True
+        except requests.RequestException as e:
+            print(f"  ❌ Error sending immediate alert: {e}")
+            return False
+    
+    def flush(self):
+        """
+        Send any held alerts and wait for queued ones to finish.
+        
+        Returns:
+            Number of alert emails sent
+        """
+        if self.held:
+            jobs, self.held = self.held, []
+            self.pending.append(self.executor.submit(
+                self._send_alert, render_combined_alert, jobs, f"{len(jobs)} high-priority jobs in one email"
+            ))
+        
+        pending, self.pending = self.pending, []
+        sent = 0
+        for future in pending:
+            try:
+                sent += future.result()
+            except Exception as e:
+                # e.g. a job missing a field the email needs; the digest still goes out
+                print(f"  ❌ Error sending immediate alert: {e}")
+        return sent
+    
+    def close(self):
+        """Flush, then release the worker threads and connections."""
+        self.flush()
+        self.executor.shutdown()
+        self.session.close()
+
+def send_immediate_alert(job, dispatcher=None):
     """
     Send immediate alert for high-priority job (score 8+).
     
     Args:
         job: Job dictionary with AI analysis
+        dispatcher: AlertDispatcher to queue the alert on (None = send it now)
     """
-    if not config.SENDGRID_API_KEY or not config.EMAIL_TO:
-        print("  ⚠️  Email not configured, skipping alert")
+    if dispatcher is not None:
+        dispatcher.enqueue(job)
         return
     
+    with AlertDispatcher(max_workers=1) as dispatcher:
+        dispatcher.enqueue(job)
+
+def render_immediate_alert(job):
+    """
+    Build the immediate alert email for one job.
+    
+    Args:
+        job: Job dictionary with AI analysis
+    
+    Returns:
+        (subject, html_content)
+    """
     analysis = job.get('ai_analysis', {})
     score = analysis.get('score', 0)
     
@@ -61,30 +211,56 @@ def send_immediate_alert(job):
     </html>
     """
     
-    try:
-        message = Mail(
-            from_email=config.EMAIL_FROM,
-            to_emails=config.EMAIL_TO,
-            subject=subject,
-            html_content=html_content
-        )
-        
-        sg = SendGridAPIClient(config.SENDGRID_API_KEY)
-        response = sg.send(message)
-        
-        print(f"  ✓ Immediate alert sent: {job['title']} ({score}/10)")
+    return subject, html_content
+
+def render_combined_alert(jobs):
+    """
+    Build one alert email listing several high-priority jobs.
+    
+    Args:
+        jobs: Job dictionaries with AI analysis
+    
+    Returns:
+        (subject, html_content)
+    """
+    jobs = sorted(jobs, key=lambda x: x.get('match_score', 0), reverse=True)
+    
+    subject = f"🔥 {len(jobs)} High Match Jobs (top score {jobs[0].get('match_score', 0)}/10)"
+    
+    jobs_html = "".join(render_job_summary(job) for job in jobs)
+    
+    html_content = f"""
+    <html>
+    <body style="font-family: Arial, sans-serif; max-width: 700px; margin: 0 auto;">
+        <div style="background-color: #f44336; color: white; padding: 20px; text-align: center;">
+            <h1 style="margin: 0;">🔥 High Priority Matches</h1>
+            <p style="margin: 5px 0; font-size: 18px; font-weight: bold;">{len(jobs)} jobs scored {config.IMMEDIATE_ALERT_THRESHOLD}+</p>
+            <p style="margin: 5px 0;">{datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+        </div>
         
-    except Exception as e:
-        print(f"  ❌ Error sending immediate alert: {e}")
+        <div style="padding: 20px;">
+            {jobs_html}
+            
+            <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; font-size: 12px; color: #888;">
+                <p>This is an automated alert from your job monitoring system.</p>
+                <p>Jobs with score {config.IMMEDIATE_ALERT_THRESHOLD}+ from this run, in one email.</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    
+    return subject, html_content
 
-def send_daily_digest(matched_jobs, geography_checked=None):
+def send_daily_digest(matched_jobs, geography_checked=None, dispatcher=None):
     """
     Send daily digest email with all matches.
     
     Args:
         matched_jobs: Dictionary with categories of jobs
                       e.g., {'greenhouse': [...], 'api_searches': [...]}
-        geography_checked: Which geography was checked today (USA, Singapore, Dubai)
+        geography_checked: Geographies searched today (e.g. "USA, Dubai")
+        dispatcher: AlertDispatcher whose connection to reuse (None = a one-off one)
     """
     if not config.SENDGRID_API_KEY or not config.EMAIL_TO:
         print("  ⚠️  Email not configured, skipping digest")
@@ -109,46 +285,7 @@ def send_daily_digest(matched_jobs, geography_checked=None):
     subject = f"Daily Job Digest - {len(all_jobs)} new matches"
     
     # Build job list HTML
-    jobs_html = ""
-    
-    for job in all_jobs:
-        analysis = job.get('ai_analysis', {})
-        score = job.get('match_score', 0)
-        
-        # Color code by score
-        if score >= 8:
-            badge_color = "#f44336"  # Red
-            emoji = "🔥"
-        elif score >= 7:
-            badge_color = "#FF9800"  # Orange
-            emoji = "⚡"
-        else:
-            badge_color = "#4CAF50"  # Green
-            emoji = "✓"
-        
-        jobs_html += f"""
-        <div style="margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <h3 style="margin: 0; color: #333;">{emoji} {job['title']}</h3>
-                <div style="background-color: {badge_color}; color: white; padding: 5px 10px; border-radius: 3px; font-weight: bold;">
-                    {score}/10
-                </div>
-            </div>
-            <p style="margin: 5px 0; color: #666; font-size: 16px;">{job['company']} • {job['location']}</p>
-            <p style="margin: 10px 0; color: #555; font-size: 14px;">{analysis.get('reasoning', '')}</p>
-            <div style="margin: 10px 0;">
-                <span style="display: inline-block; background-color: #f0f0f0; padding: 4px 8px; margin-right: 5px; border-radius: 3px; font-size: 12px;">
-                    {analysis.get('role_category', 'N/A').replace('_', ' ').title()}
-                </span>
-                <span style="display: inline-block; background-color: #f0f0f0; padding: 4px 8px; margin-right: 5px; border-radius: 3px; font-size: 12px;">
-                    {job.get('source', 'Unknown')}
-                </span>
-            </div>
-            <a href="{job['url']}" style="color: #4CAF50; text-decoration: none; font-weight: bold;">
-                View Job →
-            </a>
-        </div>
-        """
+    jobs_html = "".join(render_job_summary(job) for job in all_jobs)
     
     html_content = f"""
     <html>
@@ -187,21 +324,65 @@ def send_daily_digest(matched_jobs, geography_checked=None):
     """
     
     try:
-        message = Mail(
-            from_email=config.EMAIL_FROM,
-            to_emails=config.EMAIL_TO,
-            subject=subject,
-            html_content=html_content
-        )
-        
-        sg = SendGridAPIClient(config.SENDGRID_API_KEY)
-        response = sg.send(message)
+        if dispatcher is not None:
+            dispatcher.send(subject, html_content)
+        else:
+            with AlertDispatcher(max_workers=1) as one_off:
+                one_off.send(subject, html_content)
         
         print(f"✅ Daily digest sent: {len(all_jobs)} jobs")
         
     except Exception as e:
         print(f"❌ Error sending digest: {e}")
 
+def render_job_summary(job):
+    """
+    HTML block for one job in a multi-job email (daily digest, combined alert).
+    
+    Args:
+        job: Job dictionary with AI analysis
+    
+    Returns:
+        HTML string
+    """
+    analysis = job.get('ai_analysis', {})
+    score = job.get('match_score', 0)
+    
+    # Color code by score
+    if score >= 8:
+        badge_color = "#f44336"  # Red
+        emoji = "🔥"
+    elif score >= 7:
+        badge_color = "#FF9800"  # Orange
+        emoji = "⚡"
+    else:
+        badge_color = "#4CAF50"  # Green
+        emoji = "✓"
+    
+    return f"""
+    <div style="margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <h3 style="margin: 0; color: #333;">{emoji} {job['title']}</h3>
+            <div style="background-color: {badge_color}; color: white; padding: 5px 10px; border-radius: 3px; font-weight: bold;">
+                {score}/10
+            </div>
+        </div>
+        <p style="margin: 5px 0; color: #666; font-size: 16px;">{job['company']} • {job['location']}</p>
+        <p style="margin: 10px 0; color: #555; font-size: 14px;">{analysis.get('reasoning', '')}</p>
+        <div style="margin: 10px 0;">
+            <span style="display: inline-block; background-color: #f0f0f0; padding: 4px 8px; margin-right: 5px; border-radius: 3px; font-size: 12px;">
+                {analysis.get('role_category', 'N/A').replace('_', ' ').title()}
+            </span>
+            <span style="display: inline-block; background-color: #f0f0f0; padding: 4px 8px; margin-right: 5px; border-radius: 3px; font-size: 12px;">
+                {job.get('source', 'Unknown')}
+            </span>
+        </div>
+        <a href="{job['url']}" style="color: #4CAF50; text-decoration: none; font-weight: bold;">
+            View Job →
+        </a>
+    </div>
+    """
+
 if __name__ == "__main__":
     # Test email sending (requires valid credentials)
     print("Testing email alerts...")
@@ -0,0 +1,100 @@
+# benchmarks/adzuna_fanout.py
+# One geography's Adzuna queries against a local stub API: a bare requests.get
+# per query, one after another (the old way) vs the pooled session, fanned out
+#
+# Usage: python benchmarks/adzuna_fanout.py
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+import config
+from scrapers import adzuna
+
+LATENCY = 0.3  # Simulated Adzuna round trip (seconds)
+
+class StubAdzunaHandler(BaseHTTPRequestHandler):
+    """Answers /{country}/search/1 with 50 results, like the real API."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # no delayed-ACK stalls on reused connections
+    lock = threading.Lock()
+    connections = set()
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        with self.lock:
+            self.connections.add(self.client_address)
+        body = json.dumps({'results': [
+            {'title': f"Learning Designer {i}", 'company': {'display_name': 'Coursera'},
+             'location': {'display_name': 'Remote'}, 'redirect_url': f"https://example.com{self.path}/{i}",
+             'description': 'Design learning experiences', 'created': '2026-10-01T00:00:00Z'}
+            for i in range(50)
+        ]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def old_way(queries, api_url):
+    """What search_geography_all_queries used to do: bare requests.get, in order."""
+    for query, _ in queries:
+        requests.get(f"{api_url}/us/search/1", params={'what': query}, timeout=10).json()
+
+def timed(label, run):
+    StubAdzunaHandler.connections = set()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()
+    elapsed = time.perf_counter() - start
+    return label, elapsed, len(StubAdzunaHandler.connections)
+
+def main():
+    config.ADZUNA_APP_ID = config.ADZUNA_APP_ID or 'test-id'
+    config.ADZUNA_APP_KEY = config.ADZUNA_APP_KEY or 'test-key'
+    queries = config.get_search_queries_for_geography('USA')
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubAdzunaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def fanned_out(max_workers, budget=None, cache=None):
+        return lambda: list(adzuna.iter_geography_queries('USA', queries, max_workers, budget, api_url, cache))
+
+    budget = adzuna.CallBudget(5)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = adzuna.ResponseCache(os.path.join(tmp, 'adzuna_cache.json'))
+        results = [
+            timed("requests.get per query, sequential", lambda: old_way(queries, api_url)),
+            timed("shared session, sequential", fanned_out(1)),
+            timed(f"shared session, {config.ADZUNA_MAX_WORKERS} workers", fanned_out(config.ADZUNA_MAX_WORKERS)),
+            timed("shared session, 8 workers", fanned_out(8)),
+            timed("8 workers, budget of 5 calls", fanned_out(8, budget)),
+            timed("8 workers, filling the response cache", fanned_out(8, cache=cache)),
+            timed("8 workers, answered from the cache", fanned_out(8, cache=cache)),
+        ]
+    assert budget.used == 5 and budget.refused == len(queries) - 5
+
+    server.shutdown()
+
+    baseline = results[0][1]
+    print(f"\n{len(queries)} queries, {LATENCY*1000:.0f} ms simulated latency")
+    for label, elapsed, connections in results:
+        print(f"  {label:38s} {elapsed:5.2f}s  {connections} connections  {baseline/elapsed:4.1f}x")
+
+if __name__ == "__main__":
+    main()
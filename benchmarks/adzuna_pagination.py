@@ -0,0 +1,101 @@
+# benchmarks/adzuna_pagination.py
+# Simulated week of one Adzuna query against a local stub feed: page 1 only
+# (the old way) vs pagination back to the last complete search
+#
+# Usage: python benchmarks/adzuna_pagination.py
+
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from scrapers import adzuna
+
+# New postings per day: a busy Monday after a quiet weekend, then ordinary days
+DAILY_NEW = [400, 140, 60, 15, 5, 3, 220]
+
+class StubFeedHandler(BaseHTTPRequestHandler):
+    """Serves FEED (newest first) page by page, like /{country}/search/{page}."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    feed = []  # (posting id, created datetime), newest first
+    calls = 0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        page = int(url.path.rsplit('/', 1)[1])
+        per_page = int(parse_qs(url.query)['results_per_page'][0])
+        type(self).calls += 1
+        window = self.feed[(page - 1) * per_page:page * per_page]
+        body = json.dumps({'results': [
+            {'title': f"Learning Designer {posting}", 'company': {'display_name': 'Coursera'},
+             'redirect_url': f"https://example.com/{posting}",
+             'created': created.strftime('%Y-%m-%dT%H:%M:%SZ')}
+            for posting, created in window
+        ]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def new_day(day, count, checkpoints):
+    """A day passes: existing postings and checkpoints age 24h, `count` new ones arrive."""
+    now = datetime.now(timezone.utc)
+    aged = [(posting, created - timedelta(days=1)) for posting, created in StubFeedHandler.feed]
+    fresh = [(f"{day}-{i}", now - timedelta(hours=23) * i / count) for i in range(count)]
+    StubFeedHandler.feed = fresh + aged
+    for key, value in checkpoints.items():
+        checkpoints[key] = (datetime.fromisoformat(value) - timedelta(days=1)).isoformat()
+    return {posting for posting, _ in fresh}
+
+def simulate(api_url, paginate):
+    StubFeedHandler.feed = []
+    StubFeedHandler.calls = 0
+    checkpoints = {}
+    missed = 0
+    for day, count in enumerate(DAILY_NEW):
+        fresh = new_day(day, count, checkpoints)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if paginate:
+                jobs, as_of = adzuna.search_adzuna_since("learning designer", since=(
+                    datetime.fromisoformat(checkpoints['q']) if 'q' in checkpoints else None
+                ), max_pages=config.ADZUNA_MAX_PAGES, api_url=api_url)
+                checkpoints['q'] = as_of.isoformat()
+            else:
+                jobs = adzuna.search_adzuna("learning designer", api_url=api_url)
+        seen = {job['url'].rsplit('/', 1)[1] for job in jobs}
+        # Day 0 is the first search ever: nobody can see that whole backlog
+        if day:
+            missed += len(fresh - seen)
+    return StubFeedHandler.calls, missed
+
+def main():
+    config.ADZUNA_APP_ID = config.ADZUNA_APP_ID or 'test-id'
+    config.ADZUNA_APP_KEY = config.ADZUNA_APP_KEY or 'test-key'
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubFeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results = [("page 1 only", *simulate(api_url, paginate=False)),
+               (f"since last run (max {config.ADZUNA_MAX_PAGES} pages)", *simulate(api_url, paginate=True))]
+    server.shutdown()
+
+    print(f"\n{len(DAILY_NEW)} days of one query, new postings per day: {DAILY_NEW}")
+    for label, calls, missed in results:
+        print(f"  {label:32s} {calls:3d} API calls, {missed:4d} new postings never fetched")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# benchmarks/adzuna_schedule.py
+# Simulated quarter of Adzuna searches on the free-tier quota: the old
+# day-of-year geography rotation vs SearchScheduler, both paginating back to
+# each query's last search. Postings arrive at very different rates per query.
+#
+# Usage: python benchmarks/adzuna_schedule.py
+
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import tempfile
+from collections import Counter
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from search_scheduler import SearchScheduler
+
+DAYS = 90
+START = date(2026, 1, 1)
+PER_PAGE = 50
+
+class SimulatedBudget:
+    """The parts of CallBudget the scheduler reads, over simulated months."""
+
+    def __init__(self):
+        self.limit = config.ADZUNA_MAX_CALLS_PER_RUN
+        self.monthly_limit = config.ADZUNA_MONTHLY_CALL_LIMIT
+        self.reserve = config.ADZUNA_QUOTA_RESERVE
+        self.months = Counter()
+        self.today = START
+        self.run_used = 0
+
+    def month_used(self):
+        return self.months[self.today.strftime('%Y-%m')]
+
+    def take(self):
+        if self.run_used >= self.limit or self.month_used() >= self.monthly_limit:
+            return False
+        self.run_used += 1
+        self.months[self.today.strftime('%Y-%m')] += 1
+        return True
+
+def rotation_geography(day):
+    """The old config.get_geography_for_today()."""
+    day_number = day.timetuple().tm_yday
+    if day_number % 2 == 0:
+        return "USA"
+    elif day_number % 3 == 1:
+        return "Singapore"
+    elif day_number % 3 == 0:
+        return "Dubai"
+    return "USA"
+
+def make_market(seed=0):
+    """Per query: postings per day and the share of them that match."""
+    rng = random.Random(seed)
+    volume = {"USA": 40, "Singapore": 6, "Dubai": 3}
+    market = {}
+    for geography in config.GEOGRAPHIES:
+        for _, category in config.get_search_queries_for_geography(geography):
+            market[(geography, category)] = (volume[geography] * rng.lognormvariate(0, 0.8),
+                                             rng.choice([0.01, 0.02, 0.05, 0.15]))
+    return market
+
+def simulate(pick, market, record=None, seed=1):
+    """
+    Run DAYS days. pick(day, budget) returns [(geography, category)] to search,
+    record(usage, new_by_search, matched, day) hears back about them.
+
+    Returns:
+        (calls, matches fetched, matches posted, longest days each geography went unsearched)
+    """
+    rng = random.Random(seed)
+    budget = SimulatedBudget()
+    pending = {key: [] for key in market}  # Matching flags of postings not fetched yet, newest last
+    searched = set()
+    last_visit = {geography: START for geography in config.GEOGRAPHIES}
+    longest_gap = Counter()
+    fetched_matches = posted_matches = 0
+
+    for offset in range(DAYS):
+        day = START + timedelta(days=offset)
+        budget.today, budget.run_used = day, 0
+        for key, (rate, share) in market.items():
+            arrivals = [rng.random() < share for _ in range(int(rate) + (rng.random() < rate % 1))]
+            pending[key].extend(arrivals)
+            posted_matches += sum(arrivals)
+
+        usage, new_by_search, matched = {}, Counter(), []
+        for key in pick(day, budget):
+            # Newest first; a query's first search is one page, later ones page back to the last
+            pages = 1 if key not in searched else min(config.ADZUNA_MAX_PAGES, max(1, math.ceil(len(pending[key]) / PER_PAGE)))
+            calls = 0
+            while calls < pages and budget.take():
+                calls += 1
+            if not calls:
+                usage[key] = {'calls': 0, 'complete': False}
+                continue
+            fetched = pending[key][-calls * PER_PAGE:]
+            pending[key] = []  # Older postings have dropped out of reach
+            searched.add(key)
+            fetched_matches += sum(fetched)
+            last_visit[key[0]] = day
+            usage[key] = {'calls': calls, 'complete': True}
+            new_by_search[key] = len(fetched)
+            matched.extend({'geography': key[0], 'search_category': key[1]} for hit in fetched if hit)
+        if record is not None:
+            record(usage, new_by_search, matched, day)
+
+        for geography in config.GEOGRAPHIES:
+            longest_gap[geography] = max(longest_gap[geography], (day - last_visit[geography]).days)
+
+    calls = sum(budget.months.values())
+    return calls, fetched_matches, posted_matches, longest_gap
+
+def main():
+    market = make_market()
+
+    def rotation(day, budget):
+        geography = rotation_geography(day)
+        return [(geography, category) for _, category in config.get_search_queries_for_geography(geography)]
+
+    def scheduled(day, budget):
+        with contextlib.redirect_stdout(io.StringIO()):
+            plan = scheduler.plan(scheduler.allowance(budget, day), today=day)
+        return [(geography, category) for geography, _, category in plan]
+
+    old = simulate(rotation, market)
+    with tempfile.TemporaryDirectory() as tmp:
+        scheduler = SearchScheduler(os.path.join(tmp, 'adzuna_schedule.json'),
+                                    max_query_age=config.ADZUNA_MAX_QUERY_AGE_DAYS,
+                                    max_pages=config.ADZUNA_MAX_PAGES)
+        new = simulate(scheduled, market, record=lambda *results: scheduler.record(*results))
+
+    print(f"\n{DAYS} days, {config.ADZUNA_MONTHLY_CALL_LIMIT} calls/month, {len(market)} queries")
+    for label, (calls, fetched, posted, gaps) in (("day-of-year rotation", old), ("SearchScheduler", new)):
+        gap = ", ".join(f"{geography} {days}d" for geography, days in gaps.items())
+        print(f"  {label:22s} {calls:4d} calls, {fetched:4d}/{posted} matches fetched "
+              f"({fetched / max(1, calls):.2f}/call), longest gap: {gap}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/alert_dispatch.py
+# Time immediate alerts against a local fake SendGrid endpoint: one client and
+# blocking send per alert (the old way) vs the queued AlertDispatcher
+#
+# Usage: python benchmarks/alert_dispatch.py [number_of_alerts]
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sendgrid import SendGridAPIClient
+from sendgrid.helpers.mail import Mail
+
+import config
+from alerter import AlertDispatcher, render_immediate_alert
+from job_record_memory import make_job
+
+LATENCY = 0.2     # Simulated SendGrid round trip (seconds)
+THROTTLE_EVERY = 7  # Every Nth request gets a 429, to exercise retries
+
+class FakeSendGridHandler(BaseHTTPRequestHandler):
+    """Accepts POST /v3/mail/send like SendGrid does (202, empty body)."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real API
+    lock = threading.Lock()
+    requests_seen = 0
+    messages = []
+    connections = set()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(LATENCY)
+        cls = type(self)
+        with cls.lock:
+            cls.requests_seen += 1
+            cls.connections.add(self.client_address)
+            throttled = cls.requests_seen % THROTTLE_EVERY == 0
+            if not throttled and self.path == '/v3/mail/send' and self.headers.get('Authorization'):
+                cls.messages.append(json.loads(body))
+
+        self.send_response(429 if throttled else 202)
+        if throttled:
+            self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+    @classmethod
+    def reset(cls):
+        cls.requests_seen = 0
+        cls.messages = []
+        cls.connections = set()
+
+def old_way(jobs, host):
+    """What alerter used to do inline: a new client and a blocking send per job."""
+    for job in jobs:
+        subject, html_content = render_immediate_alert(job)
+        message = Mail(from_email=config.EMAIL_FROM, to_emails=config.EMAIL_TO,
+                       subject=subject, html_content=html_content)
+        try:
+            SendGridAPIClient('test-key', host=host).send(message)
+        except Exception as e:  # The old code logged and moved on
+            print(f"  ❌ Error sending immediate alert: {e}")
+
+def dispatched(jobs, host, **kwargs):
+    """Returns (seconds the scoring loop spent in enqueue, seconds to the last send)."""
+    start = time.perf_counter()
+    dispatcher = AlertDispatcher(api_key='test-key', host=host, backoff=0.05, **kwargs)
+    for job in jobs:
+        dispatcher.enqueue(job)
+    enqueued = time.perf_counter() - start
+    dispatcher.close()
+    return enqueued, time.perf_counter() - start
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    config.EMAIL_TO = 'me@example.com'
+    jobs = [make_job(i, 'Greenhouse') for i in range(count)]
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSendGridHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results = []
+
+    FakeSendGridHandler.reset()
+    start = time.perf_counter()
+    old_way(jobs, host)
+    elapsed = time.perf_counter() - start
+    results.append(("new client per alert, inline", elapsed, elapsed))
+    old_delivered = len(FakeSendGridHandler.messages)
+
+    for label, kwargs in [("AlertDispatcher, 4 workers", {'max_workers': 4}),
+                          ("AlertDispatcher, 8 workers", {'max_workers': 8}),
+                          ("AlertDispatcher, batch", {'batch': True})]:
+        FakeSendGridHandler.reset()
+        enqueued, elapsed = dispatched(jobs, host, **kwargs)
+        expected = 1 if kwargs.get('batch') else count
+        assert len(FakeSendGridHandler.messages) == expected, (label, len(FakeSendGridHandler.messages))
+        results.append((f"{label} ({len(FakeSendGridHandler.connections)} connections)", enqueued, elapsed))
+
+    server.shutdown()
+
+    print(f"\n{'='*72}")
+    print(f"{count} alerts, {LATENCY*1000:.0f} ms simulated latency, every {THROTTLE_EVERY}th request throttled")
+    print(f"(the old way lost {count - old_delivered} alerts to throttling; the dispatcher retried them)")
+    print('='*72)
+    print(f"{'':44s} {'scoring blocked':>15s} {'all sent':>10s}")
+    for label, blocked, elapsed in results:
+        print(f"{label:44s} {blocked:14.3f}s {elapsed:9.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/greenhouse_concurrency.py
+# Compare sequential vs concurrent Greenhouse scraping against a local stub server
+#
+# Usage: python benchmarks/greenhouse_concurrency.py
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from scrapers.greenhouse import scrape_all_greenhouse_companies
+
+LATENCY = 0.25  # Simulated server round trip (seconds)
+
+BOARD_HTML = """<html><body>
+<div class="opening"><a href="/{slug}/jobs/1">Learning Designer</a><span class="location">Remote USA</span></div>
+<div class="opening"><a href="/{slug}/jobs/2">Instructional Designer</a><span class="location">Singapore</span></div>
+<div class="opening"><a href="/{slug}/jobs/3">Software Engineer</a><span class="location">Dubai</span></div>
+</body></html>"""
+
+class StubBoardHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(LATENCY)
+        slug = self.path.strip('/')
+        body = BOARD_HTML.format(slug=slug).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def timed(label, **kwargs):
+    start = time.perf_counter()
+    jobs = scrape_all_greenhouse_companies(config.GREENHOUSE_COMPANIES, use_api=False, **kwargs)
+    elapsed = time.perf_counter() - start
+    return label, elapsed, len(jobs)
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubBoardHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results = [
+        timed("sequential (delay=0)", delay=0, base_url=base_url),
+        timed("concurrent (8 workers, 20 req/s)", max_workers=8, requests_per_second=20, base_url=base_url),
+        timed("concurrent (16 workers, 50 req/s)", max_workers=16, requests_per_second=50, base_url=base_url),
+    ]
+
+    server.shutdown()
+
+    baseline = results[0][1]
+    print(f"\n{'='*60}")
+    print(f"{len(config.GREENHOUSE_COMPANIES)} boards, {LATENCY*1000:.0f} ms simulated latency")
+    print('='*60)
+    for label, elapsed, count in results:
+        print(f"{label:38s} {elapsed:6.2f}s  {count} jobs  {baseline/elapsed:5.1f}x")
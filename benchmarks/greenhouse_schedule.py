@@ -0,0 +1,98 @@
+# benchmarks/greenhouse_schedule.py
+# Simulated two months of Greenhouse polling: every board every day (the old
+# way) vs BoardSchedule, over boards whose openings change at very different
+# rates (and a few that 404). Counts requests and how long changes go unseen.
+#
+# Usage: python benchmarks/greenhouse_schedule.py
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+from collections import Counter
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from scrapers.greenhouse import BoardSchedule
+
+DAYS = 60
+START = date(2026, 1, 1)
+
+# (profile, share of boards, chance the openings change on a given day)
+PROFILES = [('hot', 0.2, 0.7), ('warm', 0.3, 0.2), ('stale', 0.4, 0.03), ('dead', 0.1, None)]
+
+def make_boards(seed=0):
+    rng = random.Random(seed)
+    profiles = [profile for profile, share, _ in PROFILES
+                for _ in range(round(share * len(config.GREENHOUSE_COMPANIES)))]
+    rng.shuffle(profiles)
+    return dict(zip(config.GREENHOUSE_COMPANIES, profiles))
+
+def simulate(boards, schedule=None, seed=1):
+    """
+    Returns:
+        (requests, {profile: [days each change waited to be fetched]})
+    """
+    rng = random.Random(seed)
+    change_rate = {profile: rate for profile, _, rate in PROFILES}
+    openings = {company: 0 for company in boards}  # Bumped on every change
+    fetched = dict(openings)
+    unseen_since = {}  # company -> day of the oldest change not fetched yet
+    delays = {profile: [] for profile, _, _ in PROFILES}
+    requests = 0
+
+    for offset in range(DAYS):
+        today = START + timedelta(days=offset)
+        for company, profile in boards.items():
+            rate = change_rate[profile]
+            if rate is not None and rng.random() < rate:
+                openings[company] += 1
+                unseen_since.setdefault(company, offset)
+
+        if schedule is None:
+            due = list(boards)
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                due = schedule.due(list(boards), today)
+
+        for company in due:
+            requests += 1
+            if boards[company] == 'dead':
+                jobs = None
+            elif openings[company] == fetched[company]:
+                jobs = []  # 304
+                if schedule is not None:
+                    schedule.mark_not_modified(company)
+            else:
+                jobs = [{'title': f"Learning Designer {openings[company]}"}]
+                fetched[company] = openings[company]
+                delays[boards[company]].append(offset - unseen_since.pop(company))
+            if schedule is not None:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    schedule.record(company, jobs, today)
+
+    return requests, delays
+
+def main():
+    boards = make_boards()
+    daily = simulate(boards)
+    with tempfile.TemporaryDirectory() as tmp:
+        schedule = BoardSchedule(os.path.join(tmp, 'greenhouse_schedule.json'),
+                                 max_interval=config.GREENHOUSE_MAX_CHECK_INTERVAL_DAYS,
+                                 max_quarantine=config.GREENHOUSE_MAX_QUARANTINE_DAYS)
+        scheduled = simulate(boards, schedule)
+
+    counts = Counter(boards.values())
+    print(f"\n{len(boards)} boards over {DAYS} days: "
+          + ", ".join(f"{counts[profile]} {profile}" for profile, _, _ in PROFILES))
+    for label, (requests, delays) in (("every board daily", daily), ("BoardSchedule", scheduled)):
+        waits = ", ".join(f"{profile} {sum(waited) / len(waited):.1f}d"
+                          for profile, waited in delays.items() if waited)
+        print(f"  {label:18s} {requests / DAYS:5.1f} requests/day, average wait for a change: {waits}")
+
+if __name__ == "__main__":
+    main()
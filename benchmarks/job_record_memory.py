@@ -0,0 +1,99 @@
+# benchmarks/job_record_memory.py
+# Memory per stored job: plain dicts (as json.load returns them) vs JobRecords
+#
+# Usage: python benchmarks/job_record_memory.py [number_of_jobs]
+
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import get_job_id
+from job_record import JobRecord
+
+COMPANIES = ["coursera", "duolingo", "khanacademy", "canva", "figma", "notion", "grammarly", "udemy"]
+LOCATIONS = ["Remote USA", "Singapore", "Dubai, UAE", "San Francisco, CA", "New York, NY"]
+ROLES = ["learning_design", "instructional_design", "product_design", "user_research", "other"]
+TITLES = ["Learning Experience Designer", "Senior Instructional Designer", "Product Designer, Growth",
+          "UX Researcher", "Curriculum Program Manager", "Education Content Lead"]
+STRENGTHS = ["Learning design experience", "EdTech background", "Remote-friendly", "Curriculum design",
+             "User research skills", "Role type match", "Senior level fit", "Program management"]
+CONCERNS = ["Relocation required", "Weak keyword match", "Seniority mismatch", "Visa sponsorship unclear"]
+
+def make_job(i, source):
+    """A stored job shaped like the ones main.py saves."""
+    slug = random.choice(COMPANIES)
+    job = {
+        'title': f"{random.choice(TITLES)} {i}",
+        'url': f"https://boards.greenhouse.io/{slug}/jobs/{4000000 + i}",
+        'location': random.choice(LOCATIONS),
+        'company': slug.title(),
+        'source': source,
+        'date_found': (datetime.now() - timedelta(minutes=i)).isoformat(),
+    }
+    if source == 'Greenhouse':
+        job.update({
+            'company_slug': slug,
+            'department': 'Design',
+            'raw_html': '<div class="opening"><a href="/x">' + 'x' * 470 + '</a></div>',
+        })
+    else:
+        job.update({
+            'description': ' '.join(random.choice(TITLES).lower() for _ in range(8)),
+            'salary_min': None,
+            'salary_max': None,
+            'search_category': 'Learning Design',
+            'geography': 'USA',
+        })
+    job['job_id'] = get_job_id(job)
+    job['first_seen'] = job['date_found']
+    job['ai_analysis'] = {
+        'is_match': True,
+        'score': random.randint(6, 10),
+        'reasoning': f"Strong overlap with learning design background and EdTech experience ({i}). "
+                     "Role is remote-friendly and senior enough.",
+        'role_category': random.choice(ROLES),
+        'key_strengths': random.sample(STRENGTHS, 2),
+        'concerns': random.sample(CONCERNS, 1),
+    }
+    job['match_score'] = job['ai_analysis']['score']
+    return job
+
+def measure(build):
+    """Bytes allocated by build() that are still alive afterwards."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    random.seed(0)
+    jobs = [make_job(i, 'Greenhouse' if i % 3 else 'Adzuna') for i in range(count)]
+    payload = json.dumps({job['job_id']: job for job in jobs})
+
+    # Round trip: everything except raw_html (dropped by default) must survive
+    for job in jobs[:500]:
+        expected = {key: value for key, value in job.items() if key != 'raw_html' and value is not None}
+        assert JobRecord.from_dict(job).to_dict() == expected, job['job_id']
+    print("✅ dict -> JobRecord -> dict round trip OK")
+
+    as_dicts, dict_bytes = measure(lambda: json.loads(payload))
+    as_records, record_bytes = measure(
+        lambda: {job_id: JobRecord.from_dict(job) for job_id, job in json.loads(payload).items()}
+    )
+
+    print(f"{count} jobs")
+    print(f"  dicts:      {dict_bytes / count:7.0f} bytes/job")
+    print(f"  JobRecords: {record_bytes / count:7.0f} bytes/job  ({dict_bytes / record_bytes:.1f}x smaller)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/keyword_batch.py
+# Time fallback_keyword_match_batch against the scalar version
+# (their outputs are checked for equality in tests/test_keyword_batch.py)
+#
+# Usage: python benchmarks/keyword_batch.py
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from ai_filter import BONUS_KEYWORDS, EDU_KEYWORDS, ROLE_KEYWORDS, KeywordMatcher, fallback_keyword_match
+from keyword_batch import fallback_keyword_match_batch
+
+PROSE = (
+    "we are looking for a team member who will work closely with partners across the "
+    "organization to build great products and help customers succeed in a fast paced "
+    "environment requiring strong communication skills and several years of experience"
+).split()
+
+VOCABULARY = (
+    [keyword for keywords in ROLE_KEYWORDS.values() for keyword in keywords]
+    + EDU_KEYWORDS
+    + [keyword for group in BONUS_KEYWORDS for keyword in group]
+    + [keyword.lower() for keyword in config.EXCLUDE_KEYWORDS]
+)
+
+def realistic_jobs(count, seed=0, keyword_rate=0.03):
+    """Posting-sized descriptions (~1000 chars) where keywords are sparse."""
+    rng = random.Random(seed)
+
+    def prose(words):
+        return " ".join(
+            rng.choice(VOCABULARY) if rng.random() < keyword_rate else rng.choice(PROSE)
+            for _ in range(words)
+        )
+
+    return [{'title': prose(3).title(), 'description': prose(150)} for _ in range(count)]
+
+def benchmark(count):
+    jobs = realistic_jobs(count, seed=count)
+    matcher = KeywordMatcher()
+
+    start = time.perf_counter()
+    for job in jobs:
+        fallback_keyword_match(job)
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fallback_keyword_match_batch(jobs, matcher)
+    batch_time = time.perf_counter() - start
+
+    print(f"{count:>8} jobs   scalar {scalar_time:6.2f}s ({count/scalar_time:9.0f} jobs/s)   "
+          f"batch {batch_time:6.2f}s ({count/batch_time:9.0f} jobs/s)   {scalar_time/batch_time:4.1f}x")
+
+if __name__ == "__main__":
+    for count in (10_000, 100_000):
+        benchmark(count)
@@ -0,0 +1,98 @@
+# benchmarks/pipeline_overlap.py
+# Wall-clock of the old phased run (scrape → dedup → score → save, Greenhouse
+# then Adzuna) vs the streaming JobPipeline, with simulated network/AI latency
+#
+# Usage: python benchmarks/pipeline_overlap.py
+
+import contextlib
+import copy
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+import ai_filter
+from ai_filter import filter_jobs, fallback_keyword_match
+from database import load_seen_job_ids, filter_new_jobs, save_new_jobs
+from job_record_memory import make_job
+from pipeline import JobPipeline
+
+BOARD_LATENCY = 0.05  # Per Greenhouse board, i.e. what the rate-limited pool sustains
+QUERY_LATENCY = 0.4   # Per Adzuna query
+AI_LATENCY = 0.3      # Per Gemini request (one batch)
+
+def simulated_score_batch(jobs, raise_on_rate_limit=False):
+    """A Gemini request that takes AI_LATENCY and answers like the keyword fallback."""
+    time.sleep(AI_LATENCY)
+    return [fallback_keyword_match(job) for job in jobs]
+
+def scraped(chunks, latency):
+    for jobs in chunks:
+        time.sleep(latency)
+        yield copy.deepcopy(jobs)
+
+def fresh_database(tmp, name):
+    database_file = os.path.join(tmp, f"{name}.json")
+    return database_file, load_seen_job_ids(database_file)
+
+def phased(boards, queries, tmp):
+    database_file, seen_jobs = fresh_database(tmp, 'phased')
+    matched = 0
+    for chunks, latency in ((boards, BOARD_LATENCY), (queries, QUERY_LATENCY)):
+        jobs = [job for chunk in scraped(chunks, latency) for job in chunk]
+        new_jobs = filter_new_jobs(jobs, seen_jobs, {})
+        tier_matched = filter_jobs(new_jobs, min_score=config.DAILY_DIGEST_THRESHOLD,
+                                   batch_size=config.AI_BATCH_SIZE, max_in_flight=config.AI_MAX_IN_FLIGHT,
+                                   prefilter=True)
+        save_new_jobs(tier_matched, seen_jobs, database_file)
+        matched += len(tier_matched)
+    return matched
+
+def streamed(boards, queries, tmp):
+    database_file, seen_jobs = fresh_database(tmp, 'streamed')
+    pipeline = JobPipeline(seen_jobs, {}, database_file,
+                           min_score=config.DAILY_DIGEST_THRESHOLD, batch_size=config.AI_BATCH_SIZE,
+                           max_in_flight=config.AI_MAX_IN_FLIGHT, prefilter=True)
+    results = pipeline.run({
+        'greenhouse': scraped(boards, BOARD_LATENCY),
+        'api_searches': scraped(queries, QUERY_LATENCY),
+    })
+    return sum(len(result.matched) for result in results.values())
+
+def timed(run, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        matched = run(*args)
+    return time.perf_counter() - start, matched
+
+def main():
+    config.GOOGLE_AI_KEY = 'simulated'
+    ai_filter.score_batch = simulated_score_batch
+
+    random.seed(0)
+    boards = [[make_job(board * 100 + i, 'Greenhouse') for i in range(random.randint(0, 12))]
+              for board in range(len(config.GREENHOUSE_COMPANIES))]
+    queries = [[make_job(100000 + query * 100 + i, 'Adzuna') for i in range(50)] for query in range(8)]
+    scraped_jobs = sum(map(len, boards)) + sum(map(len, queries))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        phased_time, phased_matched = timed(phased, boards, queries, tmp)
+        streamed_time, streamed_matched = timed(streamed, boards, queries, tmp)
+    assert phased_matched == streamed_matched, (phased_matched, streamed_matched)
+
+    scrape_greenhouse = len(boards) * BOARD_LATENCY
+    scrape_adzuna = len(queries) * QUERY_LATENCY
+    print(f"\n{len(boards)} boards + {len(queries)} queries, {scraped_jobs} jobs, {phased_matched} matches")
+    print(f"  stage times: Greenhouse {scrape_greenhouse:.1f}s, Adzuna {scrape_adzuna:.1f}s, "
+          f"AI {AI_LATENCY * 1000:.0f} ms/request x{config.AI_MAX_IN_FLIGHT} in flight")
+    print(f"  phased:   {phased_time:6.2f}s")
+    print(f"  pipeline: {streamed_time:6.2f}s  ({phased_time / streamed_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
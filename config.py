@@ -2,7 +2,6 @@
 # Configuration for Hybrid Job Monitoring System (Option C)
 
 import os
-from datetime import datetime
 
 # ===== GREENHOUSE COMPANIES (Daily scraping, FREE) =====
 GREENHOUSE_COMPANIES = [
@@ -39,6 +38,17 @@ GREENHOUSE_COMPANIES = [
     "hubspot", "salesforce", "shopify", "atlassian",
 ]
 
+# Concurrent board fetching (per-host token bucket keeps us polite)
+GREENHOUSE_MAX_WORKERS = 8
+GREENHOUSE_REQUESTS_PER_SECOND = 4
+
+# Boards are fetched when due rather than every day (GREENHOUSE_SCHEDULE_FILE):
+# daily while their openings keep changing, backing off to every
+# GREENHOUSE_MAX_CHECK_INTERVAL_DAYS once they go quiet. Boards that fail are
+# quarantined for 1, 2, 4... days, up to GREENHOUSE_MAX_QUARANTINE_DAYS
+GREENHOUSE_MAX_CHECK_INTERVAL_DAYS = 7
+GREENHOUSE_MAX_QUARANTINE_DAYS = 30
+
 # ===== ROLE CLUSTERS (for optimized API searches) =====
 
 ROLE_CLUSTER_1_DESIGN = [
@@ -93,15 +103,15 @@ CATEGORIES = {
 GEOGRAPHIES = {
     "USA": {
         "search_terms": ["United States", "USA", "US", "remote USA"],
-        "check_frequency": 2  # Check every 2 days
+        "check_frequency": 2  # Searched at least every 2 days
     },
     "Singapore": {
         "search_terms": ["Singapore", "SG"],
-        "check_frequency": 3  # Check every 3 days
+        "check_frequency": 3  # Searched at least every 3 days
     },
     "Dubai": {
         "search_terms": ["Dubai", "UAE", "United Arab Emirates"],
-        "check_frequency": 3  # Check every 3 days
+        "check_frequency": 3  # Searched at least every 3 days
     }
 }
 
@@ -131,6 +141,33 @@ def get_search_queries_for_geography(geography):
     
     return queries  # Returns 8 queries (4 categories × 2 role clusters)
 
+# ===== ADZUNA API =====
+
+# A geography's queries run concurrently over one pooled HTTPS session
+ADZUNA_MAX_WORKERS = 4
+
+# Free tier is 250 calls/month; one run never makes more than this many calls
+ADZUNA_MAX_CALLS_PER_RUN = 16
+
+# Every real API call is recorded per month in ADZUNA_LEDGER_FILE. Calls past the
+# monthly limit are refused; once only ADZUNA_QUOTA_RESERVE are left, queries with
+# an older cached answer reuse it instead of spending a call
+ADZUNA_MONTHLY_CALL_LIMIT = 250
+ADZUNA_QUOTA_RESERVE = 25
+
+# Identical requests within this many hours are answered from ADZUNA_CACHE_FILE
+ADZUNA_CACHE_TTL_HOURS = 20
+
+# Each query pages back (newest first) to where its last complete search left
+# off, recorded in ADZUNA_CHECKPOINT_FILE; a query's first search is one page
+ADZUNA_MAX_PAGES = 5
+
+# Queries are scheduled across all GEOGRAPHIES by their recent new matches per
+# call (ADZUNA_SCHEDULE_FILE), spreading the monthly calls evenly over the
+# month. Each geography still gets its best query every `check_frequency`
+# days, and no query goes unsearched for more than this many days
+ADZUNA_MAX_QUERY_AGE_DAYS = 14
+
 # ===== EXCLUDE KEYWORDS =====
 
 EXCLUDE_KEYWORDS = [
@@ -245,6 +282,44 @@ Locations:
 IMMEDIATE_ALERT_THRESHOLD = 8  # Score 8+ = immediate email
 DAILY_DIGEST_THRESHOLD = 6     # Score 6+ included in daily digest
 
+# Immediate alerts are sent in the background while scoring continues;
+# ALERT_BATCH = True sends one email listing all of a run's high matches instead
+ALERT_MAX_WORKERS = 4  # Alert emails in flight at once
+ALERT_BATCH = False
+
+# ===== AI SCORING =====
+
+GEMINI_MODEL = "gemini-1.5-flash"
+AI_BATCH_SIZE = 10  # Jobs scored per Gemini request
+AI_MAX_IN_FLIGHT = 4  # Concurrent Gemini requests (adapts down on 429s)
+
+# Keyword pre-filter before the AI: excluded titles and keyword scores below
+# PREFILTER_REJECT_BELOW (no role or education keyword at all) are rejected
+# without an AI call; keyword scores at/above PREFILTER_ACCEPT_AT skip the AI
+# and are accepted on keywords alone (None = always ask the AI)
+PREFILTER_ENABLED = True
+PREFILTER_REJECT_BELOW = 3
+PREFILTER_ACCEPT_AT = None
+
+# Local semantic pre-ranking against YOUR_PROFILE: only the SEMANTIC_TOP_K most
+# similar jobs (None = no cap) at or above SEMANTIC_MIN_SIMILARITY go to the AI
+SEMANTIC_RANKING_ENABLED = True
+SEMANTIC_TOP_K = None
+SEMANTIC_MIN_SIMILARITY = 0.04
+SEMANTIC_DIMS = 1024
+
+# Cached analyses are reused for identical postings; editing YOUR_PROFILE
+# or GEMINI_MODEL invalidates them automatically
+AI_CACHE_TTL_DAYS = 30
+AI_CACHE_MAX_ENTRIES = 20000
+
+# Rejected jobs are not re-sent to the AI until this many days have passed
+REJECTED_JOBS_TTL_DAYS = 30
+
+# Scraping, dedup, AI scoring and saving run as a streaming pipeline; this is
+# how many boards/queries' worth of jobs may queue up between two stages
+PIPELINE_QUEUE_SIZE = 8
+
 # ===== API CREDENTIALS (from environment variables) =====
 
 # Google AI Studio
@@ -261,32 +336,15 @@ SERPAPI_KEY = os.getenv('SERPAPI_KEY')
 SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY')
 EMAIL_FROM = os.getenv('EMAIL_FROM', 'jobmonitor@yourdomain.com')
 EMAIL_TO = os.getenv('EMAIL_TO')
+SENDGRID_HOST = os.getenv('SENDGRID_HOST', 'https://api.sendgrid.com')  # Override to test against a local fake
 
-# ===== GEOGRAPHY ROTATION SCHEDULE =====
+# ===== DASHBOARD =====
 
-def get_geography_for_today():
-    """
-    Determine which geography to search today based on rotation schedule.
-    USA: Every 2 days
-    Singapore: Every 3 days
-    Dubai: Every 3 days
-    
-    Returns: geography name (USA, Singapore, or Dubai)
-    """
-    day_number = datetime.now().timetuple().tm_yday  # Day of year (1-365)
-    
-    # USA every 2 days: days 0, 2, 4, 6, 8, 10...
-    # Singapore every 3 days starting day 1: days 1, 4, 7, 10, 13...
-    # Dubai every 3 days starting day 3: days 3, 6, 9, 12, 15...
-    
-    if day_number % 2 == 0:
-        return "USA"
-    elif day_number % 3 == 1:
-        return "Singapore"
-    elif day_number % 3 == 0:
-        return "Dubai"
-    else:
-        return "USA"  # Default fallback
+# "html": one self-contained dashboard.html with every job card inlined.
+# "app": dashboard.html is a small shell that fetches dashboard_data/jobs-NNN.json
+# pages and only renders the cards in view (serve over HTTP, e.g. GitHub Pages).
+DASHBOARD_MODE = "html"
+DASHBOARD_PAGE_SIZE = 500  # Jobs per JSON page in "app" mode
 
 # ===== FILE PATHS =====
 
@@ -296,5 +354,16 @@ import os
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Use relative paths that work both locally and on GitHub Actions
-DATABASE_FILE = os.path.join(BASE_DIR, "jobs_seen.json")
+# Seen-jobs storage backend: "json" (snapshot + append-only log) or "sqlite"
+# (WAL mode, indexed; imports jobs_seen.json on first run)
+DATABASE_BACKEND = "json"
+DATABASE_FILE = os.path.join(BASE_DIR, "jobs_seen.db" if DATABASE_BACKEND == "sqlite" else "jobs_seen.json")
+REJECTED_JOBS_FILE = os.path.join(BASE_DIR, "jobs_rejected.json")
+GREENHOUSE_CACHE_FILE = os.path.join(BASE_DIR, "greenhouse_cache.json")
+GREENHOUSE_SCHEDULE_FILE = os.path.join(BASE_DIR, "greenhouse_schedule.json")
+ADZUNA_CACHE_FILE = os.path.join(BASE_DIR, "adzuna_cache.json")
+ADZUNA_LEDGER_FILE = os.path.join(BASE_DIR, "adzuna_quota.json")
+ADZUNA_CHECKPOINT_FILE = os.path.join(BASE_DIR, "adzuna_checkpoints.json")
+ADZUNA_SCHEDULE_FILE = os.path.join(BASE_DIR, "adzuna_schedule.json")
+AI_CACHE_FILE = os.path.join(BASE_DIR, "ai_cache.json")
 LOG_FILE = os.path.join(BASE_DIR, "job_monitor.log")
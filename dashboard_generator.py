@@ -1,9 +1,27 @@
 # dashboard_generator.py
 # Generate beautiful interactive HTML dashboard for job viewing
 
+import base64
 import json
 from datetime import datetime, timedelta
 import os
+import numpy as np
+
+def date_bucket(first_seen, today, week_ago):
+    """
+    'today', 'week' or 'old' for an ISO first_seen timestamp.
+    Compares the date prefix as a string, so nothing is parsed.
+    
+    Args:
+        first_seen: ISO timestamp
+        today, week_ago: ISO dates (YYYY-MM-DD)
+    """
+    day = first_seen[:10]
+    if day == today:
+        return "today"
+    if day >= week_ago:
+        return "week"
+    return "old"
 
 def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dashboard.html"):
     """
@@ -14,6 +32,553 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
         output_path: Where to save dashboard.html
     """
     
+    jobs_list, buckets, stats = dashboard_stats(jobs_database)
+    facets, facet_counts = facet_index(jobs_list, buckets)
+    facets_json = json.dumps(facets)
+    
+    # Generate job cards (UTF-8 chunks, streamed into the file below)
+    job_cards = generate_job_cards(jobs_list, buckets)
+    
+    # Generate the page around the job cards
+    page_head = render_page_head(stats, facet_counts=facet_counts)
+    page_tail = f"""
+        </div>
+    </div>
+    
+    <script>
+        // Track applied jobs in localStorage
+        const appliedJobs = new Set(JSON.parse(localStorage.getItem('appliedJobs') || '[]'));
+        
+        // Mark already applied jobs
+        appliedJobs.forEach(jobId => {{
+            const card = document.querySelector(`[data-job-id="${{jobId}}"]`);
+            if (card) {{
+                card.classList.add('applied');
+                const btn = card.querySelector('.mark-applied-btn');
+                if (btn) {{
+                    btn.textContent = '✓ Applied';
+                    btn.classList.remove('btn-secondary');
+                    btn.classList.add('btn-success');
+                }}
+            }}
+        }});
+        
+        // Handle "Mark as Applied" buttons
+        document.querySelectorAll('.mark-applied-btn').forEach(btn => {{
+            btn.addEventListener('click', (e) => {{
+                e.preventDefault();
+                const jobId = btn.dataset.jobId;
+                const card = document.querySelector(`[data-job-id="${{jobId}}"]`);
+                
+                if (appliedJobs.has(jobId)) {{
+                    // Unapply
+                    appliedJobs.delete(jobId);
+                    card.classList.remove('applied');
+                    btn.textContent = 'Mark as Applied';
+                    btn.classList.remove('btn-success');
+                    btn.classList.add('btn-secondary');
+                }} else {{
+                    // Apply
+                    appliedJobs.add(jobId);
+                    card.classList.add('applied');
+                    btn.textContent = '✓ Applied';
+                    btn.classList.remove('btn-secondary');
+                    btn.classList.add('btn-success');
+                }}
+                
+                localStorage.setItem('appliedJobs', JSON.stringify([...appliedJobs]));
+            }});
+        }});
+        
+        // Filtering logic
+        let filters = {{
+            date: 'all',
+            score: 'all',
+            location: 'all',
+            source: 'all'
+        }};
+        
+        // Filter button handlers
+        document.querySelectorAll('.filter-btn').forEach(btn => {{
+            btn.addEventListener('click', () => {{
+                const filterType = btn.dataset.filter;
+                const filterValue = btn.dataset.value;
+                
+                // Update active state
+                document.querySelectorAll(`[data-filter="${{filterType}}"]`).forEach(b => b.classList.remove('active'));
+                btn.classList.add('active');
+                
+                // Update filter
+                filters[filterType] = filterValue;
+                
+                // Apply filters
+                applyFilters();
+            }});
+        }});
+        
+{FACET_SCRIPT}
+        const cards = document.querySelectorAll('.job-card');
+        const facets = new Facets({facets_json}, cards.length);
+        let shown = new Uint8Array(cards.length).fill(1);
+        
+        function applyFilters() {{
+            const show = new Uint8Array(cards.length);
+            let visibleCount = 0;
+            
+            for (const i of facets.matching(filters)) {{
+                if (filters.date === 'applied' && !cards[i].classList.contains('applied')) continue;
+                show[i] = 1;
+                visibleCount++;
+            }}
+            
+            // Show/hide only the jobs whose visibility changed
+            for (let i = 0; i < cards.length; i++) {{
+                if (show[i] !== shown[i]) cards[i].style.display = show[i] ? 'block' : 'none';
+            }}
+            shown = show;
+            
+            // Show "no jobs" message if nothing visible
+            const container = document.getElementById('jobsContainer');
+            let noJobsMsg = container.querySelector('.no-jobs');
+            
+            if (visibleCount === 0) {{
+                if (!noJobsMsg) {{
+                    noJobsMsg = document.createElement('div');
+                    noJobsMsg.className = 'no-jobs';
+                    noJobsMsg.innerHTML = '<div class="no-jobs-icon">🔍</div><p>No jobs match your current filters.</p><p style="margin-top: 10px; font-size: 14px;">Try adjusting your filters above.</p>';
+                    container.appendChild(noJobsMsg);
+                }}
+            }} else {{
+                if (noJobsMsg) noJobsMsg.remove();
+            }}
+        }}
+    </script>
+</body>
+</html>
+"""
+    
+    # Write to file
+    with open(output_path, 'wb') as f:
+        f.write(page_head.encode('utf-8'))
+        f.writelines(job_cards)
+        f.write(page_tail.encode('utf-8'))
+    
+    print(f"✅ Dashboard generated: {output_path}")
+    print_dashboard_stats(stats)
+
+# Filter buttons that get a precomputed facet ("applied" lives in the browser)
+FACET_VALUES = {
+    'date': ['today', 'week'],
+    'score': ['9', '8', '7', '6'],
+    'location': ['usa', 'singapore', 'dubai'],
+    'source': ['greenhouse', 'adzuna'],
+}
+
+FACET_SCRIPT = """
+        // Precomputed filter results: bitsets[facet][value] is a base64 bitset
+        // over job positions (bit i set = job i matches), so filtering is a few
+        // word-wise ANDs instead of a pass over every card
+        class Facets {
+            constructor(bitsets, total) {
+                this.bitsets = bitsets;
+                this.total = total;
+                this.decoded = {};
+            }
+            
+            bits(facet, value) {
+                const key = `${facet}:${value}`;
+                if (!(key in this.decoded)) {
+                    const bytes = Uint8Array.from(atob(this.bitsets[facet][value]), c => c.charCodeAt(0));
+                    const words = new Uint32Array(Math.ceil(this.total / 32));
+                    new Uint8Array(words.buffer).set(bytes);
+                    this.decoded[key] = words;
+                }
+                return this.decoded[key];
+            }
+            
+            // Positions, in order, of jobs matching every active filter that has a facet
+            matching(filters) {
+                let result = null;
+                for (const [facet, value] of Object.entries(filters)) {
+                    if (!this.bitsets[facet] || !(value in this.bitsets[facet])) continue;
+                    const bits = this.bits(facet, value);
+                    result = result ? result.map((word, i) => word & bits[i]) : bits;
+                }
+                
+                const positions = [];
+                if (!result) {
+                    for (let i = 0; i < this.total; i++) positions.push(i);
+                    return positions;
+                }
+                result.forEach((word, w) => {
+                    while (word) {
+                        const low = word & -word;
+                        positions.push(w * 32 + 31 - Math.clz32(low));
+                        word ^= low;
+                    }
+                });
+                return positions;
+            }
+        }
+"""
+
+def facet_index(jobs_list, buckets):
+    """
+    Precompute every filter button's result, with the same rules the page
+    used to apply card by card (score at least N, location/source contains
+    the value, date bucket).
+    
+    Args:
+        jobs_list: Jobs, in display order
+        buckets: Date bucket of each job (see date_bucket)
+    
+    Returns:
+        (bitsets, counts): facet -> value -> base64 bitset over job positions
+        (bit i, little-endian, is jobs_list[i]); facet -> value -> match count
+    """
+    scores = np.array([job.get('match_score', 0) for job in jobs_list], dtype=np.int64)
+    buckets = np.array(buckets, dtype='U5')
+    locations = [job.get('location', 'Unknown').lower() for job in jobs_list]
+    sources = [job.get('source', 'Unknown').lower() for job in jobs_list]
+    
+    masks = {
+        'date': {'today': buckets == 'today', 'week': buckets != 'old'},
+        'score': {value: scores >= int(value) for value in FACET_VALUES['score']},
+        'location': {value: np.array([value in location for location in locations], dtype=bool)
+                     for value in FACET_VALUES['location']},
+        'source': {value: np.array([value in source for source in sources], dtype=bool)
+                   for value in FACET_VALUES['source']},
+    }
+    
+    bitsets = {}
+    counts = {}
+    for facet, values in masks.items():
+        bitsets[facet] = {
+            value: base64.b64encode(np.packbits(mask, bitorder='little').tobytes()).decode('ascii')
+            for value, mask in values.items()
+        }
+        counts[facet] = {value: int(mask.sum()) for value, mask in values.items()}
+    
+    return bitsets, counts
+
+# Columns of each row in the dashboard_data pages
+APP_FIELDS = ['job_id', 'title', 'company', 'location', 'url', 'source', 'score', 'category', 'reasoning', 'first_seen']
+
+APP_CSS = """
+        /* Virtual scrolling: only cards near the viewport exist in the DOM */
+        .jobs-viewport {
+            position: relative;
+            --row-height: 320px;
+        }
+        
+        .jobs-viewport .job-card {
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: calc(var(--row-height) - 20px);
+            overflow: hidden;
+        }
+        
+        .jobs-viewport .job-reasoning p {
+            display: -webkit-box;
+            -webkit-line-clamp: 3;
+            -webkit-box-orient: vertical;
+            overflow: hidden;
+        }
+        
+        @media (max-width: 768px) {
+            .jobs-viewport {
+                --row-height: 420px;
+            }
+        }
+"""
+
+APP_SCRIPT = """
+            <div class="jobs-viewport" id="jobsViewport"></div>
+        </div>
+    </div>
+    
+    <script>
+        const DATA_URL = '__DATA_URL__';
+        const BUFFER_ROWS = 5;
+        
+        // Track applied jobs in localStorage
+        const appliedJobs = new Set(JSON.parse(localStorage.getItem('appliedJobs') || '[]'));
+        
+        const container = document.getElementById('jobsContainer');
+        const viewport = document.getElementById('jobsViewport');
+        
+__FACET_SCRIPT__
+        let facets = null;
+        let jobs = [];
+        let visible = [];
+        let rendered = { first: -1, last: -1 };
+        
+        const pad = n => String(n).padStart(2, '0');
+        const isoDate = d => `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`;
+        const now = new Date();
+        const todayIso = isoDate(now);
+        const weekAgoIso = isoDate(new Date(now.getFullYear(), now.getMonth(), now.getDate() - 7));
+        
+        function dateBucket(firstSeen) {
+            const day = firstSeen.slice(0, 10);
+            if (day === todayIso) return 'today';
+            if (day >= weekAgoIso) return 'week';
+            return 'old';
+        }
+        
+        function esc(text) {
+            return String(text).replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]));
+        }
+        
+        function toJob(row, fields) {
+            const job = {};
+            fields.forEach((field, i) => job[field] = row[i]);
+            job.bucket = dateBucket(job.first_seen);
+            return job;
+        }
+        
+        function rowHeight() {
+            return parseFloat(getComputedStyle(viewport).getPropertyValue('--row-height'));
+        }
+        
+        function cardHtml(job, top) {
+            const score = job.score;
+            const [scoreClass, scoreEmoji] = score >= 9 ? ['score-9-10', '🔥'] : score >= 7 ? ['score-7-8', '⚡'] : ['score-6', '✓'];
+            const newBadge = job.bucket === 'today' ? '<span class="new-today">NEW TODAY</span>' : '';
+            const applied = appliedJobs.has(job.job_id);
+            const category = job.category.replace(/_/g, ' ').replace(/\\b\\w/g, c => c.toUpperCase());
+            const dateDisplay = new Date(job.first_seen).toLocaleString('en-US', {
+                month: 'long', day: '2-digit', year: 'numeric', hour: '2-digit', minute: '2-digit'
+            });
+            
+            return `
+            <div class="job-card${applied ? ' applied' : ''}" style="top: ${top}px" data-job-id="${esc(job.job_id)}">
+                <div class="job-header">
+                    <div>
+                        <div class="job-title">${scoreEmoji} ${esc(job.title)} ${newBadge}</div>
+                        <div class="job-company">${esc(job.company)}</div>
+                        <div class="job-location">📍 ${esc(job.location)}</div>
+                    </div>
+                    <div class="score-badge ${scoreClass}">${score}/10</div>
+                </div>
+                <div class="job-reasoning">
+                    <strong>Why this matches:</strong>
+                    <p>${esc(job.reasoning)}</p>
+                </div>
+                <div class="job-meta">
+                    <span class="meta-tag">📂 ${esc(category)}</span>
+                    <span class="meta-tag">🔍 ${esc(job.source)}</span>
+                    <span class="meta-tag">📅 ${esc(dateDisplay)}</span>
+                </div>
+                <div class="job-actions">
+                    <a href="${esc(job.url)}" target="_blank" class="btn btn-primary">🔗 View Job & Apply</a>
+                    <button class="btn ${applied ? 'btn-success' : 'btn-secondary'} mark-applied-btn" data-job-id="${esc(job.job_id)}">
+                        ${applied ? '✓ Applied' : 'Mark as Applied'}
+                    </button>
+                </div>
+            </div>`;
+        }
+        
+        // Render only the cards in (or near) the browser window
+        function renderWindow(force = false) {
+            const row = rowHeight();
+            const top = -viewport.getBoundingClientRect().top;
+            const first = Math.max(0, Math.floor(top / row) - BUFFER_ROWS);
+            const last = Math.min(visible.length, Math.ceil((top + window.innerHeight) / row) + BUFFER_ROWS);
+            
+            if (!force && first === rendered.first && last === rendered.last) return;
+            rendered = { first, last };
+            
+            const cards = [];
+            for (let i = first; i < last; i++) cards.push(cardHtml(visible[i], i * row));
+            viewport.innerHTML = cards.join('');
+        }
+        
+        window.addEventListener('scroll', () => renderWindow(), { passive: true });
+        window.addEventListener('resize', () => {
+            viewport.style.height = `${visible.length * rowHeight()}px`;
+            renderWindow(true);
+        });
+        
+        // Handle "Mark as Applied" buttons
+        viewport.addEventListener('click', (e) => {
+            const btn = e.target.closest('.mark-applied-btn');
+            if (!btn) return;
+            e.preventDefault();
+            
+            const jobId = btn.dataset.jobId;
+            if (appliedJobs.has(jobId)) {
+                appliedJobs.delete(jobId);
+            } else {
+                appliedJobs.add(jobId);
+            }
+            localStorage.setItem('appliedJobs', JSON.stringify([...appliedJobs]));
+            
+            if (filters.date === 'applied') {
+                applyFilters();
+            } else {
+                renderWindow(true);
+            }
+        });
+        
+        // Filtering logic
+        let filters = {
+            date: 'all',
+            score: 'all',
+            location: 'all',
+            source: 'all'
+        };
+        
+        // Filter button handlers
+        document.querySelectorAll('.filter-btn').forEach(btn => {
+            btn.addEventListener('click', () => {
+                const filterType = btn.dataset.filter;
+                
+                // Update active state
+                document.querySelectorAll(`[data-filter="${filterType}"]`).forEach(b => b.classList.remove('active'));
+                btn.classList.add('active');
+                
+                // Update filter
+                filters[filterType] = btn.dataset.value;
+                
+                // Apply filters
+                applyFilters();
+            });
+        });
+        
+        function applyFilters() {
+            visible = [];
+            for (const i of facets.matching(filters)) {
+                if (i >= jobs.length) break;  // page not loaded yet
+                if (filters.date === 'applied' && !appliedJobs.has(jobs[i].job_id)) continue;
+                visible.push(jobs[i]);
+            }
+            viewport.style.height = `${visible.length * rowHeight()}px`;
+            renderWindow(true);
+            
+            // Show "no jobs" message if nothing visible
+            let noJobsMsg = container.querySelector('.no-jobs');
+            if (visible.length === 0) {
+                if (!noJobsMsg) {
+                    noJobsMsg = document.createElement('div');
+                    noJobsMsg.className = 'no-jobs';
+                    noJobsMsg.innerHTML = jobs.length
+                        ? '<div class="no-jobs-icon">🔍</div><p>No jobs match your current filters.</p><p style="margin-top: 10px; font-size: 14px;">Try adjusting your filters above.</p>'
+                        : '<div class="no-jobs-icon">📭</div><p>No jobs in database yet.</p><p style="margin-top: 10px; font-size: 14px;">Jobs will appear here after the first monitoring run.</p>';
+                    container.appendChild(noJobsMsg);
+                }
+            } else if (noJobsMsg) {
+                noJobsMsg.remove();
+            }
+        }
+        
+        // Fetch the index, then the pages in order; the first page paints straight away
+        async function loadJobs() {
+            const index = await fetch(DATA_URL, { cache: 'no-cache' }).then(r => r.json());
+            const base = DATA_URL.slice(0, DATA_URL.lastIndexOf('/') + 1);
+            facets = new Facets(index.facets, index.total);
+            
+            if (!index.pages.length) applyFilters();
+            for (const page of index.pages) {
+                const rows = await fetch(`${base}${page}?v=${index.version}`).then(r => r.json());
+                rows.forEach(row => jobs.push(toJob(row, index.fields)));
+                applyFilters();
+            }
+        }
+        
+        loadJobs().catch(e => {
+            container.innerHTML = `<div class="no-jobs"><div class="no-jobs-icon">⚠️</div><p>Could not load job data (${esc(e.message)}).</p></div>`;
+        });
+    </script>
+</body>
+</html>
+"""
+
+def generate_dashboard_app(jobs_database, output_path="/home/claude/job-monitor/dashboard.html",
+                           data_dir=None, page_size=500):
+    """
+    Generate the dashboard as a static shell plus paged JSON data.
+    
+    dashboard.html holds only the header, filters and a script; the jobs
+    go into data_dir as jobs.json (an index) and jobs-NNN.json pages of
+    compact rows. The browser fetches the pages and renders just the cards
+    in view, so page weight and first paint don't grow with the history.
+    Needs to be served over HTTP (e.g. GitHub Pages), not opened as a file.
+    
+    Args:
+        jobs_database: Dictionary of job_id -> job data
+        output_path: Where to save dashboard.html
+        data_dir: Where to write the JSON (default: dashboard_data/ next to output_path)
+        page_size: Jobs per JSON page
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    data_dir = data_dir or os.path.join(output_dir, 'dashboard_data')
+    os.makedirs(data_dir, exist_ok=True)
+    
+    jobs_list, buckets, stats = dashboard_stats(jobs_database)
+    facets, facet_counts = facet_index(jobs_list, buckets)
+    
+    rows = [job_row(job) for job in jobs_list]
+    pages = []
+    for start in range(0, len(rows), page_size):
+        page = f"jobs-{len(pages):03d}.json"
+        write_json_atomic(rows[start:start + page_size], os.path.join(data_dir, page))
+        pages.append(page)
+    
+    # Write the index last, so it never points at a page that isn't there yet
+    write_json_atomic({
+        'version': datetime.now().strftime('%Y%m%d%H%M%S'),
+        'total': len(rows),
+        'fields': APP_FIELDS,
+        'pages': pages,
+        'facets': facets,
+    }, os.path.join(data_dir, 'jobs.json'))
+    
+    # Pages left over from a longer history
+    for name in os.listdir(data_dir):
+        if name.startswith('jobs-') and name.endswith('.json') and name not in pages:
+            os.remove(os.path.join(data_dir, name))
+    
+    data_url = os.path.relpath(os.path.join(data_dir, 'jobs.json'), output_dir).replace(os.sep, '/')
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(render_page_head(stats, APP_CSS, facet_counts))
+        f.write(APP_SCRIPT.replace('__DATA_URL__', data_url).replace('__FACET_SCRIPT__', FACET_SCRIPT))
+    
+    print(f"✅ Dashboard generated: {output_path} (+ {len(pages)} data pages in {data_dir})")
+    print_dashboard_stats(stats)
+
+def job_row(job):
+    """A job as a compact row of APP_FIELDS values."""
+    analysis = job.get('ai_analysis', {})
+    return [
+        job.get('job_id', ''),
+        job.get('title', 'Untitled Position'),
+        job.get('company', 'Unknown Company'),
+        job.get('location', 'Unknown'),
+        job.get('url', '#'),
+        job.get('source', 'Unknown'),
+        job.get('match_score', 0),
+        analysis.get('role_category', 'N/A'),
+        analysis.get('reasoning', 'No detailed analysis available.'),
+        job.get('first_seen', '2000-01-01')[:19],
+    ]
+
+def write_json_atomic(data, path):
+    """Write compact JSON via a temp file, so readers never see half a file."""
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, separators=(',', ':'), ensure_ascii=False))
+    os.replace(tmp_file, path)
+
+def dashboard_stats(jobs_database):
+    """
+    Jobs in display order, each one's date bucket, and the header stats.
+    
+    Returns:
+        (jobs_list, buckets, stats)
+    """
+    
     # Convert jobs dict to list and sort by score and date
     jobs_list = list(jobs_database.values())
     jobs_list.sort(key=lambda x: (
@@ -25,19 +590,43 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
     total_jobs = len(jobs_list)
     today = datetime.now().date()
     
-    new_today = [j for j in jobs_list if datetime.fromisoformat(j.get('first_seen', '2000-01-01')).date() == today]
-    new_this_week = [j for j in jobs_list if datetime.fromisoformat(j.get('first_seen', '2000-01-01')).date() >= today - timedelta(days=7)]
+    today_iso, week_ago_iso = today.isoformat(), (today - timedelta(days=7)).isoformat()
+    buckets = [date_bucket(j.get('first_seen', '2000-01-01'), today_iso, week_ago_iso) for j in jobs_list]
+    new_today = [j for j, bucket in zip(jobs_list, buckets) if bucket == "today"]
+    new_this_week = [j for j, bucket in zip(jobs_list, buckets) if bucket != "old"]
     
     high_matches = [j for j in jobs_list if j.get('match_score', 0) >= 8]
     
     # Get last update time
     last_update = datetime.now().strftime('%B %d, %Y at %I:%M %p')
     
-    # Generate jobs HTML
-    jobs_html = generate_jobs_html(jobs_list)
+    stats = {
+        'total': total_jobs,
+        'new_today': len(new_today),
+        'new_this_week': len(new_this_week),
+        'high_matches': len(high_matches),
+        'last_update': last_update,
+    }
+    return jobs_list, buckets, stats
+
+def print_dashboard_stats(stats):
+    """Print the header stats after a dashboard build."""
+    print(f"   - Total jobs: {stats['total']}")
+    print(f"   - New today: {stats['new_today']}")
+    print(f"   - This week: {stats['new_this_week']}")
+    print(f"   - High matches: {stats['high_matches']}")
+
+def render_page_head(stats, extra_css="", facet_counts=None):
+    """
+    Everything up to and including the opening of the jobs container:
+    styles, header stats and filter buttons (with match counts, if given).
+    """
+    def count(facet, value):
+        if not facet_counts:
+            return ""
+        return f'<span class="facet-count">{facet_counts[facet][value]}</span>'
     
-    # Generate full HTML
-    html = f"""<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -162,6 +751,12 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
             border-color: transparent;
         }}
         
+        .facet-count {{
+            margin-left: 4px;
+            opacity: 0.7;
+            font-size: 11px;
+        }}
+        
         /* Jobs list */
         .jobs-container {{
             display: flex;
@@ -368,30 +963,30 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
             font-weight: bold;
             margin-left: 10px;
         }}
-    </style>
+{extra_css}    </style>
 </head>
 <body>
     <div class="container">
         <!-- Header -->
         <div class="header">
             <h1>🎯 Job Monitor Dashboard</h1>
-            <div class="subtitle">Last updated: {last_update}</div>
+            <div class="subtitle">Last updated: {stats['last_update']}</div>
             
             <div class="stats">
                 <div class="stat-card">
-                    <div class="number">{total_jobs}</div>
+                    <div class="number">{stats['total']}</div>
                     <div class="label">Total Jobs</div>
                 </div>
                 <div class="stat-card">
-                    <div class="number">{len(new_today)}</div>
+                    <div class="number">{stats['new_today']}</div>
                     <div class="label">New Today</div>
                 </div>
                 <div class="stat-card">
-                    <div class="number">{len(new_this_week)}</div>
+                    <div class="number">{stats['new_this_week']}</div>
                     <div class="label">This Week</div>
                 </div>
                 <div class="stat-card">
-                    <div class="number">{len(high_matches)}</div>
+                    <div class="number">{stats['high_matches']}</div>
                     <div class="label">High Matches (8+)</div>
                 </div>
             </div>
@@ -403,8 +998,8 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
                 <span class="filter-label">Date Range:</span>
                 <div class="filter-buttons">
                     <button class="filter-btn active" data-filter="date" data-value="all">All Jobs</button>
-                    <button class="filter-btn" data-filter="date" data-value="today">New Today</button>
-                    <button class="filter-btn" data-filter="date" data-value="week">This Week</button>
+                    <button class="filter-btn" data-filter="date" data-value="today">New Today{count("date", "today")}</button>
+                    <button class="filter-btn" data-filter="date" data-value="week">This Week{count("date", "week")}</button>
                     <button class="filter-btn" data-filter="date" data-value="applied">Applied</button>
                 </div>
             </div>
@@ -413,10 +1008,10 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
                 <span class="filter-label">Score:</span>
                 <div class="filter-buttons">
                     <button class="filter-btn active" data-filter="score" data-value="all">All Scores</button>
-                    <button class="filter-btn" data-filter="score" data-value="9">9-10</button>
-                    <button class="filter-btn" data-filter="score" data-value="8">8+</button>
-                    <button class="filter-btn" data-filter="score" data-value="7">7+</button>
-                    <button class="filter-btn" data-filter="score" data-value="6">6+</button>
+                    <button class="filter-btn" data-filter="score" data-value="9">9-10{count("score", "9")}</button>
+                    <button class="filter-btn" data-filter="score" data-value="8">8+{count("score", "8")}</button>
+                    <button class="filter-btn" data-filter="score" data-value="7">7+{count("score", "7")}</button>
+                    <button class="filter-btn" data-filter="score" data-value="6">6+{count("score", "6")}</button>
                 </div>
             </div>
             
@@ -424,9 +1019,9 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
                 <span class="filter-label">Location:</span>
                 <div class="filter-buttons">
                     <button class="filter-btn active" data-filter="location" data-value="all">All Locations</button>
-                    <button class="filter-btn" data-filter="location" data-value="usa">USA</button>
-                    <button class="filter-btn" data-filter="location" data-value="singapore">Singapore</button>
-                    <button class="filter-btn" data-filter="location" data-value="dubai">Dubai</button>
+                    <button class="filter-btn" data-filter="location" data-value="usa">USA{count("location", "usa")}</button>
+                    <button class="filter-btn" data-filter="location" data-value="singapore">Singapore{count("location", "singapore")}</button>
+                    <button class="filter-btn" data-filter="location" data-value="dubai">Dubai{count("location", "dubai")}</button>
                 </div>
             </div>
             
@@ -434,216 +1029,84 @@ def generate_dashboard(jobs_database, output_path="/home/claude/job-monitor/dash
                 <span class="filter-label">Source:</span>
                 <div class="filter-buttons">
                     <button class="filter-btn active" data-filter="source" data-value="all">All Sources</button>
-                    <button class="filter-btn" data-filter="source" data-value="greenhouse">Greenhouse</button>
-                    <button class="filter-btn" data-filter="source" data-value="adzuna">Adzuna</button>
+                    <button class="filter-btn" data-filter="source" data-value="greenhouse">Greenhouse{count("source", "greenhouse")}</button>
+                    <button class="filter-btn" data-filter="source" data-value="adzuna">Adzuna{count("source", "adzuna")}</button>
                 </div>
             </div>
         </div>
         
         <!-- Jobs List -->
         <div class="jobs-container" id="jobsContainer">
-            {jobs_html}
-        </div>
-    </div>
-    
-    <script>
-        // Track applied jobs in localStorage
-        const appliedJobs = new Set(JSON.parse(localStorage.getItem('appliedJobs') || '[]'));
-        
-        // Mark already applied jobs
-        appliedJobs.forEach(jobId => {{
-            const card = document.querySelector(`[data-job-id="${{jobId}}"]`);
-            if (card) {{
-                card.classList.add('applied');
-                const btn = card.querySelector('.mark-applied-btn');
-                if (btn) {{
-                    btn.textContent = '✓ Applied';
-                    btn.classList.remove('btn-secondary');
-                    btn.classList.add('btn-success');
-                }}
-            }}
-        }});
-        
-        // Handle "Mark as Applied" buttons
-        document.querySelectorAll('.mark-applied-btn').forEach(btn => {{
-            btn.addEventListener('click', (e) => {{
-                e.preventDefault();
-                const jobId = btn.dataset.jobId;
-                const card = document.querySelector(`[data-job-id="${{jobId}}"]`);
-                
-                if (appliedJobs.has(jobId)) {{
-                    // Unapply
-                    appliedJobs.delete(jobId);
-                    card.classList.remove('applied');
-                    btn.textContent = 'Mark as Applied';
-                    btn.classList.remove('btn-success');
-                    btn.classList.add('btn-secondary');
-                }} else {{
-                    // Apply
-                    appliedJobs.add(jobId);
-                    card.classList.add('applied');
-                    btn.textContent = '✓ Applied';
-                    btn.classList.remove('btn-secondary');
-                    btn.classList.add('btn-success');
-                }}
-                
-                localStorage.setItem('appliedJobs', JSON.stringify([...appliedJobs]));
-            }});
-        }});
-        
-        // Filtering logic
-        let filters = {{
-            date: 'all',
-            score: 'all',
-            location: 'all',
-            source: 'all'
-        }};
-        
-        // Filter button handlers
-        document.querySelectorAll('.filter-btn').forEach(btn => {{
-            btn.addEventListener('click', () => {{
-                const filterType = btn.dataset.filter;
-                const filterValue = btn.dataset.value;
-                
-                // Update active state
-                document.querySelectorAll(`[data-filter="${{filterType}}"]`).forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
-                
-                // Update filter
-                filters[filterType] = filterValue;
-                
-                // Apply filters
-                applyFilters();
-            }});
-        }});
-        
-        function applyFilters() {{
-            const jobs = document.querySelectorAll('.job-card');
-            let visibleCount = 0;
-            
-            jobs.forEach(job => {{
-                let show = true;
-                
-                // Date filter
-                if (filters.date !== 'all') {{
-                    const dateFilter = job.dataset.dateFilter;
-                    if (filters.date === 'today' && dateFilter !== 'today') show = false;
-                    if (filters.date === 'week' && dateFilter !== 'today' && dateFilter !== 'week') show = false;
-                    if (filters.date === 'applied' && !job.classList.contains('applied')) show = false;
-                }}
-                
-                // Score filter
-                if (filters.score !== 'all') {{
-                    const score = parseInt(job.dataset.score);
-                    const minScore = parseInt(filters.score);
-                    if (score < minScore) show = false;
-                }}
-                
-                // Location filter
-                if (filters.location !== 'all') {{
-                    const location = job.dataset.location.toLowerCase();
-                    if (!location.includes(filters.location)) show = false;
-                }}
-                
-                // Source filter
-                if (filters.source !== 'all') {{
-                    const source = job.dataset.source.toLowerCase();
-                    if (!source.includes(filters.source)) show = false;
-                }}
-                
-                // Show/hide job
-                job.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
-            
-            // Show "no jobs" message if nothing visible
-            const container = document.getElementById('jobsContainer');
-            let noJobsMsg = container.querySelector('.no-jobs');
-            
-            if (visibleCount === 0) {{
-                if (!noJobsMsg) {{
-                    noJobsMsg = document.createElement('div');
-                    noJobsMsg.className = 'no-jobs';
-                    noJobsMsg.innerHTML = '<div class="no-jobs-icon">🔍</div><p>No jobs match your current filters.</p><p style="margin-top: 10px; font-size: 14px;">Try adjusting your filters above.</p>';
-                    container.appendChild(noJobsMsg);
-                }}
-            }} else {{
-                if (noJobsMsg) noJobsMsg.remove();
-            }}
-        }}
-    </script>
-</body>
-</html>
-"""
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    print(f"✅ Dashboard generated: {output_path}")
-    print(f"   - Total jobs: {total_jobs}")
-    print(f"   - New today: {len(new_today)}")
-    print(f"   - This week: {len(new_this_week)}")
-    print(f"   - High matches: {len(high_matches)}")
+            """
 
 def generate_jobs_html(jobs_list):
     """Generate HTML for individual job cards."""
+    return b''.join(generate_job_cards(jobs_list)).decode('utf-8')
+
+def generate_job_cards(jobs_list, buckets=None):
+    """
+    Rendered job cards, as a list of UTF-8 encoded chunks.
+    
+    Args:
+        jobs_list: Jobs, in display order
+        buckets: Optional date bucket of each job (see date_bucket)
+    """
     
     if not jobs_list:
-        return """
+        return ["""
         <div class="no-jobs">
             <div class="no-jobs-icon">📭</div>
             <p>No jobs in database yet.</p>
             <p style="margin-top: 10px; font-size: 14px;">Jobs will appear here after the first monitoring run.</p>
         </div>
-        """
+        """.encode('utf-8')]
     
-    today = datetime.now().date()
-    week_ago = today - timedelta(days=7)
-    
-    jobs_html = ""
-    
-    for job in jobs_list:
-        score = job.get('match_score', 0)
-        analysis = job.get('ai_analysis', {})
-        
-        # Score badge
-        if score >= 9:
-            score_class = "score-9-10"
-            score_emoji = "🔥"
-        elif score >= 7:
-            score_class = "score-7-8"
-            score_emoji = "⚡"
-        else:
-            score_class = "score-6"
-            score_emoji = "✓"
-        
-        # Date filtering
-        job_date = datetime.fromisoformat(job.get('first_seen', '2000-01-01')).date()
-        if job_date == today:
-            date_filter = "today"
-            new_badge = '<span class="new-today">NEW TODAY</span>'
-        elif job_date >= week_ago:
-            date_filter = "week"
-            new_badge = ""
-        else:
-            date_filter = "old"
-            new_badge = ""
-        
-        # Reasoning
-        reasoning = analysis.get('reasoning', 'No detailed analysis available.')
-        
-        # Meta tags
-        category = analysis.get('role_category', 'N/A').replace('_', ' ').title()
-        source = job.get('source', 'Unknown')
-        
-        # Clean location for filtering
-        location = job.get('location', 'Unknown')
-        
-        # Date display
-        date_display = datetime.fromisoformat(job.get('first_seen', '2000-01-01')).strftime('%B %d, %Y at %I:%M %p')
-        
-        jobs_html += f"""
+    if buckets is None:
+        today = datetime.now().date()
+        buckets = [date_bucket(job.get('first_seen', '2000-01-01'), today.isoformat(),
+                               (today - timedelta(days=7)).isoformat()) for job in jobs_list]
+    
+    return [render_job_card(job, date_filter).encode('utf-8') for job, date_filter in zip(jobs_list, buckets)]
+
+def render_job_card(job, date_filter):
+    """
+    HTML for one job card.
+    
+    Args:
+        job: Job dictionary
+        date_filter: The job's date bucket ('today', 'week' or 'old')
+    """
+    score = job.get('match_score', 0)
+    analysis = job.get('ai_analysis', {})
+    
+    # Score badge
+    if score >= 9:
+        score_class = "score-9-10"
+        score_emoji = "🔥"
+    elif score >= 7:
+        score_class = "score-7-8"
+        score_emoji = "⚡"
+    else:
+        score_class = "score-6"
+        score_emoji = "✓"
+    
+    # Date filtering
+    new_badge = '<span class="new-today">NEW TODAY</span>' if date_filter == "today" else ""
+    
+    # Reasoning
+    reasoning = analysis.get('reasoning', 'No detailed analysis available.')
+    
+    # Meta tags
+    category = analysis.get('role_category', 'N/A').replace('_', ' ').title()
+    source = job.get('source', 'Unknown')
+    
+    # Clean location for filtering
+    location = job.get('location', 'Unknown')
+    
+    # Date display
+    date_display = datetime.fromisoformat(job.get('first_seen', '2000-01-01')).strftime('%B %d, %Y at %I:%M %p')
+    
+    return f"""
         <div class="job-card" 
              data-job-id="{job.get('job_id', '')}"
              data-score="{score}"
@@ -686,8 +1149,6 @@ def generate_jobs_html(jobs_list):
             </div>
         </div>
         """
-    
-    return jobs_html
 
 if __name__ == "__main__":
     # Test dashboard generation
@@ -5,6 +5,9 @@ import json
 import os
 from datetime import datetime
 import hashlib
+import time
+from job_store import SQLiteJobStore
+from job_record import JobRecord
 
 def get_job_id(job):
     """
@@ -14,38 +17,459 @@ def get_job_id(job):
     key = f"{job.get('title', '')}_{job.get('company', '')}_{job.get('location', '')}"
     return hashlib.md5(key.encode()).hexdigest()
 
+def get_log_file(database_file):
+    """
+    Path of the append-only log that sits next to the database snapshot.
+    e.g. jobs_seen.json -> jobs_seen.log.jsonl
+    """
+    return os.path.splitext(database_file)[0] + ".log.jsonl"
+
+def is_sqlite_database(database_file):
+    """True if database_file should use the SQLite backend (by extension)."""
+    return database_file.endswith(('.db', '.sqlite', '.sqlite3'))
+
 def load_seen_jobs(database_file="/home/claude/job-monitor/jobs_seen.json"):
     """
     Load database of previously seen jobs.
     
+    JSON backend: reads the last compacted snapshot, then replays the
+    append-only log on top of it (later lines win).
+    SQLite backend (.db/.sqlite file): opens the database; on first use it
+    imports an existing jobs_seen.json sitting next to it.
+    
     Returns:
-        Dictionary mapping job_id -> job data
+        Dictionary (or dict-like SQLiteJobStore) mapping job_id -> job data
     """
-    if not os.path.exists(database_file):
-        return {}
+    if is_sqlite_database(database_file):
+        store = SQLiteJobStore(database_file)
+        
+        json_file = os.path.splitext(database_file)[0] + ".json"
+        has_json = os.path.exists(json_file) or os.path.exists(get_log_file(json_file))
+        if len(store) == 0 and has_json:
+            print(f"📦 Migrating {json_file} into SQLite")
+            # Older entries have no 'job_id' field; their key is the id
+            store.put_many({**job, 'job_id': job_id} for job_id, job in load_seen_jobs(json_file).items())
+        
+        print(f"📂 Loaded {len(store)} previously seen jobs")
+        return store
+    
+    data = {}
     
     try:
-        with open(database_file, 'r') as f:
-            data = json.load(f)
+        data = dict(_iter_snapshot(database_file))
+    except Exception as e:
+        print(f"⚠️  Error loading database: {e}")
+        data = {}
+    
+    replayed = 0
+    
+    try:
+        for job in _iter_log(database_file):
+            data[job['job_id']] = job
+            replayed += 1
+    except Exception as e:
+        print(f"⚠️  Error replaying database log: {e}")
+    
+    if data:
         print(f"📂 Loaded {len(data)} previously seen jobs")
-        return data
+    if replayed:
+        print(f"   (replayed {replayed} entries from log)")
+    
+    return data
+
+def load_seen_job_ids(database_file="/home/claude/job-monitor/jobs_seen.json"):
+    """
+    Load only the job_ids of previously seen jobs - all dedup needs.
+    
+    JSON backend: streams the snapshot a line at a time and decodes just
+    each entry's key, so memory stays flat however long the history gets.
+    SQLite backend: returns the store itself; membership is a primary-key
+    lookup and nothing is read into memory.
+    
+    Returns:
+        Set of job_ids (or SQLiteJobStore)
+    """
+    if is_sqlite_database(database_file):
+        return load_seen_jobs(database_file)
+    
+    job_ids = set()
+    
+    try:
+        job_ids.update(job_id for job_id, _ in _iter_snapshot(database_file, ids_only=True))
     except Exception as e:
         print(f"⚠️  Error loading database: {e}")
-        return {}
+    
+    try:
+        job_ids.update(job['job_id'] for job in _iter_log(database_file))
+    except Exception as e:
+        print(f"⚠️  Error replaying database log: {e}")
+    
+    if job_ids:
+        print(f"📂 Loaded {len(job_ids)} previously seen job ids")
+    
+    return job_ids
+
+def load_seen_records(database_file="/home/claude/job-monitor/jobs_seen.json", since=None):
+    """
+    Load previously seen jobs as compact JobRecords (raw_html dropped).
+    
+    JobRecords answer .get()/[] like job dicts, so the result can go
+    straight to generate_dashboard.
+    
+    Args:
+        database_file: Path to database file
+        since: Optional ISO timestamp; only jobs first seen at or after it
+    
+    Returns:
+        Dictionary mapping job_id -> JobRecord
+    """
+    records = {}
+    
+    try:
+        for job in iter_seen_jobs(database_file, since):
+            records[job['job_id']] = JobRecord.from_dict(job)
+    except Exception as e:
+        print(f"⚠️  Error loading database: {e}")
+    
+    print(f"📂 Loaded {len(records)} job records")
+    return records
+
+def iter_seen_jobs(database_file="/home/claude/job-monitor/jobs_seen.json", since=None):
+    """
+    Yield stored jobs one at a time, without loading the whole database.
+    
+    Args:
+        database_file: Path to database file
+        since: Optional ISO timestamp; only jobs first seen at or after it
+    
+    Yields:
+        Job dictionaries
+    """
+    if is_sqlite_database(database_file):
+        store = SQLiteJobStore(database_file)
+        try:
+            yield from store.iter_jobs_since(since or '')
+        finally:
+            store.close()
+        return
+    
+    # The log is small (compaction keeps it that way) and its entries win
+    logged = {}
+    for job in _iter_log(database_file):
+        logged[job['job_id']] = job
+    
+    for job_id, job in _iter_snapshot(database_file):
+        if job_id in logged:
+            continue
+        if since is None or job.get('first_seen', '2000-01-01') >= since:
+            yield job
+    
+    for job in logged.values():
+        if since is None or job.get('first_seen', '2000-01-01') >= since:
+            yield job
+
+def _iter_snapshot(database_file, ids_only=False):
+    """
+    Yield (job_id, job) pairs from the snapshot file.
+    
+    Snapshots are written one entry per line (see _write_snapshot), so they
+    can be read incrementally; older pretty-printed snapshots are loaded whole.
+    With ids_only, only the key of each line is decoded and job is None.
+    """
+    for job_id, job in _read_snapshot(database_file, ids_only):
+        if job is not None:
+            # Entries from older versions only carry the id as their key
+            job.setdefault('job_id', job_id)
+        yield job_id, job
+
+def _read_snapshot(database_file, ids_only):
+    if not os.path.exists(database_file):
+        return
+    
+    decoder = json.JSONDecoder()
+    
+    with open(database_file, 'r') as f:
+        if f.readline().strip() != '{':
+            f.seek(0)
+            yield from json.load(f).items()
+            return
+        
+        for n, line in enumerate(f):
+            line = line.strip()
+            if not line or line == '}':
+                continue
+            
+            try:
+                if ids_only and n > 0:
+                    job_id, _ = decoder.raw_decode(line)
+                    job = None
+                else:
+                    job_id, job = json.loads('{' + line.rstrip(',') + '}').popitem()
+            except json.JSONDecodeError:
+                if n > 0:
+                    raise
+                # Pretty-printed snapshot from before streaming reads
+                f.seek(0)
+                yield from json.load(f).items()
+                return
+            
+            yield job_id, job
+
+def _iter_log(database_file):
+    """Yield jobs from the append-only log, oldest first."""
+    log_file = get_log_file(database_file)
+    if not os.path.exists(log_file):
+        return
+    
+    with open(log_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn write from a crashed run - skip it
+                continue
+            # A line is either one job or a whole committed batch
+            yield from record['jobs'] if 'jobs' in record else [record]
+
+def _write_snapshot(jobs, database_file):
+    """
+    Atomically write jobs as the new snapshot and drop the log.
+    
+    The file is a JSON object, one "job_id": {job} entry per line, so it
+    can still be json.load()ed but can also be streamed.
+    
+    Returns:
+        Number of jobs written
+    """
+    os.makedirs(os.path.dirname(database_file), exist_ok=True)
+    
+    count = 0
+    tmp_file = database_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        f.write('{')
+        for job in jobs:
+            f.write(',\n' if count else '\n')
+            f.write(f"{json.dumps(job['job_id'])}: {json.dumps(job)}")
+            count += 1
+        f.write('\n}\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, database_file)
+    
+    log_file = get_log_file(database_file)
+    if os.path.exists(log_file):
+        os.remove(log_file)
+    
+    return count
 
 def save_seen_jobs(seen_jobs, database_file="/home/claude/job-monitor/jobs_seen.json"):
     """
     Save seen jobs database to disk.
+    
+    Writes a full snapshot (to a temp file, then atomically swapped in)
+    and truncates the append-only log, since everything in it is now
+    part of the snapshot. SQLite stores are already durable.
+    """
+    if isinstance(seen_jobs, SQLiteJobStore):
+        print(f"💾 {len(seen_jobs)} jobs in database")
+        return
+    
+    try:
+        count = _write_snapshot(seen_jobs.values(), database_file)
+        print(f"💾 Saved {count} jobs to database")
+    except Exception as e:
+        print(f"❌ Error saving database: {e}")
+
+def close_seen_jobs(seen_jobs):
+    """
+    Release the database at the end of a run. For SQLite this checkpoints
+    the WAL back into the main file, so only jobs_seen.db needs committing.
+    """
+    if isinstance(seen_jobs, SQLiteJobStore):
+        seen_jobs.close()
+
+def append_job_to_log(job, database_file="/home/claude/job-monitor/jobs_seen.json"):
+    """
+    Append a single job to the database log.
+    Costs one append + one fsync, regardless of database size.
+    """
+    _append_log_line(job, database_file)
+
+def append_jobs_to_log(jobs, database_file="/home/claude/job-monitor/jobs_seen.json"):
+    """
+    Append several jobs to the database log as ONE line.
+    A crash mid-write leaves a torn line that load_seen_jobs skips, so the
+    batch is applied all-or-nothing.
     """
+    _append_log_line({'jobs': jobs}, database_file)
+
+def _append_log_line(record, database_file):
+    """Append one line to the log and fsync it. Raises if the write fails."""
     try:
-        # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(database_file), exist_ok=True)
         
-        with open(database_file, 'w') as f:
-            json.dump(seen_jobs, f, indent=2)
-        print(f"💾 Saved {len(seen_jobs)} jobs to database")
+        log_file = get_log_file(database_file)
+        line = json.dumps(record) + "\n"
+        if not _log_ends_with_newline(log_file):
+            # Close off a torn write from a crashed run, so this record
+            # starts its own line instead of being glued onto the fragment
+            line = "\n" + line
+        
+        with open(log_file, 'a') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
     except Exception as e:
-        print(f"❌ Error saving database: {e}")
+        print(f"❌ Error appending to database log: {e}")
+        raise
+
+def _log_ends_with_newline(log_file):
+    """True if the log is empty/missing or its last line is complete."""
+    if not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
+        return True
+    with open(log_file, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+def compact_seen_jobs(seen_jobs, database_file="/home/claude/job-monitor/jobs_seen.json",
+                      force=False, max_log_ratio=0.5):
+    """
+    Fold the append-only log back into the snapshot.
+    
+    Only rewrites the snapshot when the log has grown past max_log_ratio
+    of the snapshot size (or when forced, e.g. after cleanup removed jobs).
+    
+    Args:
+        seen_jobs: Current database
+        database_file: Path to database file
+        force: Compact even if the log is small
+        max_log_ratio: Log size (relative to snapshot) that triggers compaction
+    
+    Returns:
+        True if the snapshot was rewritten
+    """
+    if isinstance(seen_jobs, SQLiteJobStore):
+        return False
+    
+    if not force and not _log_needs_compaction(database_file, max_log_ratio):
+        return False
+    
+    print(f"🗜️  Compacting database log ({_log_size(database_file)} bytes)")
+    save_seen_jobs(seen_jobs, database_file)
+    return True
+
+def prune_seen_jobs(database_file="/home/claude/job-monitor/jobs_seen.json", days_to_keep=90,
+                    max_log_ratio=0.5):
+    """
+    Streaming equivalent of cleanup_old_jobs + compact_seen_jobs: drops jobs
+    older than days_to_keep and folds the log into the snapshot, reading and
+    writing one job at a time instead of holding the database in memory.
+    
+    Args:
+        database_file: Path to database file
+        days_to_keep: Keep jobs from last N days
+        max_log_ratio: Log size (relative to snapshot) that triggers compaction
+    
+    Returns:
+        Number of jobs removed
+    """
+    from datetime import timedelta
+    
+    if is_sqlite_database(database_file):
+        store = load_seen_jobs(database_file)
+        total = len(store)
+        cleanup_old_jobs(store, days_to_keep)
+        removed_count = total - len(store)
+        store.close()
+        return removed_count
+    
+    cutoff = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
+    
+    removed_count = 0
+    for job in iter_seen_jobs(database_file):
+        if job.get('first_seen', '2000-01-01') < cutoff:
+            removed_count += 1
+    
+    if removed_count > 0:
+        print(f"🧹 Cleaned {removed_count} old jobs from database")
+    
+    if removed_count or _log_needs_compaction(database_file, max_log_ratio):
+        print(f"🗜️  Compacting database log ({_log_size(database_file)} bytes)")
+        try:
+            count = _write_snapshot(iter_seen_jobs(database_file, since=cutoff), database_file)
+            print(f"💾 Saved {count} jobs to database")
+        except Exception as e:
+            print(f"❌ Error saving database: {e}")
+    
+    return removed_count
+
+def _log_size(database_file):
+    log_file = get_log_file(database_file)
+    return os.path.getsize(log_file) if os.path.exists(log_file) else 0
+
+def _log_needs_compaction(database_file, max_log_ratio):
+    """True once the log has grown past max_log_ratio of the snapshot size."""
+    log_size = _log_size(database_file)
+    if log_size == 0:
+        return False
+    snapshot_size = os.path.getsize(database_file) if os.path.exists(database_file) else 0
+    return not snapshot_size or log_size >= snapshot_size * max_log_ratio
+
+def load_rejected_jobs(rejected_file="/home/claude/job-monitor/jobs_rejected.json", ttl_days=30):
+    """
+    Load the negative cache of jobs the AI filter already rejected.
+    Entries older than ttl_days are dropped so reposted/edited jobs
+    eventually get rescored.
+    
+    Returns:
+        Dictionary mapping job_id -> rejection time (epoch seconds)
+    """
+    if not os.path.exists(rejected_file):
+        return {}
+    
+    try:
+        with open(rejected_file, 'r') as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"⚠️  Error loading rejected jobs: {e}")
+        return {}
+    
+    cutoff = time.time() - ttl_days * 86400
+    rejected = {job_id: ts for job_id, ts in data.items() if ts >= cutoff}
+    
+    expired = len(data) - len(rejected)
+    print(f"📂 Loaded {len(rejected)} previously rejected jobs" + (f" ({expired} expired)" if expired else ""))
+    return rejected
+
+def save_rejected_jobs(rejected_jobs, rejected_file="/home/claude/job-monitor/jobs_rejected.json"):
+    """
+    Save the rejected-jobs cache to disk (compact JSON, atomic replace).
+    """
+    try:
+        os.makedirs(os.path.dirname(rejected_file), exist_ok=True)
+        
+        tmp_file = rejected_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(rejected_jobs, f, separators=(',', ':'))
+        os.replace(tmp_file, rejected_file)
+    except Exception as e:
+        print(f"❌ Error saving rejected jobs: {e}")
+
+def mark_rejected_jobs(jobs, rejected_jobs):
+    """
+    Record jobs that were scored but did not match, so filter_new_jobs
+    skips them on later runs.
+    
+    Args:
+        jobs: List of rejected job dictionaries
+        rejected_jobs: Rejected-jobs cache (modified in place)
+    """
+    now = int(time.time())
+    for job in jobs:
+        rejected_jobs[get_job_id(job)] = now
 
 def is_new_job(job, seen_jobs):
     """
@@ -65,6 +489,9 @@ def save_new_job(job, seen_jobs, database_file="/home/claude/job-monitor/jobs_se
     """
     Add a new job to the database and save.
     
+    The job is appended to the database log rather than rewriting the
+    whole file; compact_seen_jobs folds the log back in periodically.
+    
     Args:
         job: Job dictionary
         seen_jobs: Current database
@@ -76,30 +503,97 @@ def save_new_job(job, seen_jobs, database_file="/home/claude/job-monitor/jobs_se
     job['job_id'] = job_id
     job['first_seen'] = datetime.now().isoformat()
     
+    # Persist to disk first (SQLite stores write through on assignment)
+    if not isinstance(seen_jobs, SQLiteJobStore):
+        append_job_to_log(job, database_file)
+    
     # Save to database
     seen_jobs[job_id] = job
+
+def save_new_jobs(jobs, seen_jobs, database_file="/home/claude/job-monitor/jobs_seen.json"):
+    """
+    Add a run's (or tier's) matched jobs to the database in one atomic commit.
     
-    # Persist to disk
-    save_seen_jobs(seen_jobs, database_file)
+    JSON backend: one log line (one append + one fsync) for the whole batch;
+    a torn line left by an earlier crash is closed off first, so it can't
+    take this batch with it.
+    SQLite backend: one transaction.
+    
+    If the commit fails the error is raised and seen_jobs is left as it
+    was, so the caller can treat the jobs as not saved.
+    
+    Args:
+        jobs: List of job dictionaries
+        seen_jobs: Current database (or job_id set from load_seen_job_ids)
+        database_file: Path to database file
+    """
+    if not jobs:
+        return
+    
+    first_seen = datetime.now().isoformat()
+    for job in jobs:
+        # Add metadata
+        job['job_id'] = get_job_id(job)
+        job['first_seen'] = first_seen
+    
+    if isinstance(seen_jobs, SQLiteJobStore):
+        seen_jobs.put_many(jobs)
+    else:
+        append_jobs_to_log(jobs, database_file)
+        for job in jobs:
+            if isinstance(seen_jobs, set):
+                # Id-only database from load_seen_job_ids
+                seen_jobs.add(job['job_id'])
+            else:
+                seen_jobs[job['job_id']] = job
+    
+    print(f"💾 Committed {len(jobs)} new jobs to database")
 
-def filter_new_jobs(jobs, seen_jobs):
+def open_seen_database(database_file, days_to_keep=90):
+    """
+    Start-of-run database setup: prune and compact, then load what dedup needs.
+    
+    Args:
+        database_file: Path to database file
+        days_to_keep: Keep jobs from last N days
+    
+    Returns:
+        Set of job_ids (or SQLiteJobStore), see load_seen_job_ids
+    """
+    # Clean up old jobs and fold the append-only log into the snapshot,
+    # streaming one job at a time
+    prune_seen_jobs(database_file, days_to_keep=days_to_keep)
+    
+    # Dedup only needs job_ids, so don't load the job bodies
+    return load_seen_job_ids(database_file)
+
+def filter_new_jobs(jobs, seen_jobs, rejected_jobs=None):
     """
     Filter list of jobs to only new ones we haven't seen before.
     
     Args:
         jobs: List of job dictionaries
         seen_jobs: Database of seen jobs
+        rejected_jobs: Optional cache of previously rejected job_ids
     
     Returns:
         List of only new jobs
     """
     new_jobs = []
+    skipped_rejected = 0
     
     for job in jobs:
-        if is_new_job(job, seen_jobs):
-            new_jobs.append(job)
+        job_id = get_job_id(job)
+        if job_id in seen_jobs:
+            continue
+        if rejected_jobs and job_id in rejected_jobs:
+            skipped_rejected += 1
+            continue
+        new_jobs.append(job)
     
     print(f"🆕 Found {len(new_jobs)} new jobs (out of {len(jobs)} total)")
+    if skipped_rejected:
+        print(f"   (skipped {skipped_rejected} previously rejected)")
     
     return new_jobs
 
@@ -111,6 +605,10 @@ def get_jobs_by_date_range(seen_jobs, days_back=7):
     from datetime import datetime, timedelta
     
     cutoff = datetime.now() - timedelta(days=days_back)
+    
+    if isinstance(seen_jobs, SQLiteJobStore):
+        return seen_jobs.jobs_since(cutoff.isoformat())
+    
     recent_jobs = []
     
     for job_id, job in seen_jobs.items():
@@ -134,6 +632,13 @@ def cleanup_old_jobs(seen_jobs, days_to_keep=90):
     from datetime import datetime, timedelta
     
     cutoff = datetime.now() - timedelta(days=days_to_keep)
+    
+    if isinstance(seen_jobs, SQLiteJobStore):
+        removed_count = seen_jobs.delete_older_than(cutoff.isoformat())
+        if removed_count > 0:
+            print(f"🧹 Cleaned {removed_count} old jobs from database")
+        return seen_jobs
+    
     cleaned = {}
     removed_count = 0
     
@@ -0,0 +1,180 @@
+# job_record.py
+# Compact in-memory representation of a stored job
+
+import sys
+from datetime import datetime, timedelta
+
+# Short, endlessly repeated values: one shared string object per distinct value
+INTERNED_FIELDS = ('company', 'company_slug', 'location', 'source', 'department',
+                   'search_category', 'geography')
+TEXT_FIELDS = ('title', 'url', 'description')
+# ISO strings in the dict schema, microseconds since 1970 in a JobRecord
+TIMESTAMP_FIELDS = ('first_seen', 'date_found')
+# ai_analysis is flattened into slots; any other keys it carries go in analysis_extra
+ANALYSIS_FIELDS = ('score', 'is_match', 'role_category', 'reasoning', 'key_strengths', 'concerns')
+
+_shared_phrases = {}
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _intern_phrases(phrases):
+    """
+    Tuple of interned strings, shared between records with the same list
+    (key_strengths/concerns repeat a lot, especially for keyword fallbacks).
+    """
+    phrases = tuple(_intern(phrase) for phrase in phrases or ())
+    return _shared_phrases.setdefault(phrases, phrases)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_epoch(value):
+    """
+    Naive ISO timestamp -> integer microseconds since 1970 (no time zone
+    conversion). Raises ValueError unless _from_epoch gives value back exactly.
+    """
+    epoch = (datetime.fromisoformat(value) - _EPOCH) // _MICROSECOND
+    if _from_epoch(epoch) != value:
+        raise ValueError(f"{value!r} doesn't round-trip")
+    return epoch
+
+def _from_epoch(value):
+    return (_EPOCH + value * _MICROSECOND).isoformat()
+
+class JobRecord:
+    """
+    A stored job in a fraction of the memory of its dict.
+
+    __slots__ instead of a per-job dict, interned enum-like fields, epoch
+    timestamps, the MD5 job_id as 16 raw bytes, and raw_html dropped unless
+    asked for. Fields this class doesn't know about are kept in `extra`, so
+    from_dict/to_dict round-trip.
+
+    get() and [] answer in the dict schema (hex job_id, ISO timestamps, an
+    ai_analysis dict), so code written against job dicts, like the dashboard
+    and alerter, can take JobRecords as they are. As with the dashboard's own
+    .get() calls, a None value reads as missing.
+    """
+
+    __slots__ = ('job_digest',) + TEXT_FIELDS + INTERNED_FIELDS + TIMESTAMP_FIELDS + (
+        'match_score', 'has_analysis') + ANALYSIS_FIELDS + ('analysis_extra', 'raw_html', 'extra')
+
+    @classmethod
+    def from_dict(cls, job, keep_raw_html=False):
+        """
+        Build a JobRecord from a job dictionary.
+
+        Args:
+            job: Job dictionary (as stored in jobs_seen.json)
+            keep_raw_html: Keep the scraper's raw_html debugging snippet
+
+        Returns:
+            JobRecord
+        """
+        record = cls.__new__(cls)
+        extra = {}
+
+        job_id = job.get('job_id')
+        try:
+            record.job_digest = bytes.fromhex(job_id) if job_id is not None else None
+        except ValueError:
+            record.job_digest = None
+            extra['job_id'] = job_id
+
+        for name in TEXT_FIELDS:
+            setattr(record, name, job.get(name))
+        for name in INTERNED_FIELDS:
+            setattr(record, name, _intern(job.get(name)))
+
+        for name in TIMESTAMP_FIELDS:
+            value = job.get(name)
+            try:
+                value = _to_epoch(value) if value is not None else None
+            except (TypeError, ValueError):
+                extra[name] = value
+                value = None
+            setattr(record, name, value)
+
+        record.match_score = job.get('match_score')
+        record.raw_html = job.get('raw_html') if keep_raw_html else None
+
+        analysis = job.get('ai_analysis')
+        record.has_analysis = analysis is not None
+        analysis = analysis or {}
+        record.score = analysis.get('score')
+        record.is_match = analysis.get('is_match')
+        record.role_category = _intern(analysis.get('role_category'))
+        record.reasoning = analysis.get('reasoning')
+        record.key_strengths = _intern_phrases(analysis.get('key_strengths'))
+        record.concerns = _intern_phrases(analysis.get('concerns'))
+        record.analysis_extra = {
+            key: value for key, value in analysis.items() if key not in ANALYSIS_FIELDS
+        } or None
+
+        known = set(cls.__slots__) | {'job_id', 'ai_analysis'}
+        for key, value in job.items():
+            if key not in known and value is not None:
+                extra[key] = value
+        record.extra = extra or None
+
+        return record
+
+    @property
+    def job_id(self):
+        return self.job_digest.hex() if self.job_digest is not None else None
+
+    def analysis_dict(self):
+        """ai_analysis in the dict schema, or None."""
+        if not self.has_analysis:
+            return None
+        analysis = {name: getattr(self, name) for name in ANALYSIS_FIELDS}
+        analysis['key_strengths'] = list(self.key_strengths)
+        analysis['concerns'] = list(self.concerns)
+        if self.analysis_extra:
+            analysis.update(self.analysis_extra)
+        return analysis
+
+    def get(self, key, default=None):
+        """dict.get in the dict schema."""
+        if key == 'job_id':
+            value = self.job_id
+        elif key in TIMESTAMP_FIELDS:
+            value = getattr(self, key)
+            value = _from_epoch(value) if value is not None else None
+        elif key == 'ai_analysis':
+            value = self.analysis_dict()
+        elif key in TEXT_FIELDS or key in INTERNED_FIELDS or key in ('match_score', 'raw_html'):
+            value = getattr(self, key)
+        else:
+            value = None
+
+        if value is None and self.extra:
+            value = self.extra.get(key)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def to_dict(self):
+        """Convert back to the job dictionary schema."""
+        job = {}
+        for name in ('job_id',) + TEXT_FIELDS + INTERNED_FIELDS + TIMESTAMP_FIELDS + ('match_score', 'raw_html'):
+            value = self.get(name)
+            if value is not None:
+                job[name] = value
+        if self.has_analysis:
+            job['ai_analysis'] = self.analysis_dict()
+        if self.extra:
+            for key, value in self.extra.items():
+                job.setdefault(key, value)
+        return job
+
+    def __repr__(self):
+        return f"JobRecord({self.job_id!r}, {self.title!r} @ {self.company!r})"
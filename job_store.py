@@ -0,0 +1,124 @@
+# job_store.py
+# SQLite storage backend for the seen-jobs database
+
+import json
+import os
+import sqlite3
+from collections.abc import MutableMapping
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    first_seen TEXT NOT NULL,
+    match_score INTEGER,
+    source TEXT,
+    company_slug TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_match_score ON jobs(match_score);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_jobs_company_slug ON jobs(company_slug);
+"""
+
+class SQLiteJobStore(MutableMapping):
+    """
+    job_id -> job mapping backed by SQLite (WAL mode).
+
+    Behaves like the dict load_seen_jobs returns for the JSON backend, so
+    existing callers keep working, but lookups are primary-key reads and the
+    date/score queries below run off indexes instead of scanning every job.
+    """
+
+    def __init__(self, database_file):
+        self.database_file = database_file
+        directory = os.path.dirname(database_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(database_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    @staticmethod
+    def _row(job_id, job):
+        return (
+            job_id,
+            job.get('first_seen', '2000-01-01'),
+            job.get('match_score'),
+            job.get('source'),
+            job.get('company_slug'),
+            json.dumps(job),
+        )
+
+    def __getitem__(self, job_id):
+        row = self.conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(job_id)
+        return json.loads(row[0])
+
+    def __setitem__(self, job_id, job):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)", self._row(job_id, job))
+
+    def __delitem__(self, job_id):
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        if cursor.rowcount == 0:
+            raise KeyError(job_id)
+
+    def __contains__(self, job_id):
+        return self.conn.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def __iter__(self):
+        for (job_id,) in self.conn.execute("SELECT job_id FROM jobs"):
+            yield job_id
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def values(self):
+        return [json.loads(data) for (data,) in self.conn.execute("SELECT data FROM jobs")]
+
+    def items(self):
+        return [(job_id, json.loads(data)) for job_id, data in self.conn.execute("SELECT job_id, data FROM jobs")]
+
+    def put_many(self, jobs):
+        """Insert or replace many jobs in one transaction."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)",
+                [self._row(job['job_id'], job) for job in jobs]
+            )
+
+    def jobs_since(self, cutoff):
+        """Jobs with first_seen >= cutoff (ISO string), via the first_seen index."""
+        return list(self.iter_jobs_since(cutoff))
+
+    def iter_jobs_since(self, cutoff):
+        """Like jobs_since, but yields jobs one at a time off the cursor."""
+        rows = self.conn.execute(
+            "SELECT data FROM jobs WHERE first_seen >= ? ORDER BY first_seen DESC", (cutoff,)
+        )
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def delete_older_than(self, cutoff):
+        """Delete jobs with first_seen < cutoff (ISO string). Returns count removed."""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM jobs WHERE first_seen < ?", (cutoff,))
+        return cursor.rowcount
+
+    def jobs_by_score(self, min_score=0):
+        """Jobs at or above min_score, best first, via the match_score index."""
+        rows = self.conn.execute(
+            "SELECT data FROM jobs WHERE match_score >= ? ORDER BY match_score DESC, first_seen DESC",
+            (min_score,)
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def close(self):
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.close()
@@ -0,0 +1,176 @@
+# keyword_batch.py
+# Vectorized keyword scoring for large batches (NumPy + SciPy sparse matrices)
+
+import numpy as np
+from scipy import sparse
+from ai_filter import BONUS_KEYWORDS, ROLE_KEYWORDS, KeywordMatcher, keyword_analysis_dict
+
+def feature_matrix(matcher, kind, columns):
+    """
+    Sparse keyword x column matrix for a KeywordMatcher: 1 where a keyword
+    counts toward that column (a role type, bonus group or exclude keyword).
+    """
+    column_index = {column: i for i, column in enumerate(columns)}
+    rows, cols = [], []
+    for keyword, features in matcher.features.items():
+        for feature_kind, value in features:
+            if feature_kind == kind:
+                rows.append(matcher.keyword_index[keyword])
+                cols.append(column_index[value])
+    
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(matcher.keywords), len(columns))
+    )
+
+class ByteCorpus:
+    """
+    Many texts packed into one NUL-separated uint8 array, for substring
+    search with NumPy instead of one str scan per job per keyword.
+    
+    Each keyword is anchored on its rarest byte pair. A single table lookup
+    over the corpus finds every position holding any anchor; each keyword's
+    remaining bytes are then verified only at its own anchor positions.
+    """
+    
+    def __init__(self, texts):
+        encoded = [text.encode('utf-8') for text in texts]
+        lengths = np.fromiter((len(chunk) + 1 for chunk in encoded), dtype=np.int64, count=len(encoded))
+        self.row_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+        self.data = np.frombuffer(b'\0'.join(encoded) + b'\0', dtype=np.uint8)
+        
+        # Byte pair code at every position
+        self.pairs = (self.data[:-1].astype(np.uint16) << 8) | self.data[1:]
+    
+    def rows_containing(self, keywords):
+        """
+        Find which rows contain each keyword.
+        
+        Returns:
+            Dictionary mapping keyword -> sorted array of row indexes
+        """
+        # Pair frequencies estimated from a sample - only used to pick anchors
+        pair_counts = np.bincount(self.pairs[::16], minlength=1 << 16)
+        
+        needles = {}
+        for keyword in keywords:
+            needle = np.frombuffer(keyword.encode('utf-8'), dtype=np.uint8)
+            codes = (needle[:-1].astype(np.uint16) << 8) | needle[1:]
+            anchor = int(np.argmin(pair_counts[codes])) if len(codes) else 0
+            needles[keyword] = (needle, anchor, int(codes[anchor]) if len(codes) else None)
+        
+        # One pass: every position whose byte pair is some keyword's anchor,
+        # grouped by pair code
+        is_anchor = np.zeros(1 << 16, dtype=bool)
+        is_anchor[[code for _, _, code in needles.values() if code is not None]] = True
+        candidates = np.flatnonzero(is_anchor[self.pairs])
+        candidate_codes = self.pairs[candidates]
+        order = np.argsort(candidate_codes, kind='stable')
+        candidates = candidates[order]
+        candidate_codes = candidate_codes[order]
+        
+        rows = {}
+        for keyword, (needle, anchor, code) in needles.items():
+            size = len(needle)
+            
+            if code is None:
+                starts = np.flatnonzero(self.data == needle[0])
+            else:
+                low = np.searchsorted(candidate_codes, code, side='left')
+                high = np.searchsorted(candidate_codes, code, side='right')
+                starts = candidates[low:high] - anchor
+                starts = starts[(starts >= 0) & (starts + size <= len(self.data))]
+                
+                for offset in range(size):
+                    if offset in (anchor, anchor + 1):
+                        continue
+                    starts = starts[self.data[starts + offset] == needle[offset]]
+            
+            rows[keyword] = np.unique(np.searchsorted(self.row_starts, starts, side='right') - 1)
+        
+        return rows
+
+def hit_matrix(rows, cols, shape):
+    """Sparse 0/1-ish matrix from lists of row and column index arrays."""
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+    return sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=shape)
+
+def fallback_keyword_match_batch(jobs, matcher=None, chunk_size=10000):
+    """
+    Vectorized fallback_keyword_match for large batches (e.g. backfills).
+    
+    All jobs are packed into one lowercased byte corpus and each keyword is
+    located with NumPy array scans (see ByteCorpus), giving a sparse
+    job x keyword hit matrix;
+    every score is then derived with matrix products and array operations.
+    Output is identical to [fallback_keyword_match(job) for job in jobs].
+    
+    Args:
+        jobs: List of job dictionaries
+        matcher: Optional prebuilt KeywordMatcher (for its keyword tables)
+        chunk_size: Jobs per corpus; keeps the working arrays cache-friendly
+    
+    Returns:
+        List of analysis dictionaries, in the same order as jobs
+    """
+    matcher = matcher or KeywordMatcher()
+    
+    if len(jobs) > chunk_size:
+        analyses = []
+        for start in range(0, len(jobs), chunk_size):
+            analyses.extend(fallback_keyword_match_batch(jobs[start:start + chunk_size], matcher, chunk_size))
+        return analyses
+    
+    titles = [job.get('title', '').lower() for job in jobs]
+    texts = [title + ' ' + job.get('description', '').lower() for title, job in zip(titles, jobs)]
+    
+    # NUL never appears in a keyword, so matches can't span two jobs
+    corpus = ByteCorpus(texts)
+    title_corpus = ByteCorpus(titles)
+    
+    exclude_keywords = [
+        keyword for keyword, features in matcher.features.items()
+        if any(kind == 'exclude' for kind, _ in features)
+    ]
+    found = corpus.rows_containing(matcher.keywords)
+    found_in_title = title_corpus.rows_containing(exclude_keywords)
+    
+    shape = (len(jobs), len(matcher.keywords))
+    rows, cols, title_rows, title_cols = [], [], [], []
+    
+    for keyword, col in matcher.keyword_index.items():
+        rows.append(found[keyword])
+        cols.append(np.full(len(found[keyword]), col))
+        
+        if keyword in found_in_title:
+            title_rows.append(found_in_title[keyword])
+            title_cols.append(np.full(len(found_in_title[keyword]), col))
+    
+    hits = hit_matrix(rows, cols, shape)
+    title_hits = hit_matrix(title_rows, title_cols, shape)
+    
+    role_types = list(ROLE_KEYWORDS)
+    exclude_keywords = list(matcher.exclude_order)
+    
+    role_hit = (hits @ feature_matrix(matcher, 'role', role_types)).toarray() > 0
+    edu_match = (hits @ feature_matrix(matcher, 'edu', [True])).toarray()[:, 0] > 0
+    bonus_points = ((hits @ feature_matrix(matcher, 'bonus', range(len(BONUS_KEYWORDS)))).toarray() > 0).sum(axis=1)
+    exclude_hit = (title_hits @ feature_matrix(matcher, 'exclude', exclude_keywords)).toarray() > 0
+    
+    has_role = role_hit.any(axis=1)
+    last_role = len(role_types) - 1 - role_hit[:, ::-1].argmax(axis=1)
+    has_exclude = exclude_hit.any(axis=1)
+    first_exclude = exclude_hit.argmax(axis=1)
+    
+    scores = np.minimum(4 * has_role + 3 * edu_match + bonus_points, 10)
+    
+    return [
+        keyword_analysis_dict(
+            role_types[last_role[i]] if has_role[i] else None,
+            exclude_keywords[first_exclude[i]] if has_exclude[i] else None,
+            bool(edu_match[i]),
+            int(scores[i])
+        )
+        for i in range(len(jobs))
+    ]
@@ -1,21 +1,28 @@
 # main.py
 # Main orchestrator for Hybrid Job Monitoring System (Option C)
 
+import os
 import sys
 from datetime import datetime
 import config
 from scrapers import greenhouse, adzuna
-from ai_filter import filter_jobs
-from database import load_seen_jobs, filter_new_jobs, save_new_job, cleanup_old_jobs
-from alerter import send_immediate_alert, send_daily_digest
-from dashboard_generator import generate_dashboard
+from ai_filter import SCORING_RUBRIC
+from ai_cache import AnalysisCache
+from semantic_ranker import SemanticRanker
+from database import (
+    load_seen_records, open_seen_database, load_rejected_jobs, save_rejected_jobs, close_seen_jobs,
+)
+from pipeline import JobPipeline
+from search_scheduler import SearchScheduler
+from alerter import AlertDispatcher, send_daily_digest
+from dashboard_generator import generate_dashboard, generate_dashboard_app
 
 def main():
     """
     Main job monitoring workflow (Option C - Hybrid):
-    1. Daily: Scrape all Greenhouse companies (FREE, unlimited)
-    2. Rotation: API search for today's geography (96 API calls/month, within free tier)
-    3. AI filter all new jobs
+    1. Scheduled: Scrape Greenhouse boards that are due (FREE, hot boards daily)
+    2. Scheduled: API searches where recent yield per call is best (within free tier)
+    3. AI filter new jobs as they arrive (1-3 run as one streaming pipeline)
     4. Send alerts
     """
     
@@ -24,122 +31,186 @@ def main():
     print(f"📅 {datetime.now().strftime('%A, %B %d, %Y at %I:%M %p')}")
     print("="*70)
     
-    # Load database of seen jobs
-    seen_jobs = load_seen_jobs(config.DATABASE_FILE)
+    # Clean up old jobs (keep last 90 days), then load the job_ids dedup needs
+    seen_jobs = open_seen_database(config.DATABASE_FILE, days_to_keep=90)
     
-    # Clean up old jobs (keep last 90 days)
-    seen_jobs = cleanup_old_jobs(seen_jobs, days_to_keep=90)
+    # Load jobs the AI already rejected (so we don't rescore them)
+    rejected_jobs = load_rejected_jobs(config.REJECTED_JOBS_FILE, ttl_days=config.REJECTED_JOBS_TTL_DAYS)
     
-    all_new_matches = {
-        'greenhouse': [],
-        'api_searches': []
-    }
+    # Cache of AI analyses (invalidated when the profile, rubric or model changes)
+    ai_cache = AnalysisCache(
+        config.AI_CACHE_FILE,
+        config.GEMINI_MODEL,
+        config.YOUR_PROFILE + SCORING_RUBRIC,
+        ttl_days=config.AI_CACHE_TTL_DAYS,
+        max_entries=config.AI_CACHE_MAX_ENTRIES
+    )
+    
+    # Local semantic pre-ranking
+    ranker = SemanticRanker(dims=config.SEMANTIC_DIMS) if config.SEMANTIC_RANKING_ENABLED else None
+    
+    # Immediate alerts are queued here and sent in the background, so scoring
+    # never waits on email round trips
+    alerts = AlertDispatcher(max_workers=config.ALERT_MAX_WORKERS, batch=config.ALERT_BATCH)
     
-    # ===== TIER 1: GREENHOUSE SCRAPING (Daily, FREE) =====
+    # ===== TIER 1 + TIER 2: STREAMING PIPELINE =====
+    # Greenhouse boards (daily, FREE) and today's API search are scraped side
+    # by side; each board/query's jobs are deduped, pre-filtered, scored and
+    # saved while the rest are still downloading
     print(f"\n{'='*70}")
-    print("TIER 1: GREENHOUSE SCRAPING (Daily)")
+    print("TIER 1 + TIER 2: GREENHOUSE + API SEARCH (streamed)")
     print('='*70)
     
-    greenhouse_jobs = greenhouse.scrape_all_greenhouse_companies(
-        config.GREENHOUSE_COMPANIES,
-        delay=1  # 1 second between requests to be respectful
+    # ETag/Last-Modified per board, so unchanged boards answer 304
+    board_validators = greenhouse.load_board_validators(config.GREENHOUSE_CACHE_FILE)
+    
+    # Only fetch boards that are due: quiet boards back off, dead ones are quarantined
+    board_schedule = greenhouse.BoardSchedule(
+        config.GREENHOUSE_SCHEDULE_FILE,
+        max_interval=config.GREENHOUSE_MAX_CHECK_INTERVAL_DAYS,
+        max_quarantine=config.GREENHOUSE_MAX_QUARANTINE_DAYS
     )
+    due_boards = board_schedule.due(config.GREENHOUSE_COMPANIES)
     
-    # Filter for new jobs
-    greenhouse_new = filter_new_jobs(greenhouse_jobs, seen_jobs)
-    
-    if greenhouse_new:
-        print(f"\n🤖 AI filtering {len(greenhouse_new)} new Greenhouse jobs...")
-        
-        # AI filter
-        greenhouse_matched = filter_jobs(
-            greenhouse_new,
-            min_score=config.DAILY_DIGEST_THRESHOLD
-        )
-        
-        # Save to database and collect matches
-        for job in greenhouse_matched:
-            save_new_job(job, seen_jobs, config.DATABASE_FILE)
-            all_new_matches['greenhouse'].append(job)
-            
-            # Send immediate alert for high-priority matches
-            if job['match_score'] >= config.IMMEDIATE_ALERT_THRESHOLD:
-                send_immediate_alert(job)
-    
-    # ===== TIER 2: API SEARCH (Geography Rotation) =====
-    print(f"\n{'='*70}")
-    print("TIER 2: API SEARCH (Geography Rotation)")
-    print('='*70)
+    print(f"🏢 Scraping {len(due_boards)} Greenhouse boards...")
+    
+    greenhouse_boards = greenhouse.iter_greenhouse_companies(
+        due_boards,
+        delay=1,  # 1 second between requests when scraping sequentially
+        max_workers=config.GREENHOUSE_MAX_WORKERS,
+        requests_per_second=config.GREENHOUSE_REQUESTS_PER_SECOND,
+        validators=board_validators,
+        schedule=board_schedule
+    )
+    
+    # Free-tier Adzuna calls this run may spend, recorded in the monthly ledger
+    adzuna_budget = adzuna.CallBudget(
+        config.ADZUNA_MAX_CALLS_PER_RUN,
+        ledger_file=config.ADZUNA_LEDGER_FILE,
+        monthly_limit=config.ADZUNA_MONTHLY_CALL_LIMIT,
+        reserve=config.ADZUNA_QUOTA_RESERVE
+    )
     
-    # Determine which geography to search today
-    today_geography = config.get_geography_for_today()
-    print(f"\n📍 Today's geography: {today_geography}")
-    
-    # Get optimized search queries for this geography
-    queries = config.get_search_queries_for_geography(today_geography)
-    print(f"🔍 Running {len(queries)} optimized search queries...")
-    
-    # Search using Adzuna
-    api_jobs = adzuna.search_geography_all_queries(today_geography, queries)
-    
-    # Filter for new jobs
-    api_new = filter_new_jobs(api_jobs, seen_jobs)
-    
-    if api_new:
-        print(f"\n🤖 AI filtering {len(api_new)} new API jobs...")
-        
-        # AI filter
-        api_matched = filter_jobs(
-            api_new,
-            min_score=config.DAILY_DIGEST_THRESHOLD
-        )
-        
-        # Save to database and collect matches
-        for job in api_matched:
-            save_new_job(job, seen_jobs, config.DATABASE_FILE)
-            all_new_matches['api_searches'].append(job)
-            
-            # Send immediate alert for high-priority matches
-            if job['match_score'] >= config.IMMEDIATE_ALERT_THRESHOLD:
-                send_immediate_alert(job)
+    # Recent Adzuna answers, so repeated queries don't spend the quota
+    adzuna_cache = adzuna.ResponseCache(config.ADZUNA_CACHE_FILE, ttl_hours=config.ADZUNA_CACHE_TTL_HOURS)
+    
+    # Where each query's last complete search left off, so pagination stops there
+    adzuna_checkpoints = adzuna.load_query_checkpoints(config.ADZUNA_CHECKPOINT_FILE)
+    
+    # Spend today's share of the monthly calls on the queries (in any
+    # geography) with the best recent matches per call
+    scheduler = SearchScheduler(
+        config.ADZUNA_SCHEDULE_FILE,
+        max_query_age=config.ADZUNA_MAX_QUERY_AGE_DAYS,
+        max_pages=config.ADZUNA_MAX_PAGES
+    )
+    plan = scheduler.plan(scheduler.allowance(adzuna_budget))
+    today_geographies = ", ".join(geography for geography in config.GEOGRAPHIES
+                                  if any(planned[0] == geography for planned in plan)) or "none"
+    print(f"\n📍 Today's geographies: {today_geographies}")
+    print(f"🔍 Running {len(plan)} optimized search queries...")
+    adzuna_usage = {}
+    
+    pipeline = JobPipeline(
+        seen_jobs,
+        rejected_jobs,
+        config.DATABASE_FILE,
+        cache=ai_cache,
+        ranker=ranker,
+        alerts=alerts,
+        min_score=config.DAILY_DIGEST_THRESHOLD,
+        batch_size=config.AI_BATCH_SIZE,
+        max_in_flight=config.AI_MAX_IN_FLIGHT,
+        prefilter=config.PREFILTER_ENABLED,
+        queue_size=config.PIPELINE_QUEUE_SIZE
+    )
+    results = pipeline.run({
+        'greenhouse': (jobs for _, jobs in greenhouse_boards),
+        'api_searches': adzuna.iter_planned_queries(
+            plan, max_workers=config.ADZUNA_MAX_WORKERS, budget=adzuna_budget, cache=adzuna_cache,
+            checkpoints=adzuna_checkpoints, max_pages=config.ADZUNA_MAX_PAGES, usage=adzuna_usage
+        ),
+    })
+    all_new_matches = {tier: result.matched for tier, result in results.items()}
+    
+    # Boards and searches whose jobs a pipeline stage dropped must be fetched
+    # in full again tomorrow, so none of their state below advances
+    failed_boards = results['greenhouse'].failed
+    failed_searches = results['api_searches'].failed
+    if failed_boards or failed_searches:
+        print(f"\n⚠️  Refetching next run: {len(failed_boards)} boards, {len(failed_searches)} searches")
+    
+    # Only remember board validators once the boards' jobs are fully processed,
+    # otherwise a crash mid-run would hide them behind a 304 tomorrow
+    greenhouse.save_board_validators(board_validators, config.GREENHOUSE_CACHE_FILE, skip=failed_boards)
+    board_schedule.save(skip=failed_boards)
+    # Likewise, only advance the Adzuna pagination checkpoints once their jobs are saved
+    adzuna.save_query_checkpoints(
+        adzuna_checkpoints, config.ADZUNA_CHECKPOINT_FILE,
+        skip={adzuna_usage[search]['checkpoint'] for search in failed_searches if search in adzuna_usage}
+    )
+    scheduler.record(
+        {search: used for search, used in adzuna_usage.items() if search not in failed_searches},
+        results['api_searches'].new_by_search,
+        results['api_searches'].matched
+    )
+    scheduler.save()
+    
+    # Remember rejected jobs so tomorrow's run skips them
+    save_rejected_jobs(rejected_jobs, config.REJECTED_JOBS_FILE)
+    adzuna_cache.save()
+    
+    ai_cache.save()
     
     # ===== SUMMARY & DIGEST =====
     print(f"\n{'='*70}")
     print("SUMMARY")
     print('='*70)
     
-    total_greenhouse = len(greenhouse_jobs)
-    total_api = len(api_jobs)
-    total_new = len(greenhouse_new) + len(api_new)
+    total_greenhouse = results['greenhouse'].found
+    total_api = results['api_searches'].found
+    total_new = results['greenhouse'].new + results['api_searches'].new
     total_matches = len(all_new_matches['greenhouse']) + len(all_new_matches['api_searches'])
     
     print(f"\n📊 Today's Results:")
     print(f"   Greenhouse:")
     print(f"     - Total jobs found: {total_greenhouse}")
-    print(f"     - New jobs: {len(greenhouse_new)}")
+    print(f"     - New jobs: {results['greenhouse'].new}")
     print(f"     - Matches (score {config.DAILY_DIGEST_THRESHOLD}+): {len(all_new_matches['greenhouse'])}")
-    print(f"\n   API Search ({today_geography}):")
+    print(f"\n   API Search ({today_geographies}):")
     print(f"     - Total jobs found: {total_api}")
-    print(f"     - New jobs: {len(api_new)}")
+    print(f"     - New jobs: {results['api_searches'].new}")
     print(f"     - Matches (score {config.DAILY_DIGEST_THRESHOLD}+): {len(all_new_matches['api_searches'])}")
     print(f"\n   🎯 Total new matches: {total_matches}")
+    ai_cache.report()
+    adzuna_budget.report()
+    scheduler.report()
+    
+    # Wait for (or, in batch mode, send) the immediate alerts
+    alerts.flush()
     
     # Send daily digest (if email configured)
     if config.SENDGRID_API_KEY and total_matches > 0:
         print(f"\n📧 Sending daily digest...")
-        send_daily_digest(all_new_matches, today_geography)
+        send_daily_digest(all_new_matches, today_geographies, alerts)
     elif total_matches > 0:
         print(f"\n📧 Email not configured, skipping digest")
     else:
         print(f"\n📧 No matches to send today")
+    alerts.close()
     
     # ===== GENERATE DASHBOARD =====
     print(f"\n{'='*70}")
     print("GENERATING DASHBOARD")
     print('='*70)
     
-    dashboard_path = config.DATABASE_FILE.replace('jobs_seen.json', 'dashboard.html')
-    generate_dashboard(seen_jobs, dashboard_path)
+    dashboard_path = os.path.join(config.BASE_DIR, 'dashboard.html')
+    dashboard_jobs = load_seen_records(config.DATABASE_FILE)
+    if config.DASHBOARD_MODE == "app":
+        generate_dashboard_app(dashboard_jobs, dashboard_path, page_size=config.DASHBOARD_PAGE_SIZE)
+    else:
+        generate_dashboard(dashboard_jobs, dashboard_path)
+    close_seen_jobs(seen_jobs)
     
     print(f"\n🌐 Dashboard ready!")
     print(f"   Local: file://{dashboard_path}")
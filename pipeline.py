@@ -0,0 +1,326 @@
+# pipeline.py
+# Streaming job pipeline: scrape → dedup → pre-filter → AI score → persist/alert
+
+import queue
+import threading
+from collections import Counter
+import config
+from ai_filter import AIMDLimiter, triage_jobs, score_with_retries, score_jobs, apply_analysis
+from database import filter_new_jobs, save_new_jobs, mark_rejected_jobs, get_job_id
+
+# End-of-stream marker passed down the queues
+DONE = object()
+
+def source_of(job):
+    """The Greenhouse board (company_slug) or Adzuna search ((geography, search_category)) a job came from."""
+    if job.get('company_slug'):
+        return job['company_slug']
+    return (job.get('geography'), job.get('search_category'))
+
+class TierResult:
+    """What one source (tier) produced during a pipeline run."""
+
+    def __init__(self):
+        self.found = 0     # Jobs scraped
+        self.new = 0       # Jobs that weren't seen or rejected before
+        self.matched = []  # Jobs at or above min_score, with their analysis
+        # New jobs per (geography, search_category) tag, for per-query yield
+        self.new_by_search = Counter()
+        # Sources (see source_of) with jobs dropped by a failing stage; their
+        # validators/checkpoints mustn't advance, or the jobs never come back
+        self.failed = set()
+
+class JobPipeline:
+    """
+    Runs the daily workflow as stages connected by bounded queues, so jobs
+    from the first boards are being scored while later boards are still
+    downloading, and every tier shares the same dedup/scoring/persist stages:
+
+        sources (one thread each) → dedup → pre-filter → AI scorers (N threads) → persist/alert
+
+    Dedup, pre-filter and persist are single threads, so seen_jobs, the
+    rejected-jobs cache and the semantic ranker are only touched by one
+    stage at a time (seen state is shared by dedup and persist under a lock).
+    The AI scorers share one AIMDLimiter, as in score_concurrently.
+
+    A chunk or batch that fails in a stage is dropped rather than saved or
+    rejected, and its sources are listed in TierResult.failed so the caller
+    can fetch them in full again on the next run.
+    """
+
+    def __init__(self, seen_jobs, rejected_jobs, database_file, cache=None, ranker=None,
+                 alerts=None, min_score=6, batch_size=1, max_in_flight=1, prefilter=False,
+                 queue_size=8, linger=0.5):
+        """
+        Args:
+            seen_jobs: Seen-jobs database (ids or store, see load_seen_job_ids)
+            rejected_jobs: Rejected-jobs cache (updated in place)
+            database_file: Where save_new_jobs commits matches
+            cache: Optional AnalysisCache
+            ranker: Optional SemanticRanker
+            alerts: Optional AlertDispatcher for high-priority matches
+            min_score: Minimum score to keep
+            batch_size: Jobs packed into each AI request
+            max_in_flight: AI scorer threads (and max concurrent AI requests)
+            prefilter: Run the keyword pre-filter before the AI
+            queue_size: Chunks buffered between stages before upstream blocks
+            linger: Seconds a partial AI batch waits for more jobs before it is sent
+        """
+        self.seen_jobs = seen_jobs
+        self.rejected_jobs = rejected_jobs
+        self.database_file = database_file
+        self.cache = cache
+        self.ranker = ranker
+        self.alerts = alerts
+        self.min_score = min_score
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, max_in_flight)
+        self.prefilter = prefilter
+        self.linger = linger
+
+        self.scraped = queue.Queue(maxsize=queue_size)      # (tier, jobs)
+        self.fresh = queue.Queue(maxsize=queue_size)        # (tier, new jobs)
+        self.to_score = queue.Queue(maxsize=self.workers)   # [(tier, job), ...]
+        self.scored = queue.Queue(maxsize=queue_size * self.batch_size)  # (tier, job, analysis)
+
+        self.limiter = AIMDLimiter(self.workers, initial_limit=max(1, self.workers // 2))
+        self.seen_lock = threading.Lock()
+        self.lock = threading.Lock()
+        self.claimed = set()      # job_ids already passed downstream this run
+        self.in_flight = {}       # cache key -> identical postings waiting on its score
+        self.workers_left = self.workers
+        self.results = {}
+
+    def run(self, sources):
+        """
+        Stream every source through the pipeline and persist the results.
+
+        Args:
+            sources: Dictionary of tier name -> iterable of job lists
+                     (e.g. one list per Greenhouse board or Adzuna query)
+
+        Returns:
+            Dictionary of tier name -> TierResult
+        """
+        self.results = {tier: TierResult() for tier in sources}
+
+        threads = [threading.Thread(target=self._produce, args=(tier, chunks), daemon=True)
+                   for tier, chunks in sources.items()]
+        threads.append(threading.Thread(target=self._dedup, args=(len(sources),), daemon=True))
+        threads.append(threading.Thread(target=self._triage, daemon=True))
+        threads.extend(threading.Thread(target=self._score, daemon=True) for _ in range(self.workers))
+
+        for thread in threads:
+            thread.start()
+
+        # Persisting happens on the calling thread
+        self._persist()
+
+        for thread in threads:
+            thread.join()
+
+        return self.results
+
+    def _produce(self, tier, chunks):
+        try:
+            for jobs in chunks:
+                if jobs:
+                    self.results[tier].found += len(jobs)
+                    self.scraped.put((tier, jobs))
+        except Exception as e:
+            print(f"  ❌ Error scraping {tier}: {e}")
+        finally:
+            self.scraped.put(DONE)
+
+    def _fail(self, tier, jobs):
+        """Note the sources of jobs a stage had to drop."""
+        with self.lock:
+            self.results[tier].failed.update(source_of(job) for job in jobs)
+
+    def _claim(self, job):
+        """True the first time a job_id comes through this run."""
+        job_id = get_job_id(job)
+        if job_id in self.claimed:
+            return False
+        self.claimed.add(job_id)
+        return True
+
+    def _dedup(self, sources_left):
+        while sources_left:
+            item = self.scraped.get()
+            if item is DONE:
+                sources_left -= 1
+                continue
+
+            tier, jobs = item
+            try:
+                with self.seen_lock:
+                    new_jobs = filter_new_jobs(jobs, self.seen_jobs, self.rejected_jobs)
+                new_jobs = [job for job in new_jobs if self._claim(job)]
+            except Exception as e:
+                print(f"  ❌ Dedup error, {len(jobs)} {tier} jobs skipped this run: {e}")
+                self._fail(tier, jobs)
+                continue
+
+            self.results[tier].new += len(new_jobs)
+            self.results[tier].new_by_search.update(
+                (job.get('geography'), job.get('search_category')) for job in new_jobs
+            )
+            if new_jobs:
+                self.fresh.put((tier, new_jobs))
+
+        self.fresh.put(DONE)
+
+    def _follow(self, tier, job):
+        """
+        Park an identical posting (same cache key) behind the one already
+        being scored. Returns True if the job was parked.
+        """
+        if self.cache is None:
+            return False
+
+        try:
+            key = self.cache.key_for(job)
+        except Exception as e:
+            print(f"  ⚠️  AI cache error: {e}")
+            return False
+        with self.lock:
+            if key in self.in_flight:
+                self.in_flight[key].append((tier, job))
+                return True
+            self.in_flight[key] = []
+            return False
+
+    def _triage(self):
+        batch = []
+        while True:
+            try:
+                item = self.fresh.get(timeout=self.linger if batch else None)
+            except queue.Empty:
+                # Nothing new for a while: don't hold a partial batch back
+                self.to_score.put(batch)
+                batch = []
+                continue
+
+            if item is DONE:
+                break
+
+            tier, jobs = item
+            try:
+                decided = triage_jobs(jobs, self.cache, self.prefilter, self.ranker)
+            except Exception as e:
+                print(f"  ❌ Pre-filter error, {len(jobs)} {tier} jobs skipped this run: {e}")
+                self._fail(tier, jobs)
+                continue
+
+            for i, job in enumerate(jobs):
+                if i in decided:
+                    self.scored.put((tier, job, decided[i]))
+                elif not self._follow(tier, job):
+                    batch.append((tier, job))
+                    if len(batch) >= self.batch_size:
+                        self.to_score.put(batch)
+                        batch = []
+
+        if batch:
+            self.to_score.put(batch)
+        for _ in range(self.workers):
+            self.to_score.put(DONE)
+
+    def _score(self):
+        try:
+            while True:
+                batch = self.to_score.get()
+                if batch is DONE:
+                    break
+
+                jobs = [job for _, job in batch]
+                try:
+                    if config.GOOGLE_AI_KEY:
+                        analyses = score_with_retries(jobs, self.limiter)
+                    else:
+                        analyses = score_jobs(jobs, len(jobs))
+                except Exception as e:
+                    print(f"  ❌ AI scoring error, {len(jobs)} jobs skipped this run: {e}")
+                    analyses = [None] * len(jobs)
+
+                for (tier, job), analysis in zip(batch, analyses):
+                    followers = self._settle(job, analysis)
+                    if analysis is None:
+                        self._fail(tier, [job])
+                        for follower_tier, follower in followers:
+                            self._fail(follower_tier, [follower])
+                        continue
+                    self.scored.put((tier, job, analysis))
+                    for follower_tier, follower in followers:
+                        self.scored.put((follower_tier, follower, dict(analysis)))
+        finally:
+            # However this worker ends, _persist must still hear that it's done
+            with self.lock:
+                self.workers_left -= 1
+                last = self.workers_left == 0
+            if last:
+                self.scored.put(DONE)
+
+    def _settle(self, job, analysis):
+        """Cache a job's analysis and return the postings parked behind it (see _follow)."""
+        if self.cache is None:
+            return []
+
+        try:
+            # Keyword fallbacks are cheap to redo and shouldn't mask a real AI score later
+            if analysis is not None and not analysis.get('fallback'):
+                self.cache.put(job, analysis)
+        except Exception as e:
+            print(f"  ⚠️  AI cache error: {e}")
+
+        try:
+            key = self.cache.key_for(job)
+        except Exception:
+            return []  # _follow couldn't key it either, so nothing was parked
+        with self.lock:
+            return self.in_flight.pop(key, [])
+
+    def _persist(self):
+        done = False
+        while not done:
+            # Take whatever is ready, so each commit covers as many jobs as possible
+            items = [self.scored.get()]
+            while True:
+                try:
+                    items.append(self.scored.get_nowait())
+                except queue.Empty:
+                    break
+            done = any(item is DONE for item in items)
+
+            matched = []  # (tier, job)
+            rejected = []
+            for item in items:
+                if item is DONE:
+                    continue
+                tier, job, analysis = item
+                if apply_analysis(job, analysis, self.min_score):
+                    matched.append((tier, job))
+                elif not analysis.get('fallback'):
+                    # Keyword fallbacks (Gemini errors, rate-limit exhaustion) aren't
+                    # negative-cached: the job is rescored on the next run
+                    rejected.append(job)
+
+            with self.seen_lock:
+                if matched:
+                    try:
+                        save_new_jobs([job for _, job in matched], self.seen_jobs, self.database_file)
+                    except Exception as e:
+                        print(f"  ❌ Database error, {len(matched)} matches not saved this run: {e}")
+                        for tier, job in matched:
+                            self._fail(tier, [job])
+                        matched = []
+                # Remember rejected jobs so tomorrow's run skips them
+                mark_rejected_jobs(rejected, self.rejected_jobs)
+
+            for tier, job in matched:
+                self.results[tier].matched.append(job)
+
+                # Send immediate alert for high-priority matches
+                if self.alerts is not None and job['match_score'] >= config.IMMEDIATE_ALERT_THRESHOLD:
+                    self.alerts.enqueue(job)
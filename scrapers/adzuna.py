@@ -1,11 +1,217 @@
 # scrapers/adzuna.py
 # Search jobs using Adzuna API (250 calls/month free)
 
+import hashlib
+import json
+import os
 import requests
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
 import config
 
-def search_adzuna(query, location="United States", results_per_page=50):
+ADZUNA_API_URL = "https://api.adzuna.com/v1/api/jobs"
+
+# Adzuna lists postings a while after their `created` time, so pagination
+# walks this far past the last checkpoint (repeats are dropped by dedup)
+CHECKPOINT_OVERLAP = timedelta(hours=6)
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """
+    requests.Session shared by every Adzuna call, so concurrent queries
+    reuse pooled keep-alive connections instead of a TLS handshake each.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, config.ADZUNA_MAX_WORKERS))
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+class CallBudget:
+    """
+    Counts Adzuna API calls and refuses any past `limit` per run (None = no cap).
+    
+    With a ledger_file it is also the monthly quota ledger: every real call
+    is recorded against its calendar month (and written straight to disk, so
+    a crashed run still counts), calls past monthly_limit are refused, and
+    near_limit() tells callers to make do with cached answers once only
+    `reserve` calls are left this month.
+    
+    Shared by concurrent queries, so it is thread-safe.
+    """
+
+    def __init__(self, limit=None, ledger_file=None, monthly_limit=None, reserve=0):
+        self.limit = limit
+        self.ledger_file = ledger_file
+        self.monthly_limit = monthly_limit
+        self.reserve = reserve
+        self.used = 0
+        self.refused = 0
+        self.months = {}  # 'YYYY-MM' -> real API calls made that month
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Read the ledger file, if there is one."""
+        if not self.ledger_file or not os.path.exists(self.ledger_file):
+            return
+        
+        try:
+            with open(self.ledger_file, 'r') as f:
+                self.months = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Error loading Adzuna quota ledger: {e}")
+
+    def save(self):
+        """Write the ledger (last 12 months) atomically."""
+        if not self.ledger_file:
+            return
+        
+        try:
+            self.months = dict(sorted(self.months.items())[-12:])
+            tmp_file = self.ledger_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.months, f, indent=2)
+            os.replace(tmp_file, self.ledger_file)
+        except Exception as e:
+            print(f"❌ Error saving Adzuna quota ledger: {e}")
+
+    def month_used(self):
+        """Real API calls recorded for the current month."""
+        return self.months.get(datetime.now().strftime('%Y-%m'), 0)
+
+    def near_limit(self):
+        """True once no more than `reserve` calls are left this month."""
+        if self.monthly_limit is None:
+            return False
+        return self.monthly_limit - self.month_used() <= self.reserve
+
+    def take(self):
+        """Claim one call. Returns False if the budget is used up."""
+        with self.lock:
+            if self.limit is not None and self.used >= self.limit:
+                self.refused += 1
+                return False
+            if self.monthly_limit is not None and self.month_used() >= self.monthly_limit:
+                self.refused += 1
+                return False
+            
+            self.used += 1
+            month = datetime.now().strftime('%Y-%m')
+            self.months[month] = self.months.get(month, 0) + 1
+            self.save()
+            return True
+
+    def report(self):
+        """Print calls used (and refused) so far."""
+        limit = f"/{self.limit}" if self.limit is not None else ""
+        refused = f", {self.refused} refused" if self.refused else ""
+        month = ""
+        if self.ledger_file:
+            monthly_limit = f"/{self.monthly_limit}" if self.monthly_limit is not None else ""
+            month = f" ({self.month_used()}{monthly_limit} this month)"
+        print(f"📊 Adzuna API calls this run: {self.used}{limit}{refused}{month}")
+
+# Raw result fields search_adzuna turns into a job
+CACHED_RESULT_FIELDS = ('title', 'company', 'location', 'redirect_url', 'description',
+                        'salary_min', 'salary_max', 'contract_type', 'created')
+
+class ResponseCache:
+    """
+    Adzuna answers on disk, keyed by the normalized request (country and
+    every query parameter except the credentials), so an identical query
+    within ttl_hours costs no API call. Older entries are kept for
+    max_age_days as a fallback for when the quota is running out.
+    
+    Only the result fields search_adzuna reads are stored.
+    """
+
+    def __init__(self, cache_file, ttl_hours=20, max_age_days=30):
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_age_seconds = max_age_days * 86400
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def key_for(country, params):
+        """Stable key for a request: lowercased, whitespace-collapsed, credentials dropped."""
+        request = {
+            name: ' '.join(str(value).lower().split())
+            for name, value in params.items() if name not in ('app_id', 'app_key')
+        }
+        request['country'] = country
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def load(self):
+        """Load cached responses, dropping ones past max_age_days."""
+        if not os.path.exists(self.cache_file):
+            return
+        
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Error loading Adzuna cache: {e}")
+            return
+        
+        cutoff = time.time() - self.max_age_seconds
+        self.entries = {key: entry for key, entry in data.items() if entry['fetched'] >= cutoff}
+
+    def get(self, country, params, stale_ok=False):
+        """
+        Cached answer for a request, or None.
+        
+        Args:
+            country: Adzuna country code
+            params: Request parameters
+            stale_ok: Accept entries older than ttl_hours
+        
+        Returns:
+            {'fetched': epoch seconds, 'results': list of raw result dictionaries}, or None
+        """
+        with self.lock:
+            entry = self.entries.get(self.key_for(country, params))
+        if entry is None:
+            return None
+        if not stale_ok and entry['fetched'] < time.time() - self.ttl_seconds:
+            return None
+        return entry
+
+    def put(self, country, params, results):
+        """Store the results of a real API call."""
+        compact = []
+        for result in results:
+            result = {name: result[name] for name in CACHED_RESULT_FIELDS if name in result}
+            if 'description' in result:
+                result['description'] = (result['description'] or '')[:1000]
+            compact.append(result)
+        
+        with self.lock:
+            self.entries[self.key_for(country, params)] = {'fetched': time.time(), 'results': compact}
+
+    def save(self):
+        """Persist the cache (atomic replace)."""
+        with self.lock:
+            try:
+                tmp_file = self.cache_file + ".tmp"
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.entries, f, separators=(',', ':'))
+                os.replace(tmp_file, self.cache_file)
+            except Exception as e:
+                print(f"❌ Error saving Adzuna cache: {e}")
+
+def search_adzuna(query, location="United States", results_per_page=50, budget=None,
+                  api_url=ADZUNA_API_URL, cache=None, page=1):
     """
     Search jobs via Adzuna API.
     
@@ -13,14 +219,32 @@ def search_adzuna(query, location="United States", results_per_page=50):
         query: Search query (e.g., "Learning Designer AI education")
         location: Location string
         results_per_page: Number of results (max 50)
+        budget: Optional CallBudget; no call is made once it is used up
+        api_url: API root (overridable for local testing)
+        cache: Optional ResponseCache; a fresh entry answers without a call,
+               and a stale one stands in when the budget is (nearly) spent
+        page: Results page (1 = newest)
     
     Returns:
         List of job dictionaries
     """
+    results, _ = fetch_results(query, location, results_per_page, budget, api_url, cache, page)
+    return parse_results(results or [], location)
+
+def fetch_results(query, location="United States", results_per_page=50, budget=None,
+                  api_url=ADZUNA_API_URL, cache=None, page=1):
+    """
+    One page of raw Adzuna results (see search_adzuna for the arguments).
+    
+    Returns:
+        (results, fetched): the 'results' list and when Adzuna produced it
+        (epoch seconds; older than now if it came from the cache), or
+        (None, None) if there is no answer (not configured, error, budget spent)
+    """
     
     if not config.ADZUNA_APP_ID or not config.ADZUNA_APP_KEY:
         print("  ⚠️  Adzuna API credentials not configured")
-        return []
+        return None, None
     
     # Map location to Adzuna country code
     country_map = {
@@ -36,7 +260,7 @@ def search_adzuna(query, location="United States", results_per_page=50):
     
     country = country_map.get(location, "us")
     
-    url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
+    url = f"{api_url}/{country}/search/{page}"
     
     params = {
         'app_id': config.ADZUNA_APP_ID,
@@ -51,76 +275,312 @@ def search_adzuna(query, location="United States", results_per_page=50):
     if location not in ["United States", "USA", "US", "Singapore", "UAE"]:
         params['where'] = location
     
+    # The page is part of the URL, not the query string, but part of the cache key
+    cache_params = dict(params, page=page)
+    
+    if cache is not None:
+        entry = cache.get(country, cache_params)
+        if entry is None and budget is not None and budget.near_limit():
+            # Close to the monthly cap: an older answer beats spending a call
+            entry = cache.get(country, cache_params, stale_ok=True)
+        if entry is not None:
+            print(f"  🗃️  Adzuna: {len(entry['results'])} cached results for '{query[:50]}...' (page {page})")
+            return entry['results'], entry['fetched']
+    
+    if budget is not None and not budget.take():
+        stale = cache.get(country, cache_params, stale_ok=True) if cache is not None else None
+        if stale is not None:
+            print(f"  🗃️  Adzuna call budget used up, using {len(stale['results'])} older cached results for '{query[:50]}...'")
+            return stale['results'], stale['fetched']
+        print(f"  ⚠️  Adzuna call budget used up, skipping '{query[:50]}...'")
+        return None, None
+    
     try:
-        response = requests.get(url, params=params, timeout=10)
+        fetched = time.time()
+        response = get_session().get(url, params=params, timeout=10)
         
         if response.status_code != 200:
             print(f"  ❌ Adzuna API error {response.status_code}: {response.text[:100]}")
-            return []
-        
-        data = response.json()
-        
-        jobs = []
-        for result in data.get('results', []):
-            job = {
-                'title': result.get('title', 'No title'),
-                'company': result.get('company', {}).get('display_name', 'Unknown company'),
-                'location': result.get('location', {}).get('display_name', location),
-                'url': result.get('redirect_url', ''),
-                'description': result.get('description', '')[:1000],  # Truncate long descriptions
-                'salary_min': result.get('salary_min'),
-                'salary_max': result.get('salary_max'),
-                'contract_type': result.get('contract_type'),
-                'source': 'Adzuna',
-                'date_found': datetime.now().isoformat(),
-                'created': result.get('created'),
-            }
-            jobs.append(job)
-        
-        print(f"  ✓ Adzuna: Found {len(jobs)} jobs for '{query[:50]}...'")
-        return jobs
+            return None, None
+        
+        results = response.json().get('results', [])
+        if cache is not None:
+            cache.put(country, cache_params, results)
+        
+        print(f"  ✓ Adzuna: Found {len(results)} jobs for '{query[:50]}...' (page {page})")
+        return results, fetched
     
     except requests.Timeout:
         print(f"  ⏱️  Adzuna API timeout")
-        return []
+        return None, None
     
     except Exception as e:
         print(f"  ❌ Adzuna error: {e}")
-        return []
+        return None, None
+
+def search_adzuna_since(query, location="United States", since=None, max_pages=5, results_per_page=50,
+                        budget=None, api_url=ADZUNA_API_URL, cache=None):
+    """
+    Walk result pages (newest first) until one reaches postings created
+    before `since`, so deep result sets are fetched when needed and quiet
+    days stop after one page.
+    
+    Args:
+        query: Search query
+        location: Location string
+        since: Aware datetime of the last complete search for this query
+               (None = first search: one page only)
+        max_pages: Never fetch more pages than this
+        results_per_page: Number of results per page (max 50)
+        budget: Optional CallBudget; each page is one call
+        api_url: API root (overridable for local testing)
+        cache: Optional ResponseCache
+    
+    Returns:
+        (jobs, as_of): as_of is the aware datetime the search is complete
+        up to (the next run's `since`; unchanged if max_pages ran out first),
+        or None if a page failed
+    """
+    jobs = []
+    fetched_times = []
+    
+    for page in range(1, max_pages + 1):
+        results, fetched = fetch_results(query, location, results_per_page, budget, api_url, cache, page)
+        if results is None:
+            return jobs, None
+        
+        jobs.extend(parse_results(results, location))
+        fetched_times.append(fetched)
+        
+        if since is None or len(results) < results_per_page:
+            break
+        
+        oldest = oldest_created(results)
+        if oldest is None or oldest < since - CHECKPOINT_OVERLAP:
+            break
+    else:
+        # Postings between `since` and the last page weren't reached: keep the
+        # old checkpoint so the next run walks back over them again
+        print(f"  ⚠️  '{query[:50]}...' still had new postings after {max_pages} pages")
+        return jobs, since
+    
+    return jobs, datetime.fromtimestamp(min(fetched_times), timezone.utc)
+
+def parse_created(value):
+    """Adzuna's `created` timestamp as an aware datetime, or None."""
+    try:
+        created = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    return created if created.tzinfo else created.replace(tzinfo=timezone.utc)
+
+def oldest_created(results):
+    """Oldest `created` time on a page of results, or None if none is readable."""
+    times = [created for created in (parse_created(result.get('created')) for result in results) if created]
+    return min(times) if times else None
+
+def checkpoint_key(query, location):
+    """Key of a query's pagination checkpoint."""
+    return f"{location}|{' '.join(query.lower().split())}"
+
+def load_query_checkpoints(checkpoint_file):
+    """
+    Load when each query was last searched completely.
+    
+    Returns:
+        Dictionary mapping checkpoint_key -> ISO timestamp (UTC)
+    """
+    if not os.path.exists(checkpoint_file):
+        return {}
+    
+    try:
+        with open(checkpoint_file, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️  Error loading Adzuna checkpoints: {e}")
+        return {}
+
+def save_query_checkpoints(checkpoints, checkpoint_file, skip=()):
+    """
+    Save pagination checkpoints (atomic replace).
+    
+    Checkpoint keys in skip (searches whose jobs weren't processed) keep the
+    checkpoint already on disk, so the next run pages back over them again.
+    """
+    if skip:
+        saved = load_query_checkpoints(checkpoint_file)
+        checkpoints = {key: since for key, since in checkpoints.items() if key not in skip}
+        checkpoints.update({key: saved[key] for key in skip if key in saved})
+    
+    try:
+        tmp_file = checkpoint_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(checkpoints, f, indent=2)
+        os.replace(tmp_file, checkpoint_file)
+    except Exception as e:
+        print(f"❌ Error saving Adzuna checkpoints: {e}")
+
+def parse_results(results, location):
+    """
+    Turn Adzuna results into job dictionaries.
+    
+    Args:
+        results: 'results' list of an Adzuna search response
+        location: Location searched (used when a result has none)
+    
+    Returns:
+        List of job dictionaries
+    """
+    jobs = []
+    for result in results:
+        job = {
+            'title': result.get('title', 'No title'),
+            'company': result.get('company', {}).get('display_name', 'Unknown company'),
+            'location': result.get('location', {}).get('display_name', location),
+            'url': result.get('redirect_url', ''),
+            'description': result.get('description', '')[:1000],  # Truncate long descriptions
+            'salary_min': result.get('salary_min'),
+            'salary_max': result.get('salary_max'),
+            'contract_type': result.get('contract_type'),
+            'source': 'Adzuna',
+            'date_found': datetime.now().isoformat(),
+            'created': result.get('created'),
+        }
+        jobs.append(job)
+    return jobs
 
-def search_geography_all_queries(geography, queries):
+def search_geography_all_queries(geography, queries, max_workers=1, budget=None, cache=None,
+                                 checkpoints=None, max_pages=5):
     """
     Search all queries for a specific geography using Adzuna.
     
     Args:
         geography: Geography name (USA, Singapore, Dubai)
         queries: List of (query_string, category_name) tuples
+        max_workers: Max queries in flight at once
+        budget: Optional CallBudget shared by the queries
+        cache: Optional ResponseCache shared by the queries
+        checkpoints: Optional pagination checkpoints (see iter_geography_queries)
+        max_pages: Most pages fetched per query when paginating
     
     Returns:
         List of all jobs found
     """
+    all_jobs = []
+    for jobs in iter_geography_queries(geography, queries, max_workers, budget, cache=cache,
+                                       checkpoints=checkpoints, max_pages=max_pages):
+        all_jobs.extend(jobs)
+    
+    print(f"\n✅ Adzuna {geography} complete: {len(all_jobs)} jobs")
+    return all_jobs
+
+def iter_geography_queries(geography, queries, max_workers=1, budget=None, api_url=ADZUNA_API_URL,
+                           cache=None, checkpoints=None, max_pages=5):
+    """
+    Like search_geography_all_queries, but yields each query's jobs as soon
+    as they arrive. With max_workers > 1 the queries run concurrently over
+    the shared session, so the whole geography takes about one round trip.
+    
+    Args:
+        geography: Geography name (USA, Singapore, Dubai)
+        queries: List of (query_string, category_name) tuples
+        max_workers: Max queries in flight at once
+        budget: Optional CallBudget shared by the queries
+        api_url: API root (overridable for local testing)
+        cache: Optional ResponseCache shared by the queries
+        checkpoints: Optional pagination checkpoints (see load_query_checkpoints);
+                     with them each query pages back to its last complete
+                     search (at most max_pages) and its checkpoint is advanced
+    
+    Yields:
+        List of jobs for one query, tagged with search_category and geography
+    """
     print(f"\n🔍 Searching Adzuna: {geography}")
     
-    # Get location terms for this geography
-    location_terms = config.GEOGRAPHIES[geography]['search_terms']
-    primary_location = location_terms[0]
+    plan = [(geography, query, category) for query, category in queries]
+    yield from iter_planned_queries(plan, max_workers, budget, api_url, cache, checkpoints, max_pages)
+
+class MeteredBudget:
+    """One query's view of a shared CallBudget (or None), counting the calls it makes."""
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.used = 0
+
+    def near_limit(self):
+        return self.budget is not None and self.budget.near_limit()
+
+    def take(self):
+        if self.budget is not None and not self.budget.take():
+            return False
+        self.used += 1
+        return True
+
+def iter_planned_queries(plan, max_workers=1, budget=None, api_url=ADZUNA_API_URL, cache=None,
+                         checkpoints=None, max_pages=5, usage=None):
+    """
+    Run a plan of queries that may span geographies (see SearchScheduler),
+    yielding each query's jobs as soon as they arrive.
     
-    all_jobs = []
+    Args:
+        plan: List of (geography, query_string, category_name) tuples
+        max_workers: Max queries in flight at once
+        budget: Optional CallBudget shared by the queries
+        api_url: API root (overridable for local testing)
+        cache: Optional ResponseCache shared by the queries
+        checkpoints: Optional pagination checkpoints (see iter_geography_queries)
+        max_pages: Most pages fetched per query when paginating
+        usage: Optional dictionary, filled with (geography, category) ->
+               {'calls': API calls made, 'complete': whether the search finished,
+                'checkpoint': its checkpoint_key}
     
-    for i, (query, category) in enumerate(queries, 1):
-        print(f"  [{i}/{len(queries)}] {category}")
+    Yields:
+        List of jobs for one query, tagged with search_category and geography
+    """
+    def search(geography, query, category):
+        # Primary location term for this geography
+        location = config.GEOGRAPHIES[geography]['search_terms'][0]
+        key = checkpoint_key(query, location)
+        metered = MeteredBudget(budget)
         
-        jobs = search_adzuna(query, primary_location)
+        if checkpoints is None:
+            # fetch_results (unlike search_adzuna) tells a failed search from an empty one
+            results, _ = fetch_results(query, location, budget=metered, api_url=api_url, cache=cache)
+            jobs = parse_results(results or [], location)
+            complete = results is not None
+        else:
+            since = checkpoints.get(key)
+            jobs, as_of = search_adzuna_since(
+                query, location, since=datetime.fromisoformat(since) if since else None,
+                max_pages=max_pages, budget=metered, api_url=api_url, cache=cache
+            )
+            complete = as_of is not None
+            if complete:
+                checkpoints[key] = as_of.isoformat()
+        
+        if usage is not None:
+            usage[(geography, category)] = {'calls': metered.used, 'complete': complete, 'checkpoint': key}
         
         # Tag jobs with category for filtering
         for job in jobs:
             job['search_category'] = category
             job['geography'] = geography
         
-        all_jobs.extend(jobs)
+        return jobs
     
-    print(f"\n✅ Adzuna {geography} complete: {len(all_jobs)} jobs")
-    return all_jobs
+    if max_workers <= 1:
+        for i, (geography, query, category) in enumerate(plan, 1):
+            print(f"  [{i}/{len(plan)}] {geography}: {category}")
+            yield search(geography, query, category)
+        return
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(search, *planned): planned for planned in plan}
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            geography, _, category = futures[future]
+            print(f"  [{done}/{len(plan)}] {geography}: {category}")
+            yield future.result()
 
 if __name__ == "__main__":
     # Test Adzuna API
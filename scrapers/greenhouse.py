@@ -3,21 +3,294 @@
 
 import requests
 from bs4 import BeautifulSoup
+import hashlib
+import json
+import os
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from scrapers.ratelimit import HostRateLimiter
 
-def scrape_greenhouse_board(company_slug, timeout=10):
+GREENHOUSE_BASE_URL = "https://boards.greenhouse.io"
+GREENHOUSE_API_URL = "https://boards-api.greenhouse.io/v1/boards"
+
+def load_board_validators(cache_file):
+    """
+    Load stored HTTP validators (ETag / Last-Modified) per company_slug.
+    
+    Returns:
+        Dictionary mapping company_slug -> {'etag': ..., 'last_modified': ...}
+    """
+    if not os.path.exists(cache_file):
+        return {}
+    
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️  Error loading Greenhouse cache: {e}")
+        return {}
+
+def save_board_validators(validators, cache_file, skip=()):
+    """
+    Save HTTP validators per company_slug (atomic replace).
+    
+    Boards in skip (e.g. whose jobs a failing pipeline stage dropped) are
+    saved without validators, so their next fetch is a full, unconditional one.
+    """
+    if skip:
+        validators = {slug: cached for slug, cached in validators.items() if slug not in skip}
+    
+    try:
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(validators, f, indent=2)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"❌ Error saving Greenhouse cache: {e}")
+
+class BoardSchedule:
+    """
+    Decides which boards are due today, from what each board did before.
+    
+    Per company_slug it keeps the openings fingerprint, when the board last
+    changed, consecutive failures and churn (a running average of changes
+    per day). A board is checked again after about CHURN_TARGET / churn days:
+    daily while it keeps changing, backing off to max_interval days once it
+    goes quiet. A board that fails (404, errors) is quarantined for 1, 2, 4...
+    days up to max_quarantine, so dead boards stop costing a request per run.
+    """
+
+    CHURN_TARGET = 0.5     # Aim for about two checks per expected change
+    CHURN_WEIGHT = 0.3     # Weight of the latest check in the churn average
+    INITIAL_CHURN = 1.0    # New boards start out as if they changed daily
+
+    def __init__(self, schedule_file, max_interval=7, max_quarantine=30):
+        self.schedule_file = schedule_file
+        self.max_interval = max_interval
+        self.max_quarantine = max_quarantine
+        self.boards = {}  # company_slug -> {'fingerprint', 'last_checked', 'last_changed', 'failures', 'churn', 'next_check'}
+        self.not_modified = set()  # Boards that answered 304 this run
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load board state from disk."""
+        if not os.path.exists(self.schedule_file):
+            return
+        
+        try:
+            with open(self.schedule_file, 'r') as f:
+                self.boards = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Error loading Greenhouse schedule: {e}")
+
+    def save(self, skip=()):
+        """
+        Write board state (atomic replace).
+        
+        Boards in skip keep the state already on disk, so a board whose jobs
+        weren't processed this run is still due next run.
+        """
+        boards = self.boards
+        if skip:
+            saved = BoardSchedule(self.schedule_file).boards if os.path.exists(self.schedule_file) else {}
+            boards = {slug: board for slug, board in boards.items() if slug not in skip}
+            boards.update({slug: saved[slug] for slug in skip if slug in saved})
+        
+        try:
+            tmp_file = self.schedule_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(boards, f, indent=2)
+            os.replace(tmp_file, self.schedule_file)
+        except Exception as e:
+            print(f"❌ Error saving Greenhouse schedule: {e}")
+
+    @staticmethod
+    def fingerprint(jobs):
+        """
+        Order-independent hash of a board's openings.
+        
+        Only fields the API and the HTML fallback both produce go in, so a
+        board that switches between the two paths doesn't count as changed.
+        """
+        openings = sorted(f"{job.get('title', '')}\x1f{job.get('location', '')}\x1f{job.get('department') or ''}"
+                          for job in jobs)
+        return hashlib.sha256('\n'.join(openings).encode('utf-8')).hexdigest()
+
+    def due(self, company_list, today=None):
+        """
+        Boards to fetch today, in company_list order.
+        
+        Args:
+            company_list: List of company slugs
+            today: Date of the run (default: today)
+        
+        Returns:
+            List of company slugs
+        """
+        today = (today or date.today()).isoformat()
+        due = [company for company in company_list
+               if self.boards.get(company, {}).get('next_check', '') <= today]
+        
+        quarantined = sum(1 for company in company_list
+                          if company not in due and self.boards[company].get('failures'))
+        print(f"📅 Greenhouse boards due: {len(due)}/{len(company_list)}"
+              + (f" ({quarantined} quarantined)" if quarantined else ""))
+        return due
+
+    def mark_not_modified(self, company_slug):
+        """Note that a board answered 304 (no body to fingerprint)."""
+        with self.lock:
+            self.not_modified.add(company_slug)
+
+    def record(self, company_slug, jobs, today=None):
+        """
+        Update a board's state after fetching it and schedule its next check.
+        
+        Args:
+            company_slug: Company identifier
+            jobs: Jobs fetched, or None if the board failed
+            today: Date of the run (default: today)
+        """
+        today = today or date.today()
+        board = self.boards.setdefault(company_slug, {'failures': 0, 'churn': self.INITIAL_CHURN})
+        
+        if jobs is None:
+            board['failures'] = board.get('failures', 0) + 1
+            days = min(self.max_quarantine, 2 ** (board['failures'] - 1))
+            board['next_check'] = (today + timedelta(days=days)).isoformat()
+            if board['failures'] > 1:
+                print(f"  🚫 {company_slug} failed {board['failures']} runs in a row, next try in {days}d")
+            return
+        
+        with self.lock:
+            not_modified = company_slug in self.not_modified
+            self.not_modified.discard(company_slug)
+        
+        changed = False
+        if not not_modified:
+            fingerprint = self.fingerprint(jobs)
+            # A board seen for the first time has nothing to have changed from
+            changed = board.get('fingerprint') not in (None, fingerprint)
+            board['fingerprint'] = fingerprint
+        
+        last_checked = board.get('last_checked')
+        days = (today - date.fromisoformat(last_checked)).days if last_checked else 1
+        if days > 0:
+            board['churn'] = ((1 - self.CHURN_WEIGHT) * board.get('churn', self.INITIAL_CHURN)
+                              + self.CHURN_WEIGHT * (1.0 if changed else 0.0) / days)
+        
+        board['failures'] = 0
+        board['last_checked'] = today.isoformat()
+        if changed or not board.get('last_changed'):
+            board['last_changed'] = today.isoformat()
+        
+        interval = self.CHURN_TARGET / board['churn'] if board['churn'] > 0 else self.max_interval
+        interval = max(1, min(self.max_interval, round(interval)))
+        board['next_check'] = (today + timedelta(days=interval)).isoformat()
+
+def scrape_greenhouse_api(company_slug, timeout=10, api_url=GREENHOUSE_API_URL, validators=None,
+                          schedule=None):
+    """
+    Fetch all jobs from a board via the Greenhouse JSON boards API.
+    
+    If validators holds an ETag/Last-Modified for this board, the request is
+    conditional: an unchanged board answers 304 and we skip parsing entirely.
+    
+    Args:
+        company_slug: Company identifier (e.g., 'anthropic', 'khanacademy')
+        timeout: Request timeout in seconds
+        api_url: Boards API root (overridable for local testing)
+        validators: Dictionary of company_slug -> validators (updated in place)
+        schedule: Optional BoardSchedule, told when the board answered 304
+    
+    Returns:
+        List of job dictionaries ([] if the board is unchanged since last run),
+        or None if board doesn't exist/error
+    """
+    url = f"{api_url}/{company_slug}/jobs"
+    
+    headers = {}
+    cached = (validators or {}).get(company_slug, {})
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+        
+        if response.status_code == 304:
+            print(f"  ✓ Unchanged since last run: {company_slug}")
+            if schedule is not None:
+                schedule.mark_not_modified(company_slug)
+            return []
+        
+        if response.status_code == 404:
+            print(f"  ⚠️  Greenhouse API board not found: {company_slug}")
+            return None
+        
+        if response.status_code != 200:
+            print(f"  ❌ API error {response.status_code} for {company_slug}")
+            return None
+        
+        data = response.json()
+        jobs = []
+        
+        for posting in data.get('jobs', []):
+            departments = posting.get('departments') or []
+            
+            job = {
+                'title': (posting.get('title') or '').strip(),
+                'url': posting.get('absolute_url', ''),
+                'location': (posting.get('location') or {}).get('name') or 'Location not specified',
+                'company': company_slug.replace('-', ' ').title(),
+                'company_slug': company_slug,
+                'department': departments[0].get('name') if departments else None,
+                'source': 'Greenhouse',
+                'date_found': datetime.now().isoformat(),
+                'updated_at': posting.get('updated_at'),
+            }
+            jobs.append(job)
+        
+        # Remember validators only once the body parsed successfully
+        if validators is not None:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                validators[company_slug] = {'etag': etag, 'last_modified': last_modified}
+            else:
+                validators.pop(company_slug, None)
+        
+        if jobs:
+            print(f"  ✓ Found {len(jobs)} jobs at {company_slug}")
+        
+        return jobs
+    
+    except requests.Timeout:
+        print(f"  ⏱️  Timeout fetching {company_slug} from API")
+        return None
+    
+    except Exception as e:
+        print(f"  ❌ Error fetching {company_slug} from API: {e}")
+        return None
+
+def scrape_greenhouse_board(company_slug, timeout=10, base_url=GREENHOUSE_BASE_URL, include_raw_html=False):
     """
     Scrape all jobs from a Greenhouse board.
     
     Args:
         company_slug: Company identifier (e.g., 'anthropic', 'khanacademy')
         timeout: Request timeout in seconds
+        base_url: Board host (overridable for local testing)
+        include_raw_html: Keep the first 500 chars of each listing's HTML (for debugging)
     
     Returns:
         List of job dictionaries, or None if board doesn't exist/error
     """
-    url = f"https://boards.greenhouse.io/{company_slug}"
+    url = f"{base_url}/{company_slug}"
     
     try:
         response = requests.get(url, timeout=timeout)
@@ -52,9 +325,9 @@ def scrape_greenhouse_board(company_slug, timeout=10):
                 
                 # Make URL absolute if relative
                 if job_url.startswith('/'):
-                    job_url = f"https://boards.greenhouse.io{job_url}"
+                    job_url = f"{base_url}{job_url}"
                 elif not job_url.startswith('http'):
-                    job_url = f"https://boards.greenhouse.io/{company_slug}{job_url}"
+                    job_url = f"{base_url}/{company_slug}{job_url}"
                 
                 # Extract location
                 location_elem = opening.find('span', class_='location')
@@ -73,8 +346,9 @@ def scrape_greenhouse_board(company_slug, timeout=10):
                     'department': department,
                     'source': 'Greenhouse',
                     'date_found': datetime.now().isoformat(),
-                    'raw_html': str(opening)[:500]  # First 500 chars for debugging
                 }
+                if include_raw_html:
+                    job['raw_html'] = str(opening)[:500]
                 
                 jobs.append(job)
             
@@ -95,37 +369,75 @@ def scrape_greenhouse_board(company_slug, timeout=10):
         print(f"  ❌ Error scraping {company_slug}: {e}")
         return None
 
-def scrape_all_greenhouse_companies(company_list, delay=1):
+def scrape_greenhouse_company(company_slug, use_api=True, validators=None, limiter=None,
+                              base_url=GREENHOUSE_BASE_URL, api_url=GREENHOUSE_API_URL, schedule=None):
+    """
+    Fetch one company's jobs: JSON API first, HTML board scraper as fallback.
+    
+    Args:
+        company_slug: Company identifier
+        use_api: Try the JSON boards API before scraping HTML
+        validators: Conditional-GET validators per company_slug
+        limiter: Optional HostRateLimiter consulted before each request
+        base_url: HTML board host
+        api_url: Boards API root
+        schedule: Optional BoardSchedule (see scrape_greenhouse_api)
+    
+    Returns:
+        List of job dictionaries, or None if both paths failed
+    """
+    if use_api:
+        if limiter:
+            limiter.acquire(api_url)
+        jobs = scrape_greenhouse_api(company_slug, api_url=api_url, validators=validators, schedule=schedule)
+        if jobs is not None:
+            return jobs
+    
+    if limiter:
+        limiter.acquire(base_url)
+    return scrape_greenhouse_board(company_slug, base_url=base_url)
+
+def scrape_all_greenhouse_companies(company_list, delay=1, max_workers=1,
+                                    requests_per_second=None, base_url=GREENHOUSE_BASE_URL,
+                                    use_api=True, validators=None, api_url=GREENHOUSE_API_URL):
     """
     Scrape all companies in list with rate limiting.
     
+    With max_workers=1 boards are fetched one after another with `delay`
+    seconds between them. With max_workers > 1 they are fetched by a thread
+    pool, throttled by a per-host token bucket instead of a fixed sleep.
+    
     Args:
         company_list: List of company slugs
         delay: Seconds to wait between requests (be respectful)
+        max_workers: Max boards fetched concurrently
+        requests_per_second: Per-host request rate in concurrent mode
+                             (defaults to 1/delay)
+        base_url: Board host (overridable for local testing)
+        use_api: Use the JSON boards API, falling back to HTML scraping
+        validators: Conditional-GET validators per company_slug (updated in place)
+        api_url: Boards API root (overridable for local testing)
     
     Returns:
         List of all jobs found across all companies
     """
     print(f"\n🏢 Scraping {len(company_list)} Greenhouse boards...")
     
+    results = [None] * len(company_list)
+    for i, jobs in iter_greenhouse_companies(company_list, delay, max_workers, requests_per_second,
+                                             base_url, use_api, validators, api_url):
+        results[i] = jobs
+    
     all_jobs = []
     successful = 0
     failed = 0
     
-    for i, company in enumerate(company_list, 1):
-        print(f"[{i}/{len(company_list)}] {company}")
-        
-        jobs = scrape_greenhouse_board(company)
-        
+    for jobs in results:
         if jobs is not None:
             all_jobs.extend(jobs)
             successful += 1
         else:
             failed += 1
-        
-        # Rate limiting - be respectful
-        if i < len(company_list):
-            time.sleep(delay)
     
     print(f"\n✅ Greenhouse scraping complete:")
     print(f"   - Successful: {successful}")
@@ -134,6 +446,74 @@ def scrape_all_greenhouse_companies(company_list, delay=1):
     
     return all_jobs
 
+def iter_greenhouse_companies(company_list, delay=1, max_workers=1,
+                              requests_per_second=None, base_url=GREENHOUSE_BASE_URL,
+                              use_api=True, validators=None, api_url=GREENHOUSE_API_URL, schedule=None):
+    """
+    Like scrape_all_greenhouse_companies, but yields each board's jobs as
+    soon as it has been fetched, so they can be processed while later
+    boards are still downloading.
+    
+    With a BoardSchedule, each board's result is recorded in it as it is
+    yielded (pass only the boards schedule.due() returned).
+    
+    Yields:
+        (index into company_list, list of jobs or None if the board failed),
+        in completion order
+    """
+    fetch_options = {
+        'use_api': use_api,
+        'validators': validators,
+        'base_url': base_url,
+        'api_url': api_url,
+        'schedule': schedule,
+    }
+    
+    if max_workers > 1:
+        boards = _scrape_concurrently(company_list, delay, max_workers, requests_per_second, fetch_options)
+    else:
+        boards = _scrape_sequentially(company_list, delay, fetch_options)
+    
+    for i, jobs in boards:
+        if schedule is not None:
+            schedule.record(company_list[i], jobs)
+        yield i, jobs
+
+def _scrape_sequentially(company_list, delay, fetch_options):
+    """
+    Fetch boards one at a time, `delay` seconds apart.
+    Yields (index, result) per company.
+    """
+    for i, company in enumerate(company_list):
+        print(f"[{i + 1}/{len(company_list)}] {company}")
+        
+        yield i, scrape_greenhouse_company(company, **fetch_options)
+        
+        # Rate limiting - be respectful
+        if i + 1 < len(company_list):
+            time.sleep(delay)
+
+def _scrape_concurrently(company_list, delay, max_workers, requests_per_second, fetch_options):
+    """
+    Fetch boards with a bounded thread pool.
+    Yields (index, result) per company as each one completes.
+    """
+    if requests_per_second is None:
+        requests_per_second = 1.0 / delay if delay > 0 else float(max_workers)
+    
+    limiter = HostRateLimiter(requests_per_second, capacity=max_workers)
+    
+    def fetch(company):
+        return scrape_greenhouse_company(company, limiter=limiter, **fetch_options)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, company): i for i, company in enumerate(company_list)}
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            print(f"[{done}/{len(company_list)}] {company_list[i]}")
+            yield i, future.result()
+
 def get_job_description(job_url, timeout=10):
     """
     Fetch full job description from Greenhouse job page.
@@ -178,7 +558,7 @@ if __name__ == "__main__":
         print(f"Testing: {company}")
         print('='*60)
         
-        jobs = scrape_greenhouse_board(company)
+        jobs = scrape_greenhouse_company(company)
         
         if jobs:
             print(f"\nSample jobs:")
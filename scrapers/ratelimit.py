@@ -0,0 +1,59 @@
+# scrapers/ratelimit.py
+# Thread-safe token-bucket rate limiting, one bucket per host
+
+import threading
+import time
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at `rate` tokens/second up to `capacity`.
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+class HostRateLimiter:
+    """
+    Keeps a separate TokenBucket for every host, so a concurrent scraper
+    stays polite to each site no matter how many workers it runs.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        """Block until a request to this URL's host is allowed."""
+        host = urlparse(url).netloc
+
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                self.buckets[host] = bucket
+
+        bucket.acquire()
@@ -0,0 +1,227 @@
+# search_scheduler.py
+# Picks each day's Adzuna queries across all geographies from their observed yield
+
+import json
+import math
+import os
+from datetime import date
+import config
+
+# Totals are multiplied by this before each new search is added, so the
+# yield estimates follow a query whose market heats up or dries out
+DECAY = 0.8
+
+# A query's match rate is smoothed towards its geography's with this many
+# days' weight, so one lucky or empty search doesn't decide its future
+PRIOR_DAYS = 3
+
+# Matches per day assumed where nothing has been searched yet: optimistic,
+# so every query gets tried before the scheduler settles on the best ones
+UNEXPLORED_MATCH_RATE = 1.0
+
+def search_key(geography, category):
+    """Key of a query's yield record."""
+    return f"{geography}|{category}"
+
+class SearchScheduler:
+    """
+    Decides which Adzuna queries to spend today's calls on.
+
+    After each run, record() adds every completed query's API calls, new
+    jobs and matches to its totals (decayed, see DECAY), along with the days
+    of postings the search covered. plan() then ranks every (geography,
+    query) by expected new matches per API call: the query's match rate per
+    day times the days since it last ran, over the calls that many days of
+    postings took to page through before.
+
+    Two guarantees come first, whatever the yield:
+    - a geography not searched for its `check_frequency` days gets its best query
+    - a query not searched for max_query_age days is searched
+    """
+
+    def __init__(self, schedule_file, max_query_age=14, max_pages=5):
+        self.schedule_file = schedule_file
+        self.max_query_age = max_query_age
+        self.max_pages = max_pages
+        self.queries = {}  # search_key -> {'searches', 'calls', 'new', 'matched', 'days', 'last_searched'}
+        self.load()
+
+    def load(self):
+        """Load yield records from disk."""
+        if not os.path.exists(self.schedule_file):
+            return
+
+        try:
+            with open(self.schedule_file, 'r') as f:
+                self.queries = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Error loading Adzuna search schedule: {e}")
+
+    def save(self):
+        """Write yield records (atomic replace)."""
+        try:
+            tmp_file = self.schedule_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.queries, f, indent=2)
+            os.replace(tmp_file, self.schedule_file)
+        except Exception as e:
+            print(f"❌ Error saving Adzuna search schedule: {e}")
+
+    def days_since(self, key, today):
+        """Whole days since a query last ran, or None if it never has."""
+        entry = self.queries.get(key)
+        if not entry or not entry.get('last_searched'):
+            return None
+        return (today - date.fromisoformat(entry['last_searched'])).days
+
+    def match_rate(self, entries):
+        """Pooled matches per day of postings over some yield records, or None."""
+        days = sum(entry['days'] for entry in entries)
+        if days <= 0:
+            return None
+        return sum(entry['matched'] for entry in entries) / days
+
+    def allowance(self, budget, today=None):
+        """
+        Calls to plan for today: what is left of the month (minus the
+        reserve) spread over the days left, capped by the per-run limit.
+
+        Args:
+            budget: CallBudget with the monthly ledger
+            today: Date to plan for (default: today)
+
+        Returns:
+            Number of calls
+        """
+        today = today or date.today()
+        calls = budget.limit
+        if budget.monthly_limit is not None:
+            next_month = date(today.year + today.month // 12, today.month % 12 + 1, 1)
+            days_left = (next_month - today).days
+            left = max(0, budget.monthly_limit - budget.month_used() - budget.reserve)
+            daily = math.ceil(left / days_left)
+            calls = daily if calls is None else min(calls, daily)
+        return calls if calls is not None else self.max_pages * len(config.GEOGRAPHIES) * 8
+
+    def plan(self, allowance, today=None):
+        """
+        Choose today's queries.
+
+        Args:
+            allowance: API calls to spend (see allowance()); guaranteed
+                       searches may go over it
+            today: Date to plan for (default: today)
+
+        Returns:
+            List of (geography, query_string, category_name) tuples, most
+            valuable first
+        """
+        today = today or date.today()
+        global_rate = self.match_rate(list(self.queries.values()))
+
+        candidates = []
+        overdue_geographies = []
+        for geography, settings in config.GEOGRAPHIES.items():
+            queries = config.get_search_queries_for_geography(geography)
+            keys = [search_key(geography, category) for _, category in queries]
+
+            known = [self.queries[key] for key in keys if key in self.queries]
+            geography_rate = self.match_rate(known)
+            if geography_rate is None:
+                geography_rate = global_rate if global_rate is not None else UNEXPLORED_MATCH_RATE
+
+            visits = [days for days in (self.days_since(key, today) for key in keys) if days is not None]
+            if not visits or min(visits) >= settings['check_frequency']:
+                overdue_geographies.append(geography)
+
+            for (query, category), key in zip(queries, keys):
+                days = self.days_since(key, today)
+                if days == 0:
+                    continue  # Already searched today
+
+                entry = self.queries.get(key)
+                if entry is None or days is None:
+                    # First search is a single page (no checkpoint yet)
+                    rate, covered, calls = geography_rate, settings['check_frequency'], 1
+                else:
+                    rate = (entry['matched'] + PRIOR_DAYS * geography_rate) / (entry['days'] + PRIOR_DAYS)
+                    covered = min(days, self.max_query_age)
+                    calls_per_day = entry['calls'] / entry['days'] if entry['days'] > 0 else 1
+                    calls = min(self.max_pages, max(1, round(calls_per_day * covered)))
+
+                candidates.append({
+                    'geography': geography, 'query': query, 'category': category,
+                    'days': days, 'calls': calls, 'value': rate * covered / calls,
+                })
+
+        candidates.sort(key=lambda candidate: candidate['value'], reverse=True)
+
+        chosen = [candidate for candidate in candidates
+                  if candidate['days'] is not None and candidate['days'] >= self.max_query_age]
+        for geography in overdue_geographies:
+            if not any(candidate['geography'] == geography for candidate in chosen):
+                chosen.extend([candidate for candidate in candidates if candidate['geography'] == geography][:1])
+
+        remaining = allowance - sum(candidate['calls'] for candidate in chosen)
+        for candidate in candidates:
+            if candidate not in chosen and candidate['calls'] <= remaining:
+                chosen.append(candidate)
+                remaining -= candidate['calls']
+
+        chosen.sort(key=lambda candidate: candidate['value'], reverse=True)
+
+        planned_calls = sum(candidate['calls'] for candidate in chosen)
+        print(f"📅 Adzuna plan: {len(chosen)} queries, ~{planned_calls} calls (allowance {allowance})")
+        for geography in config.GEOGRAPHIES:
+            count = sum(1 for candidate in chosen if candidate['geography'] == geography)
+            if count:
+                note = " (revisit due)" if geography in overdue_geographies else ""
+                print(f"   {geography}: {count} queries{note}")
+
+        return [(candidate['geography'], candidate['query'], candidate['category']) for candidate in chosen]
+
+    def record(self, usage, new_by_search, matched_jobs, today=None):
+        """
+        Add today's results to the yield records.
+
+        Args:
+            usage: (geography, category) -> {'calls', 'complete'} from iter_planned_queries
+            new_by_search: Counter of new jobs per (geography, category) (TierResult.new_by_search)
+            matched_jobs: Jobs from these searches that matched
+            today: Date of the run (default: today)
+        """
+        today = today or date.today()
+        for (geography, category), used in usage.items():
+            # A search that stopped partway is retried from the same checkpoint
+            if not used['complete']:
+                continue
+
+            key = search_key(geography, category)
+            days = self.days_since(key, today)
+            matched = sum(1 for job in matched_jobs
+                          if job.get('geography') == geography and job.get('search_category') == category)
+
+            entry = self.queries.setdefault(key, {'searches': 0, 'calls': 0, 'new': 0, 'matched': 0, 'days': 0})
+            for field, observed in (('calls', used['calls']), ('new', new_by_search[(geography, category)]),
+                                    ('matched', matched), ('days', days if days is not None else 1)):
+                entry[field] = entry[field] * DECAY + observed
+            entry['searches'] += 1
+            entry['last_searched'] = today.isoformat()
+
+    def report(self, today=None):
+        """Print each geography's yield per API call and when it was last searched."""
+        today = today or date.today()
+        print(f"📈 Adzuna yield (recent, per API call):")
+        for geography in config.GEOGRAPHIES:
+            prefix = search_key(geography, '')
+            entries = [entry for key, entry in self.queries.items() if key.startswith(prefix)]
+            calls = sum(entry['calls'] for entry in entries)
+            if not calls:
+                print(f"   {geography}: no searches yet")
+                continue
+
+            new = sum(entry['new'] for entry in entries) / calls
+            matched = sum(entry['matched'] for entry in entries) / calls
+            last = max(entry['last_searched'] for entry in entries)
+            days = (today - date.fromisoformat(last)).days
+            print(f"   {geography}: {new:.1f} new, {matched:.2f} matches per call (last searched {days}d ago)")
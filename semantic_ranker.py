@@ -0,0 +1,135 @@
+# semantic_ranker.py
+# Local semantic pre-ranking of jobs against YOUR_PROFILE (hashing vectorizer + cosine similarity)
+
+import re
+import zlib
+from collections import Counter
+import numpy as np
+from database import get_job_id
+
+STOPWORDS = set("""
+a an and are as at be by for from has have in is it its of on or our that the their this to
+we will with you your who what when where which while about into over under than then they them
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#&]*")
+
+# Character trigrams count for less than whole words
+TRIGRAM_WEIGHT = 0.3
+
+def tokenize(text):
+    """
+    Weighted features: lowercased words, plus character trigrams of each
+    word so related forms ('teacher' / 'teaching') still overlap.
+    
+    Returns:
+        Counter mapping feature -> summed weight
+    """
+    features = Counter()
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        features[word] += 1.0
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            features[f"#{padded[i:i + 3]}"] += TRIGRAM_WEIGHT
+    return features
+
+def embed_text(text, dims):
+    """
+    Signed feature-hashing embedding with sublinear term weights, L2-normalized.
+    Uses crc32 rather than hash() so vectors are stable across runs.
+    """
+    features = tokenize(text)
+    if not features:
+        return np.zeros(dims, dtype=np.float32)
+
+    hashes = np.fromiter((zlib.crc32(feature.encode('utf-8')) for feature in features),
+                         dtype=np.uint32, count=len(features))
+    weights = np.log1p(np.fromiter(features.values(), dtype=np.float64, count=len(features)))
+    signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+
+    vector = np.bincount(hashes % dims, weights=signs * weights, minlength=dims).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def job_text(job):
+    """Text used to embed a job."""
+    return f"{job.get('title', '')}\n{job.get('description', '') or ''}"
+
+class SemanticRanker:
+    """
+    Cosine-similarity ranking of jobs against the candidate profile.
+
+    Job vectors are kept for the run, one row per job_id, so a posting that
+    turns up in several sources is embedded once; ranking a batch is one
+    matrix-vector product against the cached profile vector. Nothing is
+    stored between runs: dedup only lets jobs through that weren't seen
+    before, so a stored vector would never be looked up again.
+    """
+
+    def __init__(self, dims=1024):
+        self.dims = dims
+        self.rows = {}
+        self.profile_hash = None
+        self.profile_vec = None
+        self.vectors = np.zeros((1024, dims), dtype=np.float32)
+
+    def profile_vector(self, profile_text):
+        """Profile embedding, recomputed only when the profile text changes."""
+        profile_hash = format(zlib.crc32(profile_text.encode('utf-8')), '08x')
+        if self.profile_vec is None or profile_hash != self.profile_hash:
+            self.profile_vec = embed_text(profile_text, self.dims)
+            self.profile_hash = profile_hash
+        return self.profile_vec
+
+    def job_rows(self, jobs):
+        """Row index of each job's vector, embedding and storing any new ones."""
+        rows = []
+        for job in jobs:
+            job_id = get_job_id(job)
+            row = self.rows.get(job_id)
+
+            if row is None:
+                row = len(self.rows)
+                if row >= self.vectors.shape[0]:
+                    self.vectors = np.concatenate([self.vectors, np.zeros_like(self.vectors)])
+                self.vectors[row] = embed_text(job_text(job), self.dims)
+                self.rows[job_id] = row
+
+            rows.append(row)
+
+        return np.array(rows, dtype=np.int64)
+
+    def similarities(self, jobs, profile_text):
+        """Cosine similarity of each job to the profile."""
+        if not jobs:
+            return np.zeros(0, dtype=np.float32)
+        rows = self.job_rows(jobs)
+        return self.vectors[rows] @ self.profile_vector(profile_text)
+
+    def select(self, jobs, profile_text, top_k=None, min_similarity=None):
+        """
+        Split jobs into those worth sending to the AI and those that aren't.
+
+        Args:
+            jobs: List of job dictionaries
+            profile_text: Candidate profile
+            top_k: Keep at most this many of the most similar jobs
+            min_similarity: Drop jobs below this cosine similarity
+
+        Returns:
+            (keep, similarities): boolean mask over jobs and the similarity scores
+        """
+        scores = self.similarities(jobs, profile_text)
+        keep = np.ones(len(jobs), dtype=bool)
+
+        if min_similarity is not None:
+            keep &= scores >= min_similarity
+
+        if top_k is not None and keep.sum() > top_k:
+            ranked = np.argsort(-np.where(keep, scores, -np.inf), kind='stable')
+            keep[:] = False
+            keep[ranked[:top_k]] = True
+
+        return keep, scores
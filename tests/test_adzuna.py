@@ -0,0 +1,158 @@
+# tests/test_adzuna.py
+# Incremental Adzuna pagination against a fake result feed
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import config
+from scrapers import adzuna
+
+PER_PAGE = 50
+
+def fake_feed(count, monkeypatch):
+    """Serve `count` postings, newest first, one every 10 minutes; returns the pages fetched."""
+    now = datetime.now(timezone.utc)
+    feed = [{'title': f"Learning Designer {i}", 'redirect_url': f"https://example.com/{i}",
+             'created': (now - timedelta(minutes=10 * i)).strftime('%Y-%m-%dT%H:%M:%SZ')}
+            for i in range(count)]
+    pages = []
+
+    def fetch_results(query, location, results_per_page, budget, api_url, cache, page):
+        pages.append(page)
+        return feed[(page - 1) * results_per_page:page * results_per_page], time.time()
+
+    monkeypatch.setattr(adzuna, 'fetch_results', fetch_results)
+    return pages
+
+def test_checkpoint_holds_when_max_pages_runs_out(monkeypatch):
+    pages = fake_feed(400, monkeypatch)
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+
+    jobs, as_of = adzuna.search_adzuna_since("learning designer", since=since, max_pages=5)
+
+    assert len(jobs) == 5 * PER_PAGE
+    assert as_of == since
+    # The next run walks the full depth again instead of stopping early
+    pages.clear()
+    adzuna.search_adzuna_since("learning designer", since=as_of, max_pages=5)
+    assert pages == [1, 2, 3, 4, 5]
+
+def test_checkpoint_advances_once_the_walk_reaches_it(monkeypatch):
+    pages = fake_feed(400, monkeypatch)
+    since = datetime.now(timezone.utc) - timedelta(hours=2)
+
+    jobs, as_of = adzuna.search_adzuna_since("learning designer", since=since, max_pages=5)
+
+    # 2h + 6h overlap at one posting per 10 minutes is 48 postings: page 1 reaches it
+    assert pages == [1]
+    assert as_of > since
+
+def test_failed_search_is_not_complete(monkeypatch):
+    def fetch_results(query, location="United States", results_per_page=50, budget=None,
+                      api_url=None, cache=None, page=1):
+        budget.take()  # The call was spent, then Adzuna answered 500
+        return None, None
+
+    monkeypatch.setattr(adzuna, 'fetch_results', fetch_results)
+    plan = [('USA', 'learning designer', 'EdTech - Design')]
+
+    for checkpoints in (None, {}):
+        usage = {}
+        list(adzuna.iter_planned_queries(plan, checkpoints=checkpoints, usage=usage))
+        assert usage[('USA', 'EdTech - Design')]['calls'] == 1
+        assert not usage[('USA', 'EdTech - Design')]['complete']
+
+class FakeClock(datetime):
+    """Stands in for adzuna.datetime so the ledger month can be moved."""
+
+    current = datetime(2026, 1, 31, 23, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+@pytest.fixture
+def clock(monkeypatch):
+    FakeClock.current = datetime(2026, 1, 31, 23, 0)
+    monkeypatch.setattr(adzuna, 'datetime', FakeClock)
+    return FakeClock
+
+def test_monthly_cap_rolls_over_with_the_month(tmp_path, clock):
+    ledger = str(tmp_path / "adzuna_quota.json")
+    budget = adzuna.CallBudget(ledger_file=ledger, monthly_limit=3)
+
+    assert [budget.take() for _ in range(4)] == [True, True, True, False]
+    assert budget.refused == 1
+
+    clock.current = datetime(2026, 2, 1, 0, 5)
+    assert budget.month_used() == 0
+    assert budget.take()
+    with open(ledger) as f:
+        assert json.load(f) == {'2026-01': 3, '2026-02': 1}
+
+def test_ledger_counts_calls_from_earlier_runs(tmp_path, clock):
+    ledger = str(tmp_path / "adzuna_quota.json")
+    adzuna.CallBudget(ledger_file=ledger, monthly_limit=3).take()
+
+    # A per-run limit doesn't reset the month
+    budget = adzuna.CallBudget(limit=10, ledger_file=ledger, monthly_limit=3)
+    assert [budget.take() for _ in range(3)] == [True, True, False]
+    assert budget.used == 2
+
+def test_ledger_keeps_twelve_months(tmp_path, clock):
+    ledger = str(tmp_path / "adzuna_quota.json")
+    with open(ledger, 'w') as f:
+        json.dump({f"2025-{month:02d}": 250 for month in range(1, 13)}, f)
+
+    adzuna.CallBudget(ledger_file=ledger, monthly_limit=250).take()
+
+    with open(ledger) as f:
+        months = json.load(f)
+    assert len(months) == 12
+    assert '2025-01' not in months and months['2026-01'] == 1
+
+def test_reserve_switches_to_cached_answers(tmp_path, clock, monkeypatch):
+    calls = []
+
+    class Response:
+        status_code = 200
+
+        def json(self):
+            return {'results': [{'title': "Learning Designer", 'redirect_url': "https://example.com/1"}]}
+
+    class Session:
+        def get(self, url, params, timeout):
+            calls.append(url)
+            return Response()
+
+    monkeypatch.setattr(adzuna, 'get_session', Session)
+    monkeypatch.setattr(config, 'ADZUNA_APP_ID', 'id')
+    monkeypatch.setattr(config, 'ADZUNA_APP_KEY', 'key')
+    cache = adzuna.ResponseCache(str(tmp_path / "adzuna_cache.json"), ttl_hours=20)
+    budget = adzuna.CallBudget(ledger_file=str(tmp_path / "adzuna_quota.json"), monthly_limit=5, reserve=2)
+
+    results, _ = adzuna.fetch_results("learning designer", budget=budget, cache=cache)
+    assert len(results) == 1 and len(calls) == 1
+    for entry in cache.entries.values():
+        entry['fetched'] -= 2 * 86400  # Past the TTL
+
+    # Plenty left: a stale answer is refreshed
+    budget.take()
+    assert not budget.near_limit()
+    adzuna.fetch_results("learning designer", budget=budget, cache=cache)
+    assert len(calls) == 2 and budget.month_used() == 3
+
+    for entry in cache.entries.values():
+        entry['fetched'] -= 2 * 86400
+    # Only the reserve left: the stale answer is used and no call is spent
+    assert budget.near_limit()
+    results, fetched = adzuna.fetch_results("learning designer", budget=budget, cache=cache)
+    assert len(results) == 1 and fetched < time.time() - 86400
+    assert len(calls) == 2 and budget.month_used() == 3
+
+    # A query with nothing cached may still dip into the reserve
+    adzuna.fetch_results("instructional designer", budget=budget, cache=cache)
+    assert len(calls) == 3 and budget.month_used() == 4
@@ -0,0 +1,62 @@
+# tests/test_ai_cache.py
+# AnalysisCache keys, invalidation, TTL and LRU eviction
+
+from ai_cache import AnalysisCache
+
+def make_job(i, description='Design courses'):
+    return {'title': f"Learning Designer {i}", 'company': 'Coursera', 'description': description}
+
+def analysis(score):
+    return {'is_match': score >= 5, 'score': score, 'reasoning': 'test', 'role_category': 'other'}
+
+def saved_cache(cache_file, model='gemini-a', profile='profile v1', jobs=3):
+    cache = AnalysisCache(cache_file, model, profile)
+    for i in range(jobs):
+        cache.put(make_job(i), analysis(i))
+    cache.save()
+    return cache
+
+def test_hit_survives_a_reload(tmp_path):
+    cache_file = str(tmp_path / "ai_cache.json")
+    saved_cache(cache_file)
+
+    cache = AnalysisCache(cache_file, 'gemini-a', 'profile v1')
+
+    assert cache.get(make_job(1))['score'] == 1
+    assert cache.get(make_job(1, description='Edited posting')) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_profile_or_model_change_invalidates_entries(tmp_path):
+    cache_file = str(tmp_path / "ai_cache.json")
+    saved_cache(cache_file)
+
+    for model, profile in (('gemini-b', 'profile v1'), ('gemini-a', 'profile v2')):
+        cache = AnalysisCache(cache_file, model, profile)
+        assert cache.entries == {}
+        assert cache.get(make_job(1)) is None
+
+def test_expired_entries_are_dropped(tmp_path, monkeypatch):
+    cache_file = str(tmp_path / "ai_cache.json")
+    cache = saved_cache(cache_file)
+    now = cache.entries[cache.key_for(make_job(0))]['created']
+
+    monkeypatch.setattr('ai_cache.time.time', lambda: now + 31 * 86400)
+
+    assert cache.get(make_job(0)) is None
+    assert AnalysisCache(cache_file, 'gemini-a', 'profile v1', ttl_days=30).entries == {}
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    cache_file = str(tmp_path / "ai_cache.json")
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr('ai_cache.time.time', lambda: next(clock))
+    cache = AnalysisCache(cache_file, 'gemini-a', 'profile v1', max_entries=2)
+    for i in range(3):
+        cache.put(make_job(i), analysis(i))
+    cache.get(make_job(0))  # Job 1 is now the least recently used
+
+    cache.save()
+
+    reloaded = AnalysisCache(cache_file, 'gemini-a', 'profile v1', max_entries=2)
+    assert reloaded.get(make_job(0)) is not None
+    assert reloaded.get(make_job(1)) is None
+    assert reloaded.get(make_job(2)) is not None
@@ -0,0 +1,181 @@
+# tests/test_ai_filter.py
+# Batch scoring, rate-limit backoff and the compiled keyword matcher
+
+import json
+import re
+
+import pytest
+
+import ai_filter
+import config
+from database import get_job_id
+
+def make_job(i):
+    return {'title': f"Learning Designer {i}", 'company': 'Coursera', 'location': 'Remote',
+            'description': 'Design courses for students'}
+
+class FakeGemini:
+    """
+    Stands in for genai.GenerativeModel. Scores job i as i, answers batches
+    in reverse order, and leaves the job_ids in `missing` out of batches.
+    """
+
+    def __init__(self, missing=(), garbled=False):
+        self.missing = set(missing)
+        self.garbled = garbled
+        self.prompts = []
+
+    def __call__(self, model_name):
+        return self
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        job_ids = re.findall(r"job_id=(\w+)", prompt)
+        if not job_ids:
+            # Single-job prompt
+            score = int(re.search(r"Title: Learning Designer (\d+)", prompt).group(1))
+            return type('Response', (), {'text': json.dumps(self.analysis(score))})()
+        if self.garbled:
+            return type('Response', (), {'text': "Sure! Here are the scores: [{"})()
+
+        by_id = {get_job_id(make_job(i)): i for i in range(20)}
+        results = [dict(self.analysis(by_id[job_id]), job_id=job_id)
+                   for job_id in reversed(job_ids) if job_id not in self.missing]
+        return type('Response', (), {'text': "```json\n" + json.dumps(results) + "\n```"})()
+
+    @staticmethod
+    def analysis(score):
+        return {'is_match': score >= 5, 'score': score, 'reasoning': 'test', 'role_category': 'learning_design'}
+
+@pytest.fixture
+def gemini(monkeypatch):
+    monkeypatch.setattr(config, 'GOOGLE_AI_KEY', 'test-key')
+
+    def install(**kwargs):
+        fake = FakeGemini(**kwargs)
+        monkeypatch.setattr(ai_filter.genai, 'GenerativeModel', fake)
+        return fake
+
+    return install
+
+def test_batch_answers_are_matched_back_by_job_id(gemini):
+    fake = gemini()
+    jobs = [make_job(i) for i in range(4)]
+
+    analyses = ai_filter.score_batch(jobs)
+
+    assert [analysis['score'] for analysis in analyses] == [0, 1, 2, 3]
+    assert all('job_id' not in analysis and not analysis.get('fallback') for analysis in analyses)
+    assert len(fake.prompts) == 1
+
+def test_batch_missing_a_job_is_split_until_every_job_is_scored(gemini):
+    fake = gemini(missing={get_job_id(make_job(2))})
+    jobs = [make_job(i) for i in range(4)]
+
+    analyses = ai_filter.score_batch(jobs)
+
+    assert [analysis['score'] for analysis in analyses] == [0, 1, 2, 3]
+    assert not any(analysis.get('fallback') for analysis in analyses)
+    # Whole batch, both halves, then jobs 2 and 3 on their own
+    assert len(fake.prompts) == 5
+
+def test_unparseable_batch_falls_back_to_single_prompts(gemini):
+    fake = gemini(garbled=True)
+    jobs = [make_job(i) for i in range(2)]
+
+    analyses = ai_filter.score_batch(jobs)
+
+    assert [analysis['score'] for analysis in analyses] == [0, 1]
+    assert len(fake.prompts) == 3
+
+def test_aimd_limiter_halves_on_rate_limit_and_creeps_back():
+    limiter = ai_filter.AIMDLimiter(8, initial_limit=8)
+
+    limiter.on_rate_limit()
+    limiter.on_rate_limit()
+    assert limiter.limit == 2
+
+    # About one step up per window of successes
+    for _ in range(2):
+        limiter.on_success()
+    assert int(limiter.limit) == 2
+    limiter.on_success()
+    assert int(limiter.limit) == 3
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+    for _ in range(10):
+        limiter.on_rate_limit()
+    assert limiter.limit == 1
+
+def test_score_with_retries_backs_off_then_falls_back(monkeypatch):
+    monkeypatch.setattr(ai_filter.time, 'sleep', lambda seconds: None)
+    calls = []
+
+    def throttled(batch, raise_on_rate_limit=False):
+        calls.append(len(batch))
+        raise RuntimeError("429 Resource has been exhausted")
+
+    monkeypatch.setattr(ai_filter, 'score_batch', throttled)
+    limiter = ai_filter.AIMDLimiter(4, initial_limit=4)
+
+    analyses = ai_filter.score_with_retries([make_job(1)], limiter, max_retries=2)
+
+    assert len(calls) == 3
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+    assert analyses[0]['fallback']
+
+def test_score_with_retries_recovers_after_a_rate_limit(monkeypatch):
+    monkeypatch.setattr(ai_filter.time, 'sleep', lambda seconds: None)
+    answers = [RuntimeError("429 Too Many Requests"), [FakeGemini.analysis(7)]]
+
+    def flaky(batch, raise_on_rate_limit=False):
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    monkeypatch.setattr(ai_filter, 'score_batch', flaky)
+    limiter = ai_filter.AIMDLimiter(4, initial_limit=4)
+
+    analyses = ai_filter.score_with_retries([make_job(7)], limiter)
+
+    assert analyses[0]['score'] == 7
+    assert limiter.limit == 2.5
+
+MATCHER_CASES = [
+    {'title': 'Learning Designer', 'description': 'Curriculum for university students, AI and equity'},
+    # Overlapping keywords: "learning design" / "learning designer", "research" / "user research"
+    {'title': 'UX Researcher', 'description': 'user researcher, learning designer, evidence'},
+    # "ai" inside other words still counts, as it does for the substring check
+    {'title': 'Trainer', 'description': 'Maintain training for schools'},
+    # Exclusions only apply to the title
+    {'title': 'Senior Software Engineer, Learning Platform', 'description': 'edtech'},
+    {'title': 'Learning Designer', 'description': 'Work with a Software Engineer'},
+    # Keyword split between title and description doesn't match either
+    {'title': 'Instructional', 'description': 'design for teaching'},
+    {'title': 'LEARNING EXPERIENCE DESIGNER'},
+    {},
+]
+
+@pytest.mark.parametrize('job', MATCHER_CASES)
+def test_keyword_matcher_agrees_with_fallback_keyword_match(job):
+    assert ai_filter.KeywordMatcher().match(job) == ai_filter.fallback_keyword_match(job)
+
+def test_prefilter_decides_excluded_and_weak_jobs_without_the_ai():
+    jobs = [
+        MATCHER_CASES[0],                                            # keyword score 9
+        MATCHER_CASES[1],                                            # 8
+        {'title': 'Gym Trainer', 'description': 'Maintain equipment'},  # 1
+        MATCHER_CASES[3],                                            # excluded
+    ]
+
+    to_score, decided = ai_filter.prefilter_jobs(jobs, reject_below=3, accept_at=9)
+
+    assert to_score == [jobs[1]]
+    assert sorted(decided) == [0, 2, 3]
+    assert decided[0]['is_match']
+    assert decided[3]['role_category'] == 'excluded'
@@ -0,0 +1,105 @@
+# tests/test_alerter.py
+# AlertDispatcher against a local fake SendGrid endpoint (config.SENDGRID_HOST)
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import config
+from alerter import AlertDispatcher
+
+class FakeSendGridHandler(BaseHTTPRequestHandler):
+    """POST /v3/mail/send answering with the scripted statuses, then 202."""
+
+    protocol_version = 'HTTP/1.1'
+    lock = threading.Lock()
+    statuses = []
+    requests_seen = 0
+    messages = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        cls = type(self)
+        with cls.lock:
+            cls.requests_seen += 1
+            status = cls.statuses.pop(0) if cls.statuses else 202
+            if status == 202 and self.path == '/v3/mail/send' and self.headers.get('Authorization'):
+                cls.messages.append(json.loads(body))
+
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def sendgrid(monkeypatch):
+    FakeSendGridHandler.statuses = []
+    FakeSendGridHandler.requests_seen = 0
+    FakeSendGridHandler.messages = []
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSendGridHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(config, 'SENDGRID_HOST', f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(config, 'EMAIL_TO', 'me@example.com')
+    yield FakeSendGridHandler
+    server.shutdown()
+    server.server_close()
+
+def make_job(i):
+    return {'title': f"Learning Designer {i}", 'company': 'Coursera', 'location': 'Remote',
+            'url': f"https://example.com/{i}", 'source': 'Greenhouse',
+            'ai_analysis': {'score': 9, 'reasoning': 'Strong match', 'role_category': 'learning_design'}}
+
+def dispatcher(**kwargs):
+    return AlertDispatcher(api_key='test-key', backoff=0, **kwargs)
+
+@pytest.mark.parametrize('statuses', [[429], [503, 500]])
+def test_throttling_and_server_errors_are_retried(sendgrid, statuses):
+    sendgrid.statuses = list(statuses)
+
+    with dispatcher() as alerts:
+        alerts.enqueue(make_job(1))
+        sent = alerts.flush()
+
+    assert sent == 1
+    assert sendgrid.requests_seen == len(statuses) + 1
+    assert len(sendgrid.messages) == 1
+
+def test_gives_up_after_the_last_retry(sendgrid):
+    sendgrid.statuses = [503] * 10
+
+    with dispatcher(max_retries=2) as alerts:
+        alerts.enqueue(make_job(1))
+        sent = alerts.flush()
+
+    assert sent == 0
+    assert sendgrid.requests_seen == 3
+    assert sendgrid.messages == []
+
+def test_batch_mode_sends_one_email(sendgrid):
+    with dispatcher(batch=True) as alerts:
+        for i in range(3):
+            alerts.enqueue(make_job(i))
+        sent = alerts.flush()
+
+    assert sent == 1
+    assert len(sendgrid.messages) == 1
+    body = sendgrid.messages[0]['content'][0]['value']
+    assert all(f"Learning Designer {i}" in body for i in range(3))
+
+def test_flush_does_not_raise_when_an_alert_fails(sendgrid):
+    sendgrid.statuses = [400]
+    broken = make_job(2)
+    del broken['url']  # Rendering this one fails in the worker
+
+    with dispatcher(max_workers=1) as alerts:
+        for job in (make_job(1), broken, make_job(3)):
+            alerts.enqueue(job)
+        sent = alerts.flush()
+
+    assert sent == 1
+    assert len(sendgrid.messages) == 1
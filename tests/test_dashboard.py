@@ -0,0 +1,83 @@
+# tests/test_dashboard.py
+# Facet bitsets the dashboard filters with
+
+import base64
+import json
+import random
+import shutil
+import subprocess
+
+import pytest
+
+from dashboard_generator import FACET_SCRIPT, FACET_VALUES, facet_index
+
+def decode(bitset, total):
+    """Bit i (little-endian within each byte) -> job i, as the page's Facets class reads it."""
+    data = base64.b64decode(bitset)
+    return [bool(data[i // 8] >> (i % 8) & 1) for i in range(total)]
+
+def random_jobs(count, seed=0):
+    rng = random.Random(seed)
+    jobs = [{'match_score': rng.randint(0, 10),
+             'location': rng.choice(['Remote USA', 'Singapore', 'Dubai, UAE', 'London']),
+             'source': rng.choice(['Greenhouse', 'Adzuna'])} for _ in range(count)]
+    jobs.append({})  # Missing fields read as score 0, 'Unknown'
+    buckets = [rng.choice(['today', 'week', 'old']) for _ in jobs]
+    return jobs, buckets
+
+def test_bitsets_follow_the_filter_rules():
+    # 38 jobs: a partial last byte and more than one 32-bit word
+    jobs, buckets = random_jobs(37)
+
+    bitsets, counts = facet_index(jobs, buckets)
+
+    expected = {
+        'date': {'today': [bucket == 'today' for bucket in buckets],
+                 'week': [bucket != 'old' for bucket in buckets]},
+        'score': {value: [job.get('match_score', 0) >= int(value) for job in jobs]
+                  for value in FACET_VALUES['score']},
+        'location': {value: [value in job.get('location', 'Unknown').lower() for job in jobs]
+                     for value in FACET_VALUES['location']},
+        'source': {value: [value in job.get('source', 'Unknown').lower() for job in jobs]
+                   for value in FACET_VALUES['source']},
+    }
+    for facet, values in expected.items():
+        for value, matches in values.items():
+            assert decode(bitsets[facet][value], len(jobs)) == matches, (facet, value)
+            assert counts[facet][value] == sum(matches), (facet, value)
+
+def test_bitsets_are_padded_to_whole_bytes():
+    jobs, buckets = random_jobs(8)
+
+    bitsets, _ = facet_index(jobs, buckets)
+
+    assert all(len(base64.b64decode(bitset)) == 2 for values in bitsets.values() for bitset in values.values())
+
+def test_no_jobs():
+    bitsets, counts = facet_index([], [])
+
+    assert bitsets['score']['9'] == ''
+    assert counts['source']['adzuna'] == 0
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="needs node to run the page's script")
+def test_page_script_decodes_the_bitsets():
+    jobs, buckets = random_jobs(70)
+    bitsets, _ = facet_index(jobs, buckets)
+    filters = [
+        {'date': 'all', 'score': 'all', 'location': 'all', 'source': 'all'},
+        {'date': 'week', 'score': '7', 'location': 'all', 'source': 'all'},
+        {'date': 'all', 'score': '6', 'location': 'singapore', 'source': 'adzuna'},
+        {'date': 'applied', 'score': 'all', 'location': 'usa', 'source': 'all'},
+    ]
+    script = FACET_SCRIPT + f"""
+        const facets = new Facets({json.dumps(bitsets)}, {len(jobs)});
+        console.log(JSON.stringify({json.dumps(filters)}.map(f => facets.matching(f))));
+    """
+
+    result = json.loads(subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True).stdout)
+
+    for active, positions in zip(filters, result):
+        expected = [i for i in range(len(jobs))
+                    if all(decode(bitsets[facet][value], len(jobs))[i]
+                           for facet, value in active.items() if value in bitsets.get(facet, {}))]
+        assert positions == expected, active
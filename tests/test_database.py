@@ -0,0 +1,96 @@
+# tests/test_database.py
+# Start-of-run database setup and crash safety of the JSON log
+
+import json
+from datetime import datetime, timedelta
+
+from database import (
+    get_job_id, open_seen_database, filter_new_jobs, save_new_jobs, load_seen_jobs, load_seen_job_ids,
+    get_log_file, load_seen_records,
+)
+
+def make_job(i, days_old=0):
+    job = {'title': f"Learning Designer {i}", 'company': 'Coursera', 'location': 'Remote',
+           'url': f"https://example.com/{i}"}
+    job['job_id'] = get_job_id(job)
+    job['first_seen'] = (datetime.now() - timedelta(days=days_old)).isoformat()
+    return job
+
+def write_legacy_database(database_file, jobs):
+    """A jobs_seen.json as older versions wrote it: one pretty-printed object."""
+    with open(database_file, 'w') as f:
+        json.dump({job['job_id']: job for job in jobs}, f, indent=2)
+
+def test_startup_against_existing_json_database(tmp_path):
+    database_file = str(tmp_path / "jobs_seen.json")
+    jobs = [make_job(i) for i in range(5)]
+    write_legacy_database(database_file, jobs)
+
+    seen_jobs = open_seen_database(database_file)
+
+    assert len(seen_jobs) == 5
+    fresh = make_job(99)
+    assert filter_new_jobs(jobs + [fresh], seen_jobs, {}) == [fresh]
+
+def test_startup_after_prune_and_crashed_run(tmp_path):
+    database_file = str(tmp_path / "jobs_seen.json")
+    kept, stale, logged = make_job(1), make_job(2, days_old=120), make_job(3)
+    write_legacy_database(database_file, [kept, stale])
+    # The last run committed a batch to the log, then crashed
+    with open(get_log_file(database_file), 'w') as f:
+        f.write(json.dumps({'jobs': [logged]}) + "\n")
+
+    seen_jobs = open_seen_database(database_file, days_to_keep=90)
+
+    assert seen_jobs == {kept['job_id'], logged['job_id']}
+    assert filter_new_jobs([kept, stale, logged], seen_jobs, {}) == [stale]
+
+def test_startup_against_sqlite_database(tmp_path):
+    database_file = str(tmp_path / "jobs_seen.db")
+    jobs = [make_job(i) for i in range(3)]
+    write_legacy_database(str(tmp_path / "jobs_seen.json"), jobs)
+
+    seen_jobs = open_seen_database(database_file)
+
+    assert len(seen_jobs) == 3
+    assert filter_new_jobs(jobs, seen_jobs, {}) == []
+    seen_jobs.close()
+
+def test_batch_after_torn_log_write_survives_reload(tmp_path):
+    database_file = str(tmp_path / "jobs_seen.json")
+    first, torn, second = make_job(1), make_job(2), make_job(3)
+    save_new_jobs([first], set(), database_file)
+
+    # A run crashed halfway through appending its batch
+    line = json.dumps({'jobs': [torn]})
+    with open(get_log_file(database_file), 'a') as f:
+        f.write(line[:len(line) // 2])
+
+    save_new_jobs([second], set(), database_file)
+
+    assert set(load_seen_jobs(database_file)) == {first['job_id'], second['job_id']}
+    assert load_seen_job_ids(database_file) == {first['job_id'], second['job_id']}
+
+def test_sqlite_migration_of_entries_without_job_id(tmp_path):
+    jobs = [make_job(i) for i in range(3)]
+    legacy = {job['job_id']: {key: value for key, value in job.items() if key != 'job_id'} for job in jobs}
+    with open(tmp_path / "jobs_seen.json", 'w') as f:
+        json.dump(legacy, f, indent=2)
+
+    store = load_seen_jobs(str(tmp_path / "jobs_seen.db"))
+
+    assert set(store) == set(legacy)
+    assert store[jobs[0]['job_id']]['title'] == jobs[0]['title']
+    store.close()
+
+def test_json_entries_without_job_id_survive_compaction(tmp_path):
+    database_file = str(tmp_path / "jobs_seen.json")
+    jobs = [make_job(i) for i in range(3)] + [make_job(3, days_old=120)]
+    with open(database_file, 'w') as f:
+        json.dump({job['job_id']: {key: value for key, value in job.items() if key != 'job_id'}
+                   for job in jobs}, f, indent=2)
+
+    # Pruning the old entry forces a snapshot rewrite
+    open_seen_database(database_file, days_to_keep=90)
+
+    assert set(load_seen_records(database_file)) == {job['job_id'] for job in jobs[:3]}
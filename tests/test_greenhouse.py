@@ -0,0 +1,36 @@
+# tests/test_greenhouse.py
+# BoardSchedule change detection
+
+from datetime import date, timedelta
+
+from scrapers.greenhouse import BoardSchedule
+
+def api_job(i, updated_at="2026-01-01T00:00:00Z"):
+    """A posting as scrape_greenhouse_api returns it."""
+    return {'title': f"Learning Designer {i}", 'url': f"https://job-boards.greenhouse.io/acme/jobs/{i}",
+            'location': 'Remote', 'company_slug': 'acme', 'department': 'Education',
+            'source': 'Greenhouse', 'updated_at': updated_at}
+
+def html_job(i):
+    """The same posting as the HTML board fallback scrapes it."""
+    return {'title': f"Learning Designer {i}", 'url': f"https://boards.greenhouse.io/acme/jobs/{i}?gh_jid={i}",
+            'location': 'Remote', 'company_slug': 'acme', 'department': 'Education',
+            'source': 'Greenhouse'}
+
+def test_switching_between_api_and_html_is_not_a_change(tmp_path):
+    schedule = BoardSchedule(str(tmp_path / "greenhouse_schedule.json"))
+    start = date(2026, 1, 1)
+
+    for offset, jobs in enumerate([[api_job(1), api_job(2)], [html_job(2), html_job(1)], [api_job(1), api_job(2)]]):
+        schedule.record('acme', jobs, start + timedelta(days=offset))
+
+    assert schedule.boards['acme']['last_changed'] == start.isoformat()
+
+def test_new_opening_is_a_change(tmp_path):
+    schedule = BoardSchedule(str(tmp_path / "greenhouse_schedule.json"))
+    start = date(2026, 1, 1)
+
+    schedule.record('acme', [api_job(1)], start)
+    schedule.record('acme', [html_job(1), html_job(2)], start + timedelta(days=1))
+
+    assert schedule.boards['acme']['last_changed'] == (start + timedelta(days=1)).isoformat()
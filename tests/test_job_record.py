@@ -0,0 +1,51 @@
+# tests/test_job_record.py
+# JobRecord round-trips the stored job schema
+
+import pytest
+
+from database import get_job_id
+from job_record import JobRecord
+
+def stored_job():
+    job = {
+        'title': 'Learning Designer', 'company': 'Coursera', 'location': 'Remote',
+        'url': 'https://example.com/1', 'source': 'Greenhouse', 'company_slug': 'coursera',
+        'department': 'Education', 'description': 'Design courses',
+        'date_found': '2026-03-01T08:59:58.250000', 'first_seen': '2026-03-01T09:00:01.123456',
+        'match_score': 8, 'updated_at': '2026-02-27T10:00:00-05:00',
+        'ai_analysis': {'is_match': True, 'score': 8, 'reasoning': 'Strong match',
+                        'role_category': 'learning_design', 'key_strengths': ['Role type match'],
+                        'concerns': [], 'fallback': False},
+    }
+    job['job_id'] = get_job_id(job)
+    return job
+
+def test_round_trip():
+    job = stored_job()
+
+    record = JobRecord.from_dict(job)
+
+    assert record.to_dict() == job
+    assert record['first_seen'] == job['first_seen']
+    assert record.get('ai_analysis') == job['ai_analysis']
+    assert record.get('geography', 'none') == 'none'
+
+@pytest.mark.parametrize('first_seen', ['2026-03-01', '2026-03-01T09:00:00+00:00', 'yesterday'])
+def test_timestamps_that_dont_convert_back_are_kept_as_is(first_seen):
+    job = dict(stored_job(), first_seen=first_seen)
+
+    assert JobRecord.from_dict(job).to_dict() == job
+
+def test_unusual_ids_and_missing_analysis_round_trip():
+    job = {'job_id': 'legacy-1', 'title': 'Learning Designer', 'first_seen': '2026-03-01T09:00:00'}
+
+    record = JobRecord.from_dict(job)
+
+    assert record.to_dict() == job
+    assert 'ai_analysis' not in record
+
+def test_raw_html_is_dropped_unless_asked_for():
+    job = dict(stored_job(), raw_html='<div class="opening">...</div>')
+
+    assert 'raw_html' not in JobRecord.from_dict(job).to_dict()
+    assert JobRecord.from_dict(job, keep_raw_html=True).to_dict() == job
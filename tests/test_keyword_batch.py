@@ -0,0 +1,50 @@
+# tests/test_keyword_batch.py
+# fallback_keyword_match_batch must score exactly like fallback_keyword_match
+
+import random
+
+import config
+from ai_filter import BONUS_KEYWORDS, EDU_KEYWORDS, ROLE_KEYWORDS, fallback_keyword_match
+from keyword_batch import fallback_keyword_match_batch
+
+FILLER = ["senior", "lead", "team", "remote", "design", "manager", "main", "er", "ing", "the", "a", "i"]
+
+VOCABULARY = (
+    [keyword for keywords in ROLE_KEYWORDS.values() for keyword in keywords]
+    + EDU_KEYWORDS
+    + [keyword for group in BONUS_KEYWORDS for keyword in group]
+    + [keyword.lower() for keyword in config.EXCLUDE_KEYWORDS]
+    + FILLER
+)
+
+def random_text(rng, words):
+    """Random phrase; sometimes glued together to create overlapping keywords."""
+    parts = [rng.choice(VOCABULARY) for _ in range(words)]
+    separator = rng.choice([" ", " ", ""])
+    text = separator.join(parts)
+    return text.title() if rng.random() < 0.3 else text
+
+def random_jobs(count, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            'title': random_text(rng, rng.randint(0, 4)),
+            'description': random_text(rng, rng.randint(0, 60)),
+        }
+        for _ in range(count)
+    ]
+
+def test_batch_matches_scalar_on_random_jobs():
+    # Dense with keywords, often glued together, to exercise overlapping
+    # and title/description boundary matches
+    jobs = random_jobs(5000, seed=1)
+
+    batch = fallback_keyword_match_batch(jobs)
+
+    for job, analysis in zip(jobs, batch):
+        assert analysis == fallback_keyword_match(job), job
+
+def test_batch_chunks_and_edge_cases():
+    jobs = random_jobs(250, seed=2) + [{}, {'title': '', 'description': ''}, {'title': 'Ö learning designer'}]
+
+    assert fallback_keyword_match_batch(jobs, chunk_size=64) == [fallback_keyword_match(job) for job in jobs]
@@ -0,0 +1,93 @@
+# tests/test_pipeline.py
+# Failure bookkeeping of the streaming JobPipeline
+
+import threading
+
+import pipeline
+from ai_cache import AnalysisCache
+from pipeline import JobPipeline
+
+def board(slug, count):
+    return [{'title': f"Learning Designer {i}", 'company': slug.title(), 'location': 'Remote',
+             'company_slug': slug, 'url': f"https://example.com/{slug}/{i}", 'description': ''}
+            for i in range(count)]
+
+def search(geography, category, count):
+    return [{'title': f"Instructional Designer {category} {i}", 'company': 'Coursera', 'location': geography,
+             'geography': geography, 'search_category': category, 'url': f"https://example.com/{category}/{i}"}
+            for i in range(count)]
+
+def matching_scorer(jobs, limiter):
+    return [{'is_match': True, 'score': 9, 'fallback': False} for _ in jobs]
+
+def test_sources_of_dropped_chunks_are_reported(tmp_path, monkeypatch):
+    triage_jobs = pipeline.triage_jobs
+
+    def flaky_triage(jobs, *args):
+        if any(job.get('company_slug') == 'broken' or job.get('search_category') == 'Broken' for job in jobs):
+            raise RuntimeError("pre-filter blew up")
+        return triage_jobs(jobs, *args)
+
+    monkeypatch.setattr(pipeline, 'triage_jobs', flaky_triage)
+    monkeypatch.setattr(pipeline.config, 'GOOGLE_AI_KEY', None)
+
+    results = JobPipeline(set(), {}, str(tmp_path / "jobs_seen.json"), linger=0.01).run({
+        'greenhouse': [board('healthy', 2), board('broken', 3)],
+        'api_searches': [search('USA', 'Fine', 2), search('USA', 'Broken', 2)],
+    })
+
+    assert results['greenhouse'].failed == {'broken'}
+    assert results['api_searches'].failed == {('USA', 'Broken')}
+
+def test_fallback_rejections_are_not_negative_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline.config, 'GOOGLE_AI_KEY', 'test-key')
+
+    def score_with_retries(jobs, limiter):
+        # Gemini had a bad day for the second posting
+        real = {'is_match': False, 'score': 2, 'fallback': False}
+        fallback = {'is_match': False, 'score': 2, 'fallback': True}
+        return [dict(real) if '0' in job['title'] else dict(fallback) for job in jobs]
+
+    monkeypatch.setattr(pipeline, 'score_with_retries', score_with_retries)
+    rejected_jobs = {}
+    jobs = board('quiet', 2)
+
+    JobPipeline(set(), rejected_jobs, str(tmp_path / "jobs_seen.json"), linger=0.01).run({
+        'greenhouse': [jobs],
+    })
+
+    assert set(rejected_jobs) == {pipeline.get_job_id(jobs[0])}
+
+def test_matches_that_fail_to_save_are_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline.config, 'GOOGLE_AI_KEY', 'test-key')
+    monkeypatch.setattr(pipeline, 'score_with_retries', matching_scorer)
+    # The database directory can't be created, so the log append fails
+    (tmp_path / "not-a-directory").write_text("")
+    seen_jobs = set()
+
+    results = JobPipeline(seen_jobs, {}, str(tmp_path / "not-a-directory" / "jobs_seen.json"),
+                          linger=0.01).run({'greenhouse': [board('acme', 2)]})
+
+    assert results['greenhouse'].failed == {'acme'}
+    assert results['greenhouse'].matched == []
+    assert seen_jobs == set()
+
+def test_cache_error_while_scoring_does_not_stall_persist(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline.config, 'GOOGLE_AI_KEY', 'test-key')
+    monkeypatch.setattr(pipeline, 'score_with_retries', matching_scorer)
+    cache = AnalysisCache(str(tmp_path / "ai_cache.json"), 'test-model', 'profile')
+
+    def broken_put(job, analysis):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache, 'put', broken_put)
+    results = {}
+    run = threading.Thread(target=lambda: results.update(JobPipeline(
+        set(), {}, str(tmp_path / "jobs_seen.json"), cache=cache, max_in_flight=2, linger=0.01,
+    ).run({'greenhouse': [board('acme', 3)]})), daemon=True)
+
+    run.start()
+    run.join(timeout=10)
+
+    assert not run.is_alive()
+    assert len(results['greenhouse'].matched) == 3
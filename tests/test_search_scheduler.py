@@ -0,0 +1,75 @@
+# tests/test_search_scheduler.py
+# SearchScheduler.plan guarantees: check_frequency, max_query_age, one search a day
+
+from datetime import date, timedelta
+
+import pytest
+
+import config
+from search_scheduler import SearchScheduler, search_key
+
+TODAY = date(2026, 3, 10)
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'GEOGRAPHIES', {
+        'USA': {'check_frequency': 2},
+        'Singapore': {'check_frequency': 3},
+    })
+    monkeypatch.setattr(config, 'get_search_queries_for_geography',
+                        lambda geography: [(f"{geography} design", 'Design'), (f"{geography} product", 'Product')])
+    return SearchScheduler(str(tmp_path / "search_schedule.json"), max_query_age=14)
+
+def searched(scheduler, geography, category, days_ago, matched=0.0):
+    """Seed a yield record: ten days of postings per page, `matched` matches in them."""
+    scheduler.queries[search_key(geography, category)] = {
+        'searches': 3, 'calls': 1, 'new': 20, 'matched': matched, 'days': 10,
+        'last_searched': (TODAY - timedelta(days=days_ago)).isoformat(),
+    }
+
+def test_overdue_geography_gets_its_best_query(scheduler):
+    searched(scheduler, 'USA', 'Design', 1, matched=50)
+    searched(scheduler, 'USA', 'Product', 1, matched=50)
+    searched(scheduler, 'Singapore', 'Design', 3, matched=2)
+    searched(scheduler, 'Singapore', 'Product', 3, matched=0)
+
+    plan = scheduler.plan(allowance=0, today=TODAY)
+
+    assert plan == [('Singapore', "Singapore design", 'Design')]
+
+def test_geography_within_check_frequency_waits_for_allowance(scheduler):
+    searched(scheduler, 'USA', 'Design', 1, matched=50)
+    searched(scheduler, 'USA', 'Product', 1, matched=50)
+    searched(scheduler, 'Singapore', 'Design', 2, matched=2)
+    searched(scheduler, 'Singapore', 'Product', 2, matched=0)
+
+    assert scheduler.plan(allowance=0, today=TODAY) == []
+    # With calls to spend the high-yield USA queries win
+    assert [geography for geography, _, _ in scheduler.plan(allowance=2, today=TODAY)] == ['USA', 'USA']
+
+def test_query_past_max_query_age_is_searched(scheduler):
+    searched(scheduler, 'USA', 'Design', 1, matched=50)
+    searched(scheduler, 'USA', 'Product', 14)
+    searched(scheduler, 'Singapore', 'Design', 1, matched=50)
+    searched(scheduler, 'Singapore', 'Product', 13)
+
+    plan = scheduler.plan(allowance=0, today=TODAY)
+
+    assert plan == [('USA', "USA product", 'Product')]
+
+def test_query_searched_today_is_skipped(scheduler):
+    searched(scheduler, 'USA', 'Design', 0, matched=500)
+    searched(scheduler, 'USA', 'Product', 5)
+    searched(scheduler, 'Singapore', 'Design', 0, matched=500)
+    searched(scheduler, 'Singapore', 'Product', 0)
+
+    plan = scheduler.plan(allowance=100, today=TODAY)
+
+    assert plan == [('USA', "USA product", 'Product')]
+
+def test_unsearched_queries_are_tried_within_the_allowance(scheduler):
+    plan = scheduler.plan(allowance=3, today=TODAY)
+
+    # Both geographies are due; a first search costs one call
+    assert len(plan) == 3
+    assert {geography for geography, _, _ in plan} == {'USA', 'Singapore'}